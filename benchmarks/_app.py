@@ -0,0 +1,36 @@
+"""Application bootstrap shared by the benchmarks and the test suite."""
+import os
+
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kw):
+    # SQLite only autoincrements INTEGER PRIMARY KEY columns
+    return "INTEGER"
+
+
+def create_app_for(database_url: str):
+    """Create the application bound to the given database.
+
+    DATABASE_URL is only overridden while the app is created, so the
+    caller's environment is left as it was.
+
+    Args:
+        database_url: SQLAlchemy URL of the database to use.
+
+    Returns:
+        Flask application instance.
+    """
+    from main import create_app
+
+    previous_url = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = database_url
+    try:
+        return create_app()
+    finally:
+        if previous_url is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = previous_url
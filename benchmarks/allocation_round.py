@@ -0,0 +1,222 @@
+"""Allocation round benchmark: a statewide round of 50k applicants.
+
+Two measurements:
+
+    solver  The pure numpy solve (compaction, lottery keys, deferred
+            acceptance) on a random instance of the same shape, no database.
+    round   A whole run through AllocationService.run_round against a
+            database: loading the arrays, solving, filling classes and the
+            bulk write-back of enrollments, classes and seat summaries.
+
+The round also checks that no class went over capacity and that the seat
+summaries still match the classes.
+
+Usage:
+    python -m benchmarks.allocation_round
+    python -m benchmarks.allocation_round --database-url sqlite:////tmp/round.db
+
+Every table of the target database is dropped and recreated: never point
+it at real data.
+"""
+import argparse
+import json
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from benchmarks._app import create_app_for
+from src.services.allocation_solver import (
+    compact_preferences,
+    deferred_acceptance,
+    priority_keys,
+)
+
+
+def run_solver(
+    applicants: int = 50_000, schools: int = 500, choices: int = 5, seed: int = 1
+) -> Dict[str, Any]:
+    """Time the solver alone on a random instance.
+
+    Args:
+        applicants: Number of applicants.
+        schools: Number of programs (schools with free seats).
+        choices: Preferences per applicant.
+        seed: Seed of the instance and of the lottery.
+
+    Returns:
+        Dictionary with the instance size, seconds and applicants assigned.
+    """
+    rng = np.random.default_rng(seed)
+    # Popular schools are picked more often, as in real rounds
+    popularity = rng.pareto(1.5, size=schools) + 1
+    preferences = np.empty((applicants, choices), dtype=np.int64)
+    for row in range(applicants):
+        preferences[row] = rng.choice(
+            schools, size=choices, replace=False, p=popularity / popularity.sum()
+        )
+    points = rng.integers(0, 100, size=preferences.shape)
+    capacities = np.full(schools, int(applicants * 0.8) // schools, dtype=np.int64)
+
+    started = time.perf_counter()
+    compacted, points = compact_preferences(preferences, points)
+    keys = priority_keys(points, seed)
+    assigned, _ = deferred_acceptance(compacted, keys, capacities)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "applicants": applicants,
+        "schools": schools,
+        "choices": choices,
+        "seconds": round(elapsed, 3),
+        "assigned": int((assigned >= 0).sum()),
+    }
+
+
+def run_round(
+    database_url: str,
+    applicants: int = 50_000,
+    schools: int = 500,
+    classes_per_school: int = 2,
+    choices: int = 5,
+    seed: int = 1,
+) -> Dict[str, Any]:
+    """Seed a throwaway database and time a whole allocation round.
+
+    Args:
+        database_url: SQLAlchemy URL of a database that may be wiped.
+        applicants: Number of applicants.
+        schools: Number of schools.
+        classes_per_school: First-year classes per school.
+        choices: Preferences per applicant.
+        seed: Seed of the data and of the lottery.
+
+    Returns:
+        Dictionary with seconds, assigned/unassigned counts and the
+        over_capacity/consistent checks.
+    """
+    app = create_app_for(database_url)
+
+    from src.config.db_config import db
+    from src.domain.enums.class_grade import ClassGrade
+    from src.domain.enums.school_type import SchoolType
+    from src.models.school import School
+    from src.models.school_class import SchoolClass
+    from src.models.seat_summary import SeatSummary
+    from src.repositories.allocation_repository import AllocationRepository
+    from src.repositories.school_class_repository import SchoolClassRepository
+    from src.services.allocation_service import AllocationService
+
+    rng = np.random.default_rng(seed)
+    capacity = max(1, int(applicants * 0.8) // (schools * classes_per_school))
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        db.session.execute(
+            School.__table__.insert(),
+            [
+                {
+                    "name": f"Escola {number:05d}",
+                    "address_city": "Porto Alegre",
+                    "address_state": "RS",
+                    "school_type": SchoolType.ESTADUAL,
+                }
+                for number in range(schools)
+            ],
+        )
+        db.session.commit()
+        school_ids = [school_id for (school_id,) in db.session.query(School.id)]
+        for school_id in school_ids:
+            for _ in range(classes_per_school):
+                SchoolClassRepository.create_class(
+                    school_id, ClassGrade.FISRT_YEAR, capacity
+                )
+
+        round_id = AllocationRepository.create_round("Benchmark", ClassGrade.FISRT_YEAR)
+        popularity = rng.pareto(1.5, size=len(school_ids)) + 1
+        for start in range(0, applicants, 5000):
+            AllocationRepository.add_applicants(
+                round_id,
+                [
+                    {
+                        "student_name": f"Aluno {number}",
+                        "priority": int(rng.integers(0, 100)),
+                        "preferences": [
+                            {"school_id": school_ids[index], "bonus": 0}
+                            for index in rng.choice(
+                                len(school_ids),
+                                size=choices,
+                                replace=False,
+                                p=popularity / popularity.sum(),
+                            )
+                        ],
+                    }
+                    for number in range(start, min(start + 5000, applicants))
+                ],
+            )
+
+        started_at = AllocationRepository.claim_round(
+            round_id, seed, timedelta(minutes=15)
+        )
+        began = time.perf_counter()
+        enrolled = AllocationService.run_round(round_id, started_at)
+        elapsed = time.perf_counter() - began
+
+        over_capacity = (
+            db.session.query(SchoolClass)
+            .filter(SchoolClass.enrolled > SchoolClass.capacity)
+            .count()
+        )
+        class_totals = dict(
+            db.session.query(SchoolClass.school_id, db.func.sum(SchoolClass.enrolled))
+            .group_by(SchoolClass.school_id)
+            .all()
+        )
+        summary_totals = dict(
+            db.session.query(SeatSummary.school_id, SeatSummary.enrolled).all()
+        )
+        db.session.remove()
+
+    return {
+        "dialect": database_url.split(":", 1)[0],
+        "applicants": applicants,
+        "seats": capacity * schools * classes_per_school,
+        "seconds": round(elapsed, 3),
+        "assigned": enrolled,
+        "unassigned": applicants - enrolled,
+        "over_capacity": over_capacity,
+        "consistent": class_totals == summary_totals,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url", help="Also run a whole round against this database"
+    )
+    parser.add_argument("--applicants", type=int, default=50_000)
+    parser.add_argument("--schools", type=int, default=500)
+    parser.add_argument("--choices", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    result: Dict[str, Optional[Dict[str, Any]]] = {
+        "solver": run_solver(args.applicants, args.schools, args.choices, args.seed),
+        "round": None,
+    }
+    if args.database_url:
+        result["round"] = run_round(
+            args.database_url,
+            applicants=args.applicants,
+            schools=args.schools,
+            choices=args.choices,
+            seed=args.seed,
+        )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
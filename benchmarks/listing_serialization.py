@@ -0,0 +1,160 @@
+"""Per-row cost of serializing school listing pages.
+
+Times and traces the three ways a page of schools can be turned into JSON:
+
+    entities    School ORM entities, School.to_dict, Flask's default provider
+    projection  SCHOOL_COLUMNS rows, serialize_school_row, default provider
+    orjson      SCHOOL_COLUMNS rows, serialize_school_row, OrjsonProvider
+
+Each variant loads and serializes the same pages (query included, as in
+GET /api/schools) and reports CPU microseconds and peak traced allocation
+bytes per row.
+
+Usage:
+    python -m benchmarks.listing_serialization --database-url sqlite:////tmp/list.db
+
+Every table of the target database is dropped and recreated: never point
+it at real data.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from flask.json.provider import DefaultJSONProvider
+
+from benchmarks._app import create_app_for
+
+
+def _measure(render: Callable[[int], str], pages: int, per_page: int) -> Dict[str, float]:
+    render(0)  # warm up statement caches and mappers
+
+    rows = pages * per_page
+    started = time.process_time()
+    for page in range(pages):
+        render(page)
+    cpu = time.process_time() - started
+
+    tracemalloc.start()
+    try:
+        render(0)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cpu_us_per_row": round(cpu / rows * 1_000_000, 2),
+        "peak_bytes_per_row": round(peak / per_page),
+    }
+
+
+def run(
+    database_url: str, schools: int = 2000, pages: int = 20, per_page: int = 100
+) -> Dict[str, Any]:
+    """Run the benchmark against a throwaway database.
+
+    Args:
+        database_url: SQLAlchemy URL of a database that may be wiped.
+        schools: Schools seeded before measuring.
+        pages: Pages serialized per variant.
+        per_page: Rows per page (the listings allow at most 100).
+
+    Returns:
+        Dictionary with the per-row cost of each variant ("orjson" is None
+        when orjson is not installed).
+    """
+    app = create_app_for(database_url)
+
+    from src.config.db_config import db
+    from src.domain.enums.school_type import SchoolType
+    from src.models.school import School
+    from src.repositories.school_repository import SCHOOL_COLUMNS
+    from src.utils.json_provider import OrjsonProvider, orjson
+    from src.utils.serializers import serialize_school_row
+
+    pages = max(1, min(pages, schools // per_page))
+    results: Dict[str, Any] = {"rows_per_page": per_page, "pages": pages}
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.execute(
+            School.__table__.insert(),
+            [
+                {
+                    "name": f"Escola {number:06d}",
+                    "address_street": "Rua das Flores",
+                    "address_number": str(number),
+                    "address_neighborhood": "Centro",
+                    "address_city": "Porto Alegre",
+                    "address_state": "RS",
+                    "address_zip_code": "90000-000",
+                    "school_type": SchoolType.ESTADUAL,
+                }
+                for number in range(schools)
+            ],
+        )
+        db.session.commit()
+
+        default_provider = DefaultJSONProvider(app)
+
+        def entities(page: int) -> str:
+            rows = (
+                School.query.order_by(School.name, School.id)
+                .offset(page * per_page)
+                .limit(per_page)
+                .all()
+            )
+            payload = default_provider.dumps([school.to_dict() for school in rows])
+            db.session.expunge_all()
+            return payload
+
+        def projection(provider) -> Callable[[int], str]:
+            def render(page: int) -> str:
+                rows = (
+                    db.session.query(*SCHOOL_COLUMNS)
+                    .order_by(School.name, School.id)
+                    .offset(page * per_page)
+                    .limit(per_page)
+                    .all()
+                )
+                return provider.dumps([serialize_school_row(row) for row in rows])
+
+            return render
+
+        variants: Dict[str, Callable[[int], str]] = {
+            "entities": entities,
+            "projection": projection(default_provider),
+        }
+        if orjson is not None:
+            variants["orjson"] = projection(OrjsonProvider(app))
+
+        payloads: List[Any] = [json.loads(render(1)) for render in variants.values()]
+        results["same_payload"] = all(payload == payloads[0] for payload in payloads)
+
+        for name, render in variants.items():
+            results[name] = _measure(render, pages, per_page)
+        results.setdefault("orjson", None)
+
+        db.session.remove()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--schools", type=int, default=2000)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--per-page", type=int, default=100)
+    args = parser.parse_args()
+
+    result = run(
+        args.database_url, schools=args.schools, pages=args.pages, per_page=args.per_page
+    )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Seat hold contention benchmark.
+
+N workers hold seats of one class at the same time, like families on
+opening day. Every hold is retried once with the same reservation ID, as a
+client would after a timeout. Reports throughput and latency percentiles,
+and checks that the class was not oversold and that the class, summary and
+reservation counters agree.
+
+Usage:
+    python -m benchmarks.seat_contention --database-url sqlite:////tmp/seats.db
+    python -m benchmarks.seat_contention \\
+        --database-url postgresql://user@localhost/seats_bench --workers 32
+
+Every table of the target database is dropped and recreated: never point
+it at real data.
+"""
+import argparse
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+
+from benchmarks._app import create_app_for
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def run(
+    database_url: str, workers: int = 16, holds_per_worker: int = 20, capacity: int = 30
+) -> Dict[str, Any]:
+    """Run the benchmark against a throwaway database.
+
+    Args:
+        database_url: SQLAlchemy URL of a database that may be wiped.
+        workers: Concurrent threads, each with its own session.
+        holds_per_worker: Hold attempts per worker.
+        capacity: Seats of the contended class.
+
+    Returns:
+        Dictionary with counts, throughput, latency percentiles (ms) and
+        the oversold/consistent checks.
+    """
+    app = create_app_for(database_url)
+
+    from src.config.db_config import db
+    from src.domain.enums.class_grade import ClassGrade
+    from src.domain.enums.reservation_status import ReservationStatus
+    from src.domain.enums.school_type import SchoolType
+    from src.models.school_class import SchoolClass
+    from src.models.seat_reservation import SeatReservation
+    from src.models.seat_summary import SeatSummary
+    from src.repositories.school_class_repository import (
+        ClassFullError,
+        SchoolClassRepository,
+    )
+    from src.repositories.school_repository import SchoolRepository
+    from src.repositories.seat_reservation_repository import SeatReservationRepository
+
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            # Writers wait for the database lock instead of failing at once
+            @event.listens_for(db.engine, "connect")
+            def _busy_timeout(connection, record):
+                connection.execute("PRAGMA busy_timeout = 30000")
+
+            db.engine.dispose()
+
+        db.drop_all()
+        db.create_all()
+        school = SchoolRepository.create_school(
+            "Escola Benchmark", "Rua", "1", "Centro", "Porto Alegre", "RS",
+            "90000-000", SchoolType.ESTADUAL,
+        )
+        class_id = SchoolClassRepository.create_class(
+            school.id, ClassGrade.FISRT_YEAR, capacity
+        )
+
+    latencies: List[float] = []
+    counts = {"held": 0, "full": 0, "errors": 0}
+    lock = threading.Lock()
+    start = threading.Barrier(workers + 1)
+
+    def worker(number: int) -> None:
+        with app.app_context():
+            start.wait()
+            for attempt in range(holds_per_worker):
+                reservation_id = f"bench-{number:04d}-{attempt:05d}"
+                expires_at = datetime.utcnow() + timedelta(minutes=15)
+                began = time.perf_counter()
+                try:
+                    for _ in range(2):
+                        SeatReservationRepository.hold(
+                            class_id, reservation_id, "Aluno", expires_at
+                        )
+                    outcome = "held"
+                except ClassFullError:
+                    outcome = "full"
+                except Exception:
+                    db.session.rollback()
+                    outcome = "errors"
+                elapsed = time.perf_counter() - began
+                with lock:
+                    counts[outcome] += 1
+                    latencies.append(elapsed)
+            db.session.remove()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    with app.app_context():
+        school_class = db.session.get(SchoolClass, class_id)
+        summary_held = (
+            db.session.query(SeatSummary.held)
+            .filter(SeatSummary.school_id == school_class.school_id)
+            .scalar()
+        )
+        reservations = (
+            db.session.query(SeatReservation)
+            .filter(SeatReservation.status == ReservationStatus.HELD)
+            .count()
+        )
+        class_held = school_class.held
+        db.session.remove()
+
+    latencies.sort()
+    attempts = workers * holds_per_worker
+    return {
+        "dialect": database_url.split(":", 1)[0],
+        "workers": workers,
+        "attempts": attempts,
+        **counts,
+        "seconds": round(elapsed, 3),
+        "attempts_per_second": round(attempts / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(_percentile(latencies, 1.0) * 1000, 2),
+        "oversold": class_held > capacity or counts["held"] > capacity,
+        "consistent": class_held == counts["held"] == reservations == summary_held,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--holds-per-worker", type=int, default=20)
+    parser.add_argument("--capacity", type=int, default=30)
+    args = parser.parse_args()
+
+    result = run(
+        args.database_url,
+        workers=args.workers,
+        holds_per_worker=args.holds_per_worker,
+        capacity=args.capacity,
+    )
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
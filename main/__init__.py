@@ -1,11 +1,22 @@
 import os
+from datetime import timedelta
 
+import click
 from dotenv import load_dotenv
 from flask import Flask
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 
 from src.config.db_config import db, init_db
+from src.repositories.role_registry import role_registry
+from src.services.allocation_jobs import allocation_jobs
+from src.services.auth_context import init_auth_context
+from src.services.token_revocation import revocation_store
+from src.utils.cache import school_cache
+from src.utils.hash_pool import hash_pool
+from src.utils.json_provider import init_json_provider
+from src.utils.token_cache import token_cache
+from src.utils.password_utils import init_password_hashing
 
 load_dotenv()
 
@@ -17,11 +28,17 @@ def create_app():
     """Create and configure the Flask application.
 
     This function initializes:
-    - Flask app instance
+    - Flask app instance (with the orjson JSON provider when installed)
     - Database connection
-    - JWT authentication
+    - JWT authentication, token revocation and the per-request auth context
     - Flask-Migrate for database migrations
-    - Route blueprints (login, users)
+    - Password hashing cost calibration and bounded hashing pool
+    - School payload cache backend
+    - Background runner for allocation rounds
+    - Role registry (role names to ids and claim bits)
+    - Route blueprints (login, users, schools, school classes, vagas,
+      allocation, metrics)
+    - CLI command to release expired seat holds
 
     Returns:
         Configured Flask application instance.
@@ -29,19 +46,64 @@ def create_app():
     app = Flask(__name__)
     app.secret_key = os.getenv("SECRET_KEY")
     init_db(app)
+    init_json_provider(app)
 
     app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "your-jwt-secret-key")
-    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = False
+    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(
+        minutes=int(os.getenv("JWT_ACCESS_TOKEN_MINUTES", "15"))
+    )
+    app.config["JWT_REFRESH_TOKEN_EXPIRES"] = timedelta(
+        days=int(os.getenv("JWT_REFRESH_TOKEN_DAYS", "30"))
+    )
+    app.config["JWT_COMPACT_ROLES"] = (
+        os.getenv("JWT_COMPACT_ROLES", "false").lower() == "true"
+    )
 
     migrate.init_app(app=app, db=db)
     jwt.init_app(app)
+    revocation_store.init_app(app)
+    jwt.token_in_blocklist_loader(revocation_store.check_blocklist)
+    init_auth_context(app)
+    token_cache.init_app(app)
+    token_cache.revocation_check = lambda claims: revocation_store.is_revoked(
+        claims.get("jti")
+    )
+    init_password_hashing(app)
+    hash_pool.init_app(app)
+    school_cache.init_app(app)
+    allocation_jobs.init_app(app)
     from src import models  # noqa: F401
+
+    role_registry.init_app(app)
+
     from src.routes.login import login_bp
     from src.routes.users import users_bp
     from src.routes.schools import schools_bp
+    from src.routes.school_classes import school_classes_bp
+    from src.routes.vagas import vagas_bp
+    from src.routes.allocation import allocation_bp
+    from src.routes.metrics import metrics_bp
 
     app.register_blueprint(login_bp)
     app.register_blueprint(users_bp)
     app.register_blueprint(schools_bp)
+    app.register_blueprint(school_classes_bp)
+    app.register_blueprint(vagas_bp)
+    app.register_blueprint(allocation_bp)
+    app.register_blueprint(metrics_bp)
+
+    @app.cli.command("release-expired-holds")
+    def release_expired_holds():
+        """Give back the seats of reservations that were not confirmed in time.
+
+        Holds are also released on demand when a class looks full; run this
+        periodically (e.g., from cron) to keep the free seat counts current.
+        """
+        from src.repositories.seat_reservation_repository import (
+            SeatReservationRepository,
+        )
+
+        released = SeatReservationRepository.release_expired()
+        click.echo(f"{released} reservas expiradas liberadas")
 
     return app
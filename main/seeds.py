@@ -1,6 +1,8 @@
 from main import create_app
 from src.config.db_config import db
+from src.domain.enums.role_name import RoleName
 from src.models.role import Role
+from src.repositories.role_registry import role_registry
 
 
 def seed_roles():
@@ -10,32 +12,23 @@ def seed_roles():
     - admin_secretaria: Can access all schools (super admin)
     - admin_escola: Can only access their own school (school admin)
 
-    The function checks if roles already exist before creating them to avoid duplicates.
+    Existing roles are looked up in the role registry, which is reloaded
+    after the commit so the new roles are visible without another query.
     """
     app = create_app()
 
     with app.app_context():
-        admin_secretaria = (
-            db.session.query(Role).filter(Role.name == "admin_secretaria").first()
-        )
-        if not admin_secretaria:
-            admin_secretaria = Role(name="admin_secretaria")  # pyright: ignore[reportCallIssue]
-            db.session.add(admin_secretaria)
-            print("✓ Role 'admin_secretaria' criada")
-        else:
-            print("ℹ Role 'admin_secretaria' já existe")
-
-        admin_escola = (
-            db.session.query(Role).filter(Role.name == "admin_escola").first()
-        )
-        if not admin_escola:
-            admin_escola = Role(name="admin_escola")  # pyright: ignore[reportCallIssue]
-            db.session.add(admin_escola)
-            print("✓ Role 'admin_escola' criada")
-        else:
-            print("ℹ Role 'admin_escola' já existe")
+        role_registry.refresh()
+
+        for role_name in RoleName:
+            if role_registry.get(role_name.value) is None:
+                db.session.add(Role(name=role_name.value))  # pyright: ignore[reportCallIssue]
+                print(f"✓ Role '{role_name.value}' criada")
+            else:
+                print(f"ℹ Role '{role_name.value}' já existe")
 
         db.session.commit()
+        role_registry.refresh()
         print("\n✓ Seeds executados com sucesso")
 
 
@@ -0,0 +1,60 @@
+"""Add school search indexes
+
+Revision ID: 6c02de631d40
+Revises: ebdefc058920
+Create Date: 2026-10-17 13:25:51.630874
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6c02de631d40'
+down_revision = 'ebdefc058920'
+branch_labels = None
+depends_on = None
+
+
+# Must match _search_document() in src/repositories/school_repository.py
+SEARCH_DOCUMENT = (
+    "f_unaccent(lower(coalesce(name, '') || ' ' || coalesce(address_street, '')"
+    " || ' ' || coalesce(address_neighborhood, '') || ' ' || coalesce(address_city, '')"
+    " || ' ' || coalesce(address_state, '') || ' ' || coalesce(address_zip_code, '')))"
+)
+
+
+def upgrade():
+    # Search indexes are PostgreSQL only; other databases use the Python fallback
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # unaccent() is only STABLE; an IMMUTABLE wrapper can be used in indexes
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text AS
+        $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        """
+    )
+
+    op.execute(
+        f"CREATE INDEX ix_schools_search_trgm ON schools "
+        f"USING gin ({SEARCH_DOCUMENT} gin_trgm_ops)"
+    )
+    op.execute(
+        f"CREATE INDEX ix_schools_search_tsv ON schools "
+        f"USING gin (to_tsvector('simple', {SEARCH_DOCUMENT}))"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_schools_search_tsv")
+    op.execute("DROP INDEX IF EXISTS ix_schools_search_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class AllocationStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CountStrategy(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
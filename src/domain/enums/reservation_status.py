@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ReservationStatus(str, Enum):
+    HELD = "held"
+    CONFIRMED = "confirmed"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class RoleName(str, Enum):
+    # Declaration order defines the bit used in compact role claims;
+    # append new roles at the end so issued tokens keep their meaning.
+    ADMIN_SECRETARIA = "admin_secretaria"
+    ADMIN_ESCOLA = "admin_escola"
+
+
+# Bit of each role in compact ("rb") role claims
+ROLE_BITS = {role.value: 1 << index for index, role in enumerate(RoleName)}
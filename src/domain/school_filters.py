@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.domain.enums.school_type import SchoolType
+
+
+@dataclass(frozen=True)
+class SchoolFilters:
+    """Filters for school listings.
+
+    Frozen so a filter combination can be used as a cache key.
+    """
+
+    school_type: Optional[SchoolType] = None
+    state: Optional[str] = None
+    city: Optional[str] = None
+    zip_prefix: Optional[str] = None
+    include_deleted: bool = False
+    only_deleted: bool = False
+    # Role scoping: restrict the listing to a single school
+    school_id: Optional[int] = None
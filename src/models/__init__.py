@@ -1,5 +1,12 @@
+from src.models.allocation_round import AllocationRound  # noqa: F401
+from src.models.applicant import Applicant  # noqa: F401
+from src.models.applicant_preference import ApplicantPreference  # noqa: F401
 from src.models.associations import roles_users  # noqa: F401
+from src.models.enrollment import Enrollment  # noqa: F401
+from src.models.revoked_token import RevokedToken  # noqa: F401
 from src.models.role import Role  # noqa: F401
 from src.models.school import School  # noqa: F401
 from src.models.school_class import SchoolClass  # noqa: F401
+from src.models.seat_reservation import SeatReservation  # noqa: F401
+from src.models.seat_summary import SeatSummary  # noqa: F401
 from src.models.user import User  # noqa: F401
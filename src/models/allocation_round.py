@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Enum, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db_config import db
+from src.domain.enums.allocation_status import AllocationStatus
+from src.domain.enums.class_grade import ClassGrade
+
+
+class AllocationRound(db.Model):
+    """Admission round: applicants of one grade allocated to class seats."""
+
+    __tablename__ = "allocation_rounds"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    name: Mapped[str] = mapped_column(String(length=80), nullable=False)
+
+    class_grade: Mapped[ClassGrade] = mapped_column(Enum(ClassGrade), nullable=False)
+
+    status: Mapped[AllocationStatus] = mapped_column(
+        Enum(
+            AllocationStatus,
+            name="allocation_status_enum",
+            values_callable=lambda e: [m.value for m in e],
+            validate_strings=True,
+        ),
+        nullable=False,
+        default=AllocationStatus.PENDING,
+    )
+
+    # Lottery seed of the last run; the same seed and applicants give the
+    # same allocation
+    seed: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    assigned: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    unassigned: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    error: Mapped[Optional[str]] = mapped_column(String(length=255), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
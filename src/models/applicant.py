@@ -0,0 +1,33 @@
+from typing import Optional
+
+from sqlalchemy import BigInteger, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db_config import db
+
+
+class Applicant(db.Model):
+    __tablename__ = "applicants"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    round_id: Mapped[int] = mapped_column(
+        ForeignKey("allocation_rounds.id"), nullable=False, index=True
+    )
+
+    student_name: Mapped[str] = mapped_column(String(length=80), nullable=False)
+
+    # Points from the round's priority rules; higher is served first
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Allocation result, set by the round's run
+    school_class_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("school_classes.id"), nullable=True
+    )
+
+    enrollment_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("enrollments.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # 1-based position of the granted school in the applicant's preferences
+    assigned_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -0,0 +1,22 @@
+from sqlalchemy import BigInteger, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db_config import db
+
+
+class ApplicantPreference(db.Model):
+    __tablename__ = "applicant_preferences"
+
+    applicant_id: Mapped[int] = mapped_column(
+        ForeignKey("applicants.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # 1 for the first choice
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    school_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("schools.id"), nullable=False
+    )
+
+    # Extra priority points at this school only (e.g., sibling enrolled)
+    bonus: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.config.db_config import db
+
+if TYPE_CHECKING:
+    from src.models.school_class import SchoolClass
+
+
+class Enrollment(db.Model):
+    __tablename__ = "enrollments"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    school_class_id: Mapped[int] = mapped_column(
+        ForeignKey("school_classes.id"), nullable=False, index=True
+    )
+    school_class: Mapped["SchoolClass"] = relationship(back_populates="enrollments")
+
+    student_name: Mapped[str] = mapped_column(String(length=80), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
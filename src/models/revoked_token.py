@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db_config import db
+
+
+class RevokedToken(db.Model):
+    __tablename__ = "revoked_tokens"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+    jti: Mapped[str] = mapped_column(String(36), unique=True, nullable=False)
+
+    token_type: Mapped[str] = mapped_column(String(10), nullable=False)
+
+    user_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
+    expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
@@ -1,11 +1,11 @@
 from datetime import datetime
-from typing import Optional
 
-from sqlalchemy import String, BigInteger, Enum, DateTime
+from sqlalchemy import String, BigInteger, Integer, Enum, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, composite
 from src.config.db_config import db
 from src.domain.address import Address
 from src.domain.enums.school_type import SchoolType
+from src.models.soft_delete import SoftDeleteMixin
 
 from typing import TYPE_CHECKING
 
@@ -14,8 +14,55 @@ if TYPE_CHECKING:
     from src.models.school_class import SchoolClass
 
 
-class School(db.Model):
+LIVE = text("deleted_at IS NULL")
+DELETED = text("deleted_at IS NOT NULL")
+
+
+class School(SoftDeleteMixin, db.Model):
     __tablename__ = "schools"
+    __table_args__ = (
+        Index("ix_schools_name_id", "name", "id"),
+        # Partial indexes: live listings only walk live rows, and restores
+        # and deleted listings only the deleted ones
+        Index(
+            "ix_schools_live_name_id",
+            "name",
+            "id",
+            postgresql_where=LIVE,
+            sqlite_where=LIVE,
+        ),
+        Index(
+            "ix_schools_live_type_name_id",
+            "school_type",
+            "name",
+            "id",
+            postgresql_where=LIVE,
+            sqlite_where=LIVE,
+        ),
+        Index(
+            "ix_schools_live_state_city_name_id",
+            "address_state",
+            "address_city",
+            "name",
+            "id",
+            postgresql_where=LIVE,
+            sqlite_where=LIVE,
+        ),
+        Index(
+            "ix_schools_deleted_at",
+            "deleted_at",
+            postgresql_where=DELETED,
+            sqlite_where=DELETED,
+        ),
+        # Latest change of any school, the Last-Modified of listings
+        Index("ix_schools_updated_at", "updated_at"),
+        # varchar_pattern_ops lets PostgreSQL use the index for LIKE 'prefix%'
+        Index(
+            "ix_schools_zip_code",
+            "address_zip_code",
+            postgresql_ops={"address_zip_code": "varchar_pattern_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
@@ -54,7 +101,17 @@ class School(db.Model):
         back_populates="school", cascade="all, delete-orphan"
     )
 
-    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Maintained by every UPDATE, including bulk ones, to build ETags
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=text("version + 1"),
+    )
 
     def to_dict(self, include_deleted=False) -> dict:
         """Convert school to dictionary representation.
@@ -65,16 +122,18 @@ class School(db.Model):
         Returns:
             Dictionary with school data
         """
+        # Read the columns directly: each access to the composite address
+        # builds a new Address object
         data = {
             "id": self.id,
             "name": self.name,
             "address": {
-                "street": self.address.street if self.address else None,
-                "number": self.address.number if self.address else None,
-                "neighborhood": self.address.neighborhood if self.address else None,
-                "city": self.address.city if self.address else None,
-                "state": self.address.state if self.address else None,
-                "zip_code": self.address.zip_code if self.address else None,
+                "street": self.address_street,
+                "number": self.address_number,
+                "neighborhood": self.address_neighborhood,
+                "city": self.address_city,
+                "state": self.address_state,
+                "zip_code": self.address_zip_code,
             },
             "school_type": self.school_type.value if self.school_type else None,
         }
@@ -1,17 +1,26 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Integer
+from sqlalchemy import CheckConstraint, Enum, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.config.db_config import db
 from src.domain.enums.class_grade import ClassGrade
 
 if TYPE_CHECKING:
+    from src.models.enrollment import Enrollment
     from src.models.school import School
 
 
 class SchoolClass(db.Model):
     __tablename__ = "school_classes"
+    __table_args__ = (
+        CheckConstraint("enrolled >= 0", name="ck_school_classes_enrolled_positive"),
+        CheckConstraint("held >= 0", name="ck_school_classes_held_positive"),
+        CheckConstraint(
+            "enrolled + held <= capacity", name="ck_school_classes_seats_capacity"
+        ),
+        Index("ix_school_classes_school_id", "school_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -19,5 +28,19 @@ class SchoolClass(db.Model):
 
     class_grade: Mapped[ClassGrade] = mapped_column(Enum(ClassGrade), nullable=False)
 
+    # Occupied seats, kept in step with the enrollments rows
+    enrolled: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+
+    # Seats held by unconfirmed reservations (see SeatReservation)
+    held: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+
     school_id: Mapped[int] = mapped_column(ForeignKey("schools.id"), nullable=False)
     school: Mapped["School"] = relationship(back_populates="school_classes")
+
+    enrollments: Mapped[list["Enrollment"]] = relationship(
+        back_populates="school_class"
+    )
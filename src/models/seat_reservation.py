@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db_config import db
+from src.domain.enums.reservation_status import ReservationStatus
+
+
+class SeatReservation(db.Model):
+    """Hold on one seat of a class until it is confirmed or expires.
+
+    The ID is chosen by the client, so retrying a reservation request never
+    takes a second seat.
+    """
+
+    __tablename__ = "seat_reservations"
+    __table_args__ = (
+        # Only live holds are swept for expiry
+        Index(
+            "ix_seat_reservations_held_expires_at",
+            "school_class_id",
+            "expires_at",
+            postgresql_where=text("status = 'held'"),
+            sqlite_where=text("status = 'held'"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    school_class_id: Mapped[int] = mapped_column(
+        ForeignKey("school_classes.id"), nullable=False
+    )
+
+    student_name: Mapped[str] = mapped_column(String(length=80), nullable=False)
+
+    status: Mapped[ReservationStatus] = mapped_column(
+        Enum(
+            ReservationStatus,
+            name="reservation_status_enum",
+            values_callable=lambda e: [m.value for m in e],
+            validate_strings=True,
+        ),
+        nullable=False,
+        default=ReservationStatus.HELD,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    enrollment_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("enrollments.id", ondelete="SET NULL"), nullable=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
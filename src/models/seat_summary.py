@@ -0,0 +1,38 @@
+from sqlalchemy import BigInteger, Enum, ForeignKey, Index, Integer, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.db_config import db
+from src.domain.enums.class_grade import ClassGrade
+
+
+class SeatSummary(db.Model):
+    """Seats of a school in one grade, summed over its classes.
+
+    Maintained incrementally by SeatRepository.apply_delta in the same
+    transaction as every class, enrollment or reservation change, so
+    availability reads never aggregate school_classes.
+    """
+
+    __tablename__ = "seat_summaries"
+    __table_args__ = (
+        Index("ix_seat_summaries_class_grade_school_id", "class_grade", "school_id"),
+    )
+
+    school_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("schools.id"), primary_key=True
+    )
+
+    class_grade: Mapped[ClassGrade] = mapped_column(Enum(ClassGrade), primary_key=True)
+
+    capacity: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+
+    enrolled: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+
+    # Seats held by unconfirmed reservations
+    held: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, event
+from sqlalchemy.orm import Mapped, Session, mapped_column, with_loader_criteria
+
+# Execution option that lets a query see soft-deleted rows
+INCLUDE_DELETED = "include_deleted"
+
+
+class SoftDeleteMixin:
+    """Marks a model as soft-deletable.
+
+    ORM SELECTs of these models only return rows whose deleted_at is NULL
+    unless the query is run with ``execution_options(include_deleted=True)``.
+    Column loads of already loaded objects and relationship loads are not
+    filtered, so navigating to a deleted parent still works.
+    """
+
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+def live_only(statement):
+    """Apply the live-only criteria to an ORM statement.
+
+    Needed when a statement is embedded in another construct (e.g., EXPLAIN)
+    and therefore does not go through the do_orm_execute hook.
+
+    Args:
+        statement: ORM-enabled Select.
+
+    Returns:
+        The statement restricted to live rows, unless it was run with
+        include_deleted.
+    """
+    if statement.get_execution_options().get(INCLUDE_DELETED, False):
+        return statement
+    # Not propagated to loaders: lazy loads of objects this statement
+    # returns must still reach deleted parents
+    return statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            lambda cls: cls.deleted_at.is_(None),
+            include_aliases=True,
+            propagate_to_loaders=False,
+        )
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filter_deleted(execute_state) -> None:
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        execute_state.statement = live_only(execute_state.statement)
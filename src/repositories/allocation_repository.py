@@ -0,0 +1,475 @@
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, bindparam, insert, or_, update
+
+from src.config.db_config import db
+from src.domain.enums.allocation_status import AllocationStatus
+from src.domain.enums.class_grade import ClassGrade
+from src.models.allocation_round import AllocationRound
+from src.models.applicant import Applicant
+from src.models.applicant_preference import ApplicantPreference
+from src.models.enrollment import Enrollment
+from src.models.school_class import SchoolClass
+from src.models.seat_summary import SeatSummary
+
+# Columns of the round projection, in the order expected by
+# src.utils.serializers.serialize_allocation_round_row
+ROUND_COLUMNS = (
+    AllocationRound.id,
+    AllocationRound.name,
+    AllocationRound.class_grade,
+    AllocationRound.status,
+    AllocationRound.seed,
+    AllocationRound.progress,
+    AllocationRound.assigned,
+    AllocationRound.unassigned,
+    AllocationRound.error,
+    AllocationRound.created_at,
+    AllocationRound.started_at,
+    AllocationRound.finished_at,
+)
+
+
+class AllocationConflictError(Exception):
+    """Raised when classes lost free seats while a round was being solved."""
+
+
+class AllocationRepository:
+    @staticmethod
+    def find_round_row(round_id: int) -> Optional[Any]:
+        """Get an allocation round.
+
+        Args:
+            round_id: Round's unique identifier.
+
+        Returns:
+            Row with the ROUND_COLUMNS attributes, None if not found.
+        """
+        return (
+            db.session.query(*ROUND_COLUMNS)
+            .filter(AllocationRound.id == round_id)
+            .first()
+        )
+
+    @staticmethod
+    def create_round(name: str, class_grade: ClassGrade) -> int:
+        """Create a pending allocation round.
+
+        Args:
+            name: Round name.
+            class_grade: Grade the applicants apply for.
+
+        Returns:
+            ID of the created round.
+        """
+        allocation_round = AllocationRound(name=name, class_grade=class_grade)
+        db.session.add(allocation_round)
+        db.session.commit()
+        return allocation_round.id
+
+    @staticmethod
+    def add_applicants(round_id: int, applicants: List[Dict[str, Any]]) -> List[int]:
+        """Insert applicants and their preferences with multi-row statements.
+
+        Args:
+            round_id: Round's unique identifier.
+            applicants: Dictionaries with student_name, priority and
+                preferences (list of {"school_id", "bonus"}, best first).
+
+        Returns:
+            IDs of the created applicants, in the same order.
+        """
+        if not applicants:
+            return []
+
+        applicant_ids = list(
+            db.session.execute(
+                insert(Applicant).returning(Applicant.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "round_id": round_id,
+                        "student_name": applicant["student_name"],
+                        "priority": applicant["priority"],
+                    }
+                    for applicant in applicants
+                ],
+            ).scalars()
+        )
+
+        preferences = [
+            {
+                "applicant_id": applicant_id,
+                "rank": rank,
+                "school_id": preference["school_id"],
+                "bonus": preference["bonus"],
+            }
+            for applicant_id, applicant in zip(applicant_ids, applicants)
+            for rank, preference in enumerate(applicant["preferences"], start=1)
+        ]
+        if preferences:
+            db.session.execute(insert(ApplicantPreference), preferences)
+
+        db.session.commit()
+        return applicant_ids
+
+    @staticmethod
+    def claim_round(
+        round_id: int, seed: int, stale_after: timedelta
+    ) -> Optional[datetime]:
+        """Mark a pending, failed or abandoned round as running.
+
+        A running round is abandoned once it started more than stale_after
+        ago: its worker or process died without finishing it. The status
+        check and the change are one UPDATE, so two requests can never
+        start the same round.
+
+        Args:
+            round_id: Round's unique identifier.
+            seed: Lottery seed for this run.
+            stale_after: Time after which a running round can be claimed again.
+
+        Returns:
+            The run's started_at, which identifies it in the other calls, or
+            None if the round could not be claimed.
+        """
+        started_at = datetime.utcnow()
+        claimed = db.session.execute(
+            update(AllocationRound)
+            .where(
+                AllocationRound.id == round_id,
+                or_(
+                    AllocationRound.status.in_(
+                        (AllocationStatus.PENDING, AllocationStatus.FAILED)
+                    ),
+                    and_(
+                        AllocationRound.status == AllocationStatus.RUNNING,
+                        AllocationRound.started_at < started_at - stale_after,
+                    ),
+                ),
+            )
+            .values(
+                status=AllocationStatus.RUNNING,
+                seed=seed,
+                progress=0.0,
+                error=None,
+                started_at=started_at,
+                finished_at=None,
+            ),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        db.session.commit()
+        return started_at if claimed else None
+
+    @staticmethod
+    def _current_run(round_id: int, started_at: datetime):
+        """WHERE criteria matching a round only while this run owns it."""
+        return and_(
+            AllocationRound.id == round_id,
+            AllocationRound.status == AllocationStatus.RUNNING,
+            AllocationRound.started_at == started_at,
+        )
+
+    @staticmethod
+    def set_progress(round_id: int, started_at: datetime, progress: float) -> None:
+        """Store the progress of a running round (0 to 1).
+
+        Args:
+            round_id: Round's unique identifier.
+            started_at: Run returned by claim_round; nothing is stored if the
+                round was claimed again since.
+            progress: Fraction of the work done.
+        """
+        db.session.execute(
+            update(AllocationRound)
+            .where(AllocationRepository._current_run(round_id, started_at))
+            .values(progress=round(progress, 4)),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.commit()
+
+    @staticmethod
+    def fail_round(round_id: int, started_at: datetime, error: str) -> None:
+        """Mark a round as failed; it can be run again.
+
+        Args:
+            round_id: Round's unique identifier.
+            started_at: Run returned by claim_round; a newer run is left alone.
+            error: Reason shown to the user.
+        """
+        db.session.rollback()
+        db.session.execute(
+            update(AllocationRound)
+            .where(AllocationRepository._current_run(round_id, started_at))
+            .values(
+                status=AllocationStatus.FAILED,
+                error=error[:255],
+                finished_at=datetime.utcnow(),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.commit()
+
+    @staticmethod
+    def load_applicants(round_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Load the applicants of a round as arrays.
+
+        Args:
+            round_id: Round's unique identifier.
+
+        Returns:
+            Tuple (applicant IDs sorted ascending, priority points).
+        """
+        rows = (
+            db.session.query(Applicant.id, Applicant.priority)
+            .filter(Applicant.round_id == round_id)
+            .order_by(Applicant.id)
+            .all()
+        )
+        data = np.array(rows, dtype=np.int64).reshape(-1, 2)
+        return data[:, 0], data[:, 1]
+
+    @staticmethod
+    def load_preferences(round_id: int) -> np.ndarray:
+        """Load the preferences of a round's applicants as an array.
+
+        Args:
+            round_id: Round's unique identifier.
+
+        Returns:
+            int64 array with one (applicant_id, rank, school_id, bonus) row
+            per preference.
+        """
+        rows = (
+            db.session.query(
+                ApplicantPreference.applicant_id,
+                ApplicantPreference.rank,
+                ApplicantPreference.school_id,
+                ApplicantPreference.bonus,
+            )
+            .join(Applicant, Applicant.id == ApplicantPreference.applicant_id)
+            .filter(Applicant.round_id == round_id)
+            .all()
+        )
+        return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+    @staticmethod
+    def load_free_classes(class_grade: ClassGrade) -> np.ndarray:
+        """Load the classes of a grade that have free seats, in live schools.
+
+        Args:
+            class_grade: Grade of the round.
+
+        Returns:
+            int64 array with one (class_id, school_id, free seats) row per
+            class, sorted by school and class ID.
+        """
+        rows = (
+            db.session.query(
+                SchoolClass.id,
+                SchoolClass.school_id,
+                SchoolClass.capacity - SchoolClass.enrolled - SchoolClass.held,
+            )
+            .join(SchoolClass.school)
+            .filter(
+                SchoolClass.class_grade == class_grade,
+                SchoolClass.enrolled + SchoolClass.held < SchoolClass.capacity,
+            )
+            .order_by(SchoolClass.school_id, SchoolClass.id)
+            .all()
+        )
+        return np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+    @staticmethod
+    def write_results(
+        round_id: int,
+        started_at: datetime,
+        class_grade: ClassGrade,
+        applicant_ids: np.ndarray,
+        class_ids: np.ndarray,
+        ranks: np.ndarray,
+    ) -> int:
+        """Enroll the allocated applicants and finish the round, in bulk.
+
+        The round is locked and checked to still belong to this run, the
+        classes involved are locked in ID order and their free seats
+        checked again, then enrollments are inserted with one multi-row
+        statement, classes, applicants and seat summaries are updated with
+        executemany UPDATEs, and everything is committed at once.
+
+        Args:
+            round_id: Round's unique identifier.
+            started_at: Run returned by claim_round.
+            class_grade: Grade of the round.
+            applicant_ids: Applicant IDs.
+            class_ids: Allocated class ID per applicant, -1 if none.
+            ranks: 0-based preference rank per applicant, -1 if none.
+
+        Returns:
+            Number of applicants enrolled.
+
+        Raises:
+            AllocationConflictError: If the round was claimed again by
+                another run, or a class no longer has the seats the
+                allocation gave away; nothing is written.
+        """
+        owned = (
+            db.session.query(AllocationRound.id)
+            .filter(AllocationRepository._current_run(round_id, started_at))
+            .with_for_update()
+            .first()
+        )
+        if owned is None:
+            raise AllocationConflictError("Rodada reiniciada durante a alocação")
+
+        admitted = np.flatnonzero(class_ids >= 0)
+        used_classes, seats_taken = np.unique(class_ids[admitted], return_counts=True)
+
+        classes = (
+            db.session.query(
+                SchoolClass.id,
+                SchoolClass.school_id,
+                SchoolClass.capacity,
+                SchoolClass.enrolled,
+                SchoolClass.held,
+            )
+            .filter(SchoolClass.id.in_(used_classes.tolist()))
+            .order_by(SchoolClass.id)
+            .with_for_update()
+            .all()
+        )
+        if len(classes) != used_classes.size:
+            raise AllocationConflictError("Turma removida durante a alocação")
+
+        school_deltas: Dict[int, int] = {}
+        class_updates = []
+        for row, taken in zip(classes, seats_taken.tolist()):
+            if row.enrolled + row.held + taken > row.capacity:
+                raise AllocationConflictError("Vagas ocupadas durante a alocação")
+            class_updates.append({"id": row.id, "enrolled": row.enrolled + taken})
+            school_deltas[row.school_id] = school_deltas.get(row.school_id, 0) + taken
+
+        enrollment_ids = []
+        if admitted.size:
+            names = dict(
+                db.session.query(Applicant.id, Applicant.student_name).filter(
+                    Applicant.round_id == round_id
+                )
+            )
+            enrollment_ids = list(
+                db.session.execute(
+                    insert(Enrollment).returning(
+                        Enrollment.id, sort_by_parameter_order=True
+                    ),
+                    [
+                        {
+                            "school_class_id": class_id,
+                            "student_name": names[applicant_id],
+                        }
+                        for applicant_id, class_id in zip(
+                            applicant_ids[admitted].tolist(),
+                            class_ids[admitted].tolist(),
+                        )
+                    ],
+                ).scalars()
+            )
+
+            db.session.execute(update(SchoolClass), class_updates)
+            db.session.execute(
+                update(Applicant),
+                [
+                    {
+                        "id": applicant_id,
+                        "school_class_id": class_id,
+                        "enrollment_id": enrollment_id,
+                        "assigned_rank": rank + 1,
+                    }
+                    for applicant_id, class_id, enrollment_id, rank in zip(
+                        applicant_ids[admitted].tolist(),
+                        class_ids[admitted].tolist(),
+                        enrollment_ids,
+                        ranks[admitted].tolist(),
+                    )
+                ],
+            )
+
+            summaries = SeatSummary.__table__
+            db.session.execute(
+                update(summaries)
+                .where(
+                    summaries.c.school_id == bindparam("summary_school_id"),
+                    summaries.c.class_grade == class_grade,
+                )
+                .values(enrolled=summaries.c.enrolled + bindparam("summary_delta")),
+                [
+                    {"summary_school_id": school_id, "summary_delta": delta}
+                    for school_id, delta in school_deltas.items()
+                ],
+            )
+
+        db.session.execute(
+            update(AllocationRound)
+            .where(AllocationRepository._current_run(round_id, started_at))
+            .values(
+                status=AllocationStatus.DONE,
+                progress=1.0,
+                assigned=int(admitted.size),
+                unassigned=int(applicant_ids.size - admitted.size),
+                finished_at=datetime.utcnow(),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.commit()
+        return int(admitted.size)
+
+    @staticmethod
+    def get_results(round_id: int, page: int = 1, per_page: int = 100) -> Dict[str, Any]:
+        """Get the applicants of a round with their allocation.
+
+        Args:
+            round_id: Round's unique identifier.
+            page: Page number (1-based).
+            per_page: Items per page (max 1000).
+
+        Returns:
+            Dictionary with applicant rows (id, student_name, priority,
+            school_class_id, school_id, assigned_rank), ordered by ID, and
+            pagination info.
+        """
+        page = max(1, int(page))
+        per_page = min(max(1, int(per_page)), 1000)
+
+        query = (
+            db.session.query(
+                Applicant.id,
+                Applicant.student_name,
+                Applicant.priority,
+                Applicant.school_class_id,
+                SchoolClass.school_id,
+                Applicant.assigned_rank,
+            )
+            .outerjoin(SchoolClass, SchoolClass.id == Applicant.school_class_id)
+            .filter(Applicant.round_id == round_id)
+        )
+
+        total = query.order_by(None).count()
+        rows = (
+            query.order_by(Applicant.id)
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+            .all()
+        )
+
+        return {
+            "applicants": rows,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "pages": math.ceil(total / per_page),
+                "has_next": page * per_page < total,
+                "has_prev": page > 1,
+            },
+        }
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from src.config.db_config import db
+from src.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    @staticmethod
+    def add(
+        jti: str,
+        token_type: str,
+        user_id: Optional[int],
+        expires_at: Optional[datetime],
+    ) -> bool:
+        """Record a revoked token.
+
+        Args:
+            jti: Unique identifier of the token.
+            token_type: Token type (access or refresh).
+            user_id: Owner of the token.
+            expires_at: When the token expires; None if it never does.
+
+        Returns:
+            True if the token was recorded, False if it was already revoked.
+        """
+        token = RevokedToken(
+            jti=jti,  # pyright: ignore[reportCallIssue]
+            token_type=token_type,  # pyright: ignore[reportCallIssue]
+            user_id=user_id,  # pyright: ignore[reportCallIssue]
+            expires_at=expires_at,  # pyright: ignore[reportCallIssue]
+        )
+        db.session.add(token)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return False
+        return True
+
+    @staticmethod
+    def exists(jti: str) -> bool:
+        """Check whether a token was revoked.
+
+        Args:
+            jti: Unique identifier of the token.
+
+        Returns:
+            True if the token is revoked, False otherwise.
+        """
+        return db.session.query(
+            db.session.query(RevokedToken.id).filter(RevokedToken.jti == jti).exists()
+        ).scalar()
+
+    @staticmethod
+    def get_revoked_since(
+        last_id: int, now: Optional[datetime] = None
+    ) -> List[Tuple[int, str]]:
+        """Get revocations recorded after a given row id.
+
+        Args:
+            last_id: Highest row id already seen.
+            now: When set, tokens that expired before this instant are skipped.
+
+        Returns:
+            List of (id, jti) tuples ordered by id.
+        """
+        query = db.session.query(RevokedToken.id, RevokedToken.jti).filter(
+            RevokedToken.id > last_id
+        )
+
+        if now is not None:
+            query = query.filter(
+                (RevokedToken.expires_at.is_(None)) | (RevokedToken.expires_at > now)
+            )
+
+        return [(row.id, row.jti) for row in query.order_by(RevokedToken.id)]
@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.config.db_config import db
+from src.domain.enums.role_name import ROLE_BITS
+from src.models.role import Role
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RoleEntry:
+    id: int
+    name: str
+    # Bit used in compact role claims, None for roles without one
+    bit: Optional[int]
+
+
+class RoleRegistry:
+    """In-process map of role names to ids and claim bits.
+
+    Loaded once at startup and refreshed when roles change, so role
+    assignment does not need to query the roles table. A lookup for an
+    unknown name reloads the map (at most once per ``miss_refresh_seconds``)
+    to pick up roles created by other processes.
+    """
+
+    def __init__(self, miss_refresh_seconds: float = 1.0):
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self._by_name: Dict[str, RoleEntry] = {}
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Load the roles at application startup.
+
+        The roles table may not exist yet (e.g., while running migrations);
+        in that case the registry starts empty and loads on first use.
+
+        Args:
+            app: Flask application instance.
+        """
+        with app.app_context():
+            try:
+                self.refresh()
+            except SQLAlchemyError as exc:
+                logger.warning("Role registry not loaded at startup: %s", exc)
+                db.session.rollback()
+            finally:
+                db.session.remove()
+
+    def refresh(self) -> None:
+        """Reload every role from the database."""
+        rows = db.session.query(Role.id, Role.name).all()
+        by_name = {
+            row.name: RoleEntry(id=row.id, name=row.name, bit=ROLE_BITS.get(row.name))
+            for row in rows
+        }
+        with self._lock:
+            self._by_name = by_name
+            self._last_refresh = time.monotonic()
+
+    def get(self, role_name: str) -> Optional[RoleEntry]:
+        """Get a role by name.
+
+        Args:
+            role_name: Name of the role.
+
+        Returns:
+            RoleEntry if the role exists, None otherwise.
+        """
+        entry = self._by_name.get(role_name)
+        if entry is None and (
+            time.monotonic() - self._last_refresh >= self.miss_refresh_seconds
+        ):
+            self.refresh()
+            entry = self._by_name.get(role_name)
+        return entry
+
+    def get_id(self, role_name: str) -> Optional[int]:
+        """Get the id of a role by name.
+
+        Args:
+            role_name: Name of the role.
+
+        Returns:
+            Role id if the role exists, None otherwise.
+        """
+        entry = self.get(role_name)
+        return entry.id if entry else None
+
+    def names(self) -> List[str]:
+        """Get the names of every loaded role.
+
+        Returns:
+            List of role names.
+        """
+        return list(self._by_name)
+
+
+role_registry = RoleRegistry()
@@ -0,0 +1,317 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, update
+
+from src.config.db_config import db
+from src.domain.enums.class_grade import ClassGrade
+from src.domain.enums.reservation_status import ReservationStatus
+from src.models.enrollment import Enrollment
+from src.models.school_class import SchoolClass
+from src.models.seat_reservation import SeatReservation
+from src.repositories.seat_repository import SeatRepository
+
+# Columns of the school class projection, in the order expected by
+# src.utils.serializers.serialize_school_class_row
+SCHOOL_CLASS_COLUMNS = (
+    SchoolClass.id,
+    SchoolClass.school_id,
+    SchoolClass.class_grade,
+    SchoolClass.capacity,
+    SchoolClass.enrolled,
+    SchoolClass.held,
+)
+
+
+class ClassFullError(Exception):
+    """Raised when enrolling in a class whose seats are all taken."""
+
+
+class ClassNotEmptyError(Exception):
+    """Raised when deleting a class, or shrinking it, below its taken seats."""
+
+
+class SchoolClassRepository:
+    @staticmethod
+    def get_by_school_ids(school_ids: Iterable[int]) -> Dict[int, List[Any]]:
+        """Get the classes of many schools with one query.
+
+        Args:
+            school_ids: School IDs.
+
+        Returns:
+            Dictionary mapping each school ID to its class rows (with the
+            SCHOOL_CLASS_COLUMNS attributes), ordered by ID.
+        """
+        classes: Dict[int, List[Any]] = {school_id: [] for school_id in school_ids}
+        if not classes:
+            return classes
+
+        rows = (
+            db.session.query(*SCHOOL_CLASS_COLUMNS)
+            .filter(SchoolClass.school_id.in_(list(classes)))
+            .order_by(SchoolClass.id)
+        )
+        for row in rows:
+            classes[row.school_id].append(row)
+        return classes
+
+    @staticmethod
+    def find_row(school_id: int, class_id: int) -> Optional[Any]:
+        """Get one class of a school.
+
+        Args:
+            school_id: School's unique identifier.
+            class_id: Class's unique identifier.
+
+        Returns:
+            Row with the SCHOOL_CLASS_COLUMNS attributes, None if the class
+            does not exist or belongs to another school.
+        """
+        return (
+            db.session.query(*SCHOOL_CLASS_COLUMNS)
+            .filter(SchoolClass.id == class_id, SchoolClass.school_id == school_id)
+            .first()
+        )
+
+    @staticmethod
+    def create_class(school_id: int, class_grade: ClassGrade, capacity: int) -> int:
+        """Create a class and add its seats to the school's summary.
+
+        Args:
+            school_id: School's unique identifier.
+            class_grade: Grade of the class.
+            capacity: Number of seats.
+
+        Returns:
+            ID of the created class.
+        """
+        school_class = SchoolClass(
+            school_id=school_id, class_grade=class_grade, capacity=capacity
+        )
+        db.session.add(school_class)
+        db.session.flush()
+
+        SeatRepository.apply_delta(school_id, class_grade, capacity=capacity)
+        db.session.commit()
+        return school_class.id
+
+    @staticmethod
+    def update_class(
+        school_id: int,
+        class_id: int,
+        class_grade: Optional[ClassGrade] = None,
+        capacity: Optional[int] = None,
+    ) -> bool:
+        """Change the grade and/or capacity of a class.
+
+        The class row is locked while the summary is adjusted: seats (and
+        enrolled and held seats, when the grade changes) move between
+        summary rows.
+
+        Args:
+            school_id: School's unique identifier.
+            class_id: Class's unique identifier.
+            class_grade: New grade, None to keep it.
+            capacity: New capacity, None to keep it.
+
+        Returns:
+            True if the class was updated, False if not found.
+
+        Raises:
+            ClassNotEmptyError: If capacity is below the enrolled and held
+                seats.
+        """
+        school_class = (
+            db.session.query(SchoolClass)
+            .filter(SchoolClass.id == class_id, SchoolClass.school_id == school_id)
+            .with_for_update()
+            .first()
+        )
+        if school_class is None:
+            return False
+
+        old_grade, old_capacity = school_class.class_grade, school_class.capacity
+        new_grade = class_grade or old_grade
+        new_capacity = old_capacity if capacity is None else capacity
+
+        if new_capacity < school_class.enrolled + school_class.held:
+            db.session.rollback()
+            raise ClassNotEmptyError(class_id)
+
+        school_class.class_grade = new_grade
+        school_class.capacity = new_capacity
+
+        if new_grade == old_grade:
+            SeatRepository.apply_delta(
+                school_id, new_grade, capacity=new_capacity - old_capacity
+            )
+        else:
+            SeatRepository.apply_delta(
+                school_id,
+                old_grade,
+                capacity=-old_capacity,
+                enrolled=-school_class.enrolled,
+                held=-school_class.held,
+            )
+            SeatRepository.apply_delta(
+                school_id,
+                new_grade,
+                capacity=new_capacity,
+                enrolled=school_class.enrolled,
+                held=school_class.held,
+            )
+
+        db.session.commit()
+        return True
+
+    @staticmethod
+    def delete_class(school_id: int, class_id: int) -> bool:
+        """Delete an empty class and remove its seats from the summary.
+
+        Past (confirmed, cancelled or expired) reservations of the class are
+        deleted with it.
+
+        Args:
+            school_id: School's unique identifier.
+            class_id: Class's unique identifier.
+
+        Returns:
+            True if the class was deleted, False if not found.
+
+        Raises:
+            ClassNotEmptyError: If the class still has enrollments or held
+                seats.
+        """
+        db.session.execute(
+            delete(SeatReservation).where(
+                SeatReservation.school_class_id == class_id,
+                SeatReservation.status != ReservationStatus.HELD,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        row = db.session.execute(
+            delete(SchoolClass)
+            .where(
+                SchoolClass.id == class_id,
+                SchoolClass.school_id == school_id,
+                SchoolClass.enrolled == 0,
+                SchoolClass.held == 0,
+            )
+            .returning(SchoolClass.class_grade, SchoolClass.capacity),
+            execution_options={"synchronize_session": False},
+        ).first()
+
+        if row is None:
+            exists = SchoolClassRepository.find_row(school_id, class_id) is not None
+            db.session.rollback()
+            if exists:
+                raise ClassNotEmptyError(class_id)
+            return False
+
+        SeatRepository.apply_delta(school_id, row.class_grade, capacity=-row.capacity)
+        db.session.commit()
+        return True
+
+    @staticmethod
+    def get_enrollments(class_id: int) -> List[Any]:
+        """Get the enrollments of a class.
+
+        Args:
+            class_id: Class's unique identifier.
+
+        Returns:
+            Rows with id, student_name and created_at, oldest first.
+        """
+        return (
+            db.session.query(
+                Enrollment.id, Enrollment.student_name, Enrollment.created_at
+            )
+            .filter(Enrollment.school_class_id == class_id)
+            .order_by(Enrollment.id)
+            .all()
+        )
+
+    @staticmethod
+    def enroll(school_id: int, class_id: int, student_name: str) -> Optional[int]:
+        """Enroll a student if the class has a free seat.
+
+        The seat is taken with one conditional UPDATE ... SET enrolled =
+        enrolled + 1 WHERE enrolled + held < capacity, so concurrent
+        enrollments and reservations can never overfill a class; the
+        enrollment row and the summary change are written in the same
+        transaction.
+
+        Args:
+            school_id: School's unique identifier.
+            class_id: Class's unique identifier.
+            student_name: Name of the student.
+
+        Returns:
+            ID of the enrollment, None if the class was not found.
+
+        Raises:
+            ClassFullError: If the class has no free seat.
+        """
+        row = db.session.execute(
+            update(SchoolClass)
+            .where(
+                SchoolClass.id == class_id,
+                SchoolClass.school_id == school_id,
+                SchoolClass.enrolled + SchoolClass.held < SchoolClass.capacity,
+            )
+            .values(enrolled=SchoolClass.enrolled + 1)
+            .returning(SchoolClass.class_grade),
+            execution_options={"synchronize_session": False},
+        ).first()
+
+        if row is None:
+            exists = SchoolClassRepository.find_row(school_id, class_id) is not None
+            db.session.rollback()
+            if exists:
+                raise ClassFullError(class_id)
+            return None
+
+        enrollment = Enrollment(school_class_id=class_id, student_name=student_name)
+        db.session.add(enrollment)
+        db.session.flush()
+
+        SeatRepository.apply_delta(school_id, row.class_grade, enrolled=1)
+        db.session.commit()
+        return enrollment.id
+
+    @staticmethod
+    def unenroll(school_id: int, class_id: int, enrollment_id: int) -> bool:
+        """Cancel an enrollment and free its seat.
+
+        Args:
+            school_id: School's unique identifier.
+            class_id: Class's unique identifier.
+            enrollment_id: Enrollment's unique identifier.
+
+        Returns:
+            True if the enrollment was cancelled, False if not found.
+        """
+        if SchoolClassRepository.find_row(school_id, class_id) is None:
+            return False
+
+        deleted = db.session.execute(
+            delete(Enrollment).where(
+                Enrollment.id == enrollment_id, Enrollment.school_class_id == class_id
+            ),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        if not deleted:
+            db.session.rollback()
+            return False
+
+        row = db.session.execute(
+            update(SchoolClass)
+            .where(SchoolClass.id == class_id)
+            .values(enrolled=SchoolClass.enrolled - 1)
+            .returning(SchoolClass.class_grade),
+            execution_options={"synchronize_session": False},
+        ).first()
+
+        SeatRepository.apply_delta(school_id, row.class_grade, enrolled=-1)
+        db.session.commit()
+        return True
@@ -1,13 +1,243 @@
+import math
+from dataclasses import replace
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-
+from itertools import repeat
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import func, insert, literal_column, select, tuple_, update
 
 from src.config.db_config import db
 from src.models.school import School
+from src.domain.enums.count_strategy import CountStrategy
 from src.domain.enums.school_type import SchoolType
+from src.domain.school_filters import SchoolFilters
+from src.utils.cache import school_cache
+from src.utils.count_cache import school_count_cache
+from src.utils.pagination import decode_cursor, encode_cursor, estimate_count
+from src.utils.text_search import fuzzy_score
+
+# Columns covered by school search, in the order used by the search index
+SEARCH_COLUMNS = (
+    School.name,
+    School.address_street,
+    School.address_neighborhood,
+    School.address_city,
+    School.address_state,
+    School.address_zip_code,
+)
+
+# Columns of the school projection returned by listings and exports, in the
+# order expected by src.utils.serializers.serialize_school_row
+SCHOOL_COLUMNS = (
+    School.id,
+    School.name,
+    School.address_street,
+    School.address_number,
+    School.address_neighborhood,
+    School.address_city,
+    School.address_state,
+    School.address_zip_code,
+    School.school_type,
+    School.deleted_at,
+)
+
+# Columns loaded for each field of SCHOOL_FIELDS
+SCHOOL_FIELD_COLUMNS = {
+    "id": (School.id,),
+    "name": (School.name,),
+    "address": (
+        School.address_street,
+        School.address_number,
+        School.address_neighborhood,
+        School.address_city,
+        School.address_state,
+        School.address_zip_code,
+    ),
+    "school_type": (School.school_type,),
+    "deleted_at": (School.deleted_at,),
+}
+
+# Columns matched by SchoolFilters; changing any of them can change the
+# cached listing totals
+FILTERED_FIELDS = frozenset(
+    {"school_type", "address_state", "address_city", "address_zip_code"}
+)
+
+
+def school_columns(fields: Optional[FrozenSet[str]] = None) -> Tuple[Any, ...]:
+    """Columns to select for the requested school fields.
+
+    id and name are always selected: they key includes and cursors.
+
+    Args:
+        fields: Requested fields, None for all.
+
+    Returns:
+        Tuple of School columns.
+    """
+    if fields is None:
+        return SCHOOL_COLUMNS
+    return tuple(
+        column
+        for field, columns in SCHOOL_FIELD_COLUMNS.items()
+        if field in fields or field in ("id", "name")
+        for column in columns
+    )
+
+
+def _search_document():
+    """Accent-insensitive search text of a school.
+
+    Must stay identical to the expression of the ix_schools_search_trgm and
+    ix_schools_search_tsv indexes, otherwise PostgreSQL will not use them.
+    """
+    separator = literal_column("' '")
+    document = func.coalesce(SEARCH_COLUMNS[0], literal_column("''"))
+    for column in SEARCH_COLUMNS[1:]:
+        document = document.op("||")(separator).op("||")(
+            func.coalesce(column, literal_column("''"))
+        )
+    return func.f_unaccent(func.lower(document))
 
 
 class SchoolRepository:
+    @staticmethod
+    def _paginate(
+        query,
+        page: int,
+        per_page: int,
+        count: CountStrategy,
+        cache_key: Hashable,
+        total: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run an offset-paginated query using the given total-count strategy.
+
+        One extra row is fetched to know whether there is a next page, so
+        has_next is exact whatever strategy produced the total.
+
+        Args:
+            query: Filtered School query with a total order.
+            page: Page number (1-based).
+            per_page: Items per page.
+            count: How to obtain the total (exact, cached or estimated).
+            cache_key: Filter combination used as key for cached totals.
+            total: Exact total already counted by the caller, if any; no
+                count is run then.
+
+        Returns:
+            Dictionary with schools list and pagination info.
+        """
+        rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+        has_next = len(rows) > per_page
+
+        if total is not None:
+            count = CountStrategy.EXACT
+        elif count == CountStrategy.CACHED:
+            total = school_count_cache.get(cache_key)
+            if total is None:
+                total = query.order_by(None).count()
+                school_count_cache.set(cache_key, total)
+        elif count == CountStrategy.ESTIMATED:
+            total = estimate_count(query)
+
+        if total is None:
+            # Exact requested, or the database has no planner estimate
+            count = CountStrategy.EXACT
+            total = query.order_by(None).count()
+
+        # Keep estimates consistent with what this page has already shown
+        total = max(total, (page - 1) * per_page + len(rows[:per_page]))
+
+        return {
+            "schools": rows[:per_page],
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "pages": math.ceil(total / per_page),
+                "has_next": has_next,
+                "has_prev": page > 1,
+                "count": count.value,
+            },
+        }
+
+    @staticmethod
+    def payload_cache_key(school_id: int, include_deleted: bool) -> str:
+        """Key of a serialized school payload in school_cache.
+
+        Args:
+            school_id: School's unique identifier.
+            include_deleted: Whether the payload includes deleted_at.
+
+        Returns:
+            Cache key.
+        """
+        return f"{school_id}:{int(include_deleted)}"
+
+    @staticmethod
+    def invalidate_cached(school_ids: Iterable[int]) -> None:
+        """Drop the cached payloads of the given schools.
+
+        Must be called after the write is committed, otherwise a concurrent
+        read could cache the old row again.
+
+        Args:
+            school_ids: IDs of the changed schools.
+        """
+        school_cache.delete_many(
+            SchoolRepository.payload_cache_key(school_id, include_deleted)
+            for school_id in school_ids
+            for include_deleted in (False, True)
+        )
+
+    @staticmethod
+    def _filtered_query(filters: SchoolFilters):
+        """Build a School query with the given listing filters applied.
+
+        Args:
+            filters: Filter combination.
+
+        Returns:
+            Filtered School query.
+        """
+        query = db.session.query(School)
+
+        if filters.include_deleted or filters.only_deleted:
+            query = query.execution_options(include_deleted=True)
+
+        if filters.school_id is not None:
+            query = query.filter(School.id == filters.school_id)
+
+        if filters.school_type is not None:
+            query = query.filter(School.school_type == filters.school_type)
+
+        if filters.state:
+            query = query.filter(School.address_state == filters.state)
+
+        if filters.city:
+            query = query.filter(School.address_city == filters.city)
+
+        if filters.zip_prefix:
+            query = query.filter(
+                School.address_zip_code.startswith(filters.zip_prefix, autoescape=True)
+            )
+
+        if filters.only_deleted:
+            query = query.filter(School.deleted_at.isnot(None))
+
+        return query
+
     @staticmethod
     def find_by_id(school_id: int, include_deleted: bool = False) -> Optional[School]:
         """Find a school by its ID.
@@ -21,11 +251,46 @@ class SchoolRepository:
         """
         query = db.session.query(School).filter(School.id == school_id)
 
-        if not include_deleted:
-            query = query.filter(School.deleted_at.is_(None))
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
 
         return query.first()
 
+    @staticmethod
+    def get_by_ids(school_ids: Iterable[int]) -> Dict[int, Any]:
+        """Get many live schools with one query.
+
+        Args:
+            school_ids: School IDs.
+
+        Returns:
+            Dictionary mapping the ID of each live school to its row (with
+            the SCHOOL_COLUMNS attributes).
+        """
+        school_ids = list(school_ids)
+        if not school_ids:
+            return {}
+
+        rows = db.session.query(*SCHOOL_COLUMNS).filter(School.id.in_(school_ids))
+        return {row.id: row for row in rows}
+
+    @staticmethod
+    def find_existing_ids(school_ids: Iterable[int]) -> Set[int]:
+        """Find which of the given school IDs exist and are not deleted.
+
+        Args:
+            school_ids: School IDs to check.
+
+        Returns:
+            Set with the IDs of live schools.
+        """
+        school_ids = list(school_ids)
+        if not school_ids:
+            return set()
+
+        rows = db.session.query(School.id).filter(School.id.in_(school_ids))
+        return {row.id for row in rows}
+
     @staticmethod
     def create_school(
         name: str,
@@ -64,6 +329,7 @@ class SchoolRepository:
 
         db.session.add(school)
         db.session.commit()
+        school_count_cache.clear()
         return school
 
     @staticmethod
@@ -99,8 +365,88 @@ class SchoolRepository:
                 setattr(school, field, value)
 
         db.session.commit()
+        SchoolRepository.invalidate_cached([school_id])
+
+        if FILTERED_FIELDS.intersection(kwargs):
+            # Filtered totals may have changed
+            school_count_cache.clear()
+
         return school
 
+    @staticmethod
+    def patch_school(school_id: int, values: Dict[str, Any]) -> Optional[Any]:
+        """Update some fields of a live school in a single statement.
+
+        Runs one UPDATE ... WHERE id = ? AND deleted_at IS NULL RETURNING,
+        so the school is neither loaded before nor refreshed after the
+        write.
+
+        Args:
+            school_id: School's unique identifier.
+            values: School column values to set.
+
+        Returns:
+            Row with the SCHOOL_COLUMNS attributes plus version and
+            updated_at, None if the school does not exist or is deleted.
+        """
+        row = db.session.execute(
+            update(School)
+            .where(School.id == school_id, School.deleted_at.is_(None))
+            .values(**values)
+            .returning(*SCHOOL_COLUMNS, School.version, School.updated_at),
+            execution_options={"synchronize_session": False},
+        ).first()
+        db.session.commit()
+
+        if row is None:
+            return None
+
+        SchoolRepository.invalidate_cached([school_id])
+        if FILTERED_FIELDS.intersection(values):
+            # Filtered totals may have changed
+            school_count_cache.clear()
+
+        return row
+
+    @staticmethod
+    def bulk_create_schools(schools: List[Dict[str, Any]]) -> List[int]:
+        """Insert many schools with a multi-row statement.
+
+        Runs in the current transaction and does not commit, so the caller
+        decides the transaction boundaries.
+
+        Args:
+            schools: Dictionaries with School column values.
+
+        Returns:
+            IDs of the created schools, in the same order as schools.
+        """
+        if not schools:
+            return []
+
+        result = db.session.execute(
+            insert(School).returning(School.id, sort_by_parameter_order=True),
+            schools,
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    def bulk_update_schools(schools: List[Dict[str, Any]]) -> None:
+        """Update many schools by primary key without loading them.
+
+        Rows are grouped by the set of columns they change and each group is
+        sent as one executemany UPDATE. Runs in the current transaction and
+        does not commit; the caller invalidates the cached payloads with
+        invalidate_cached once the transaction is committed.
+
+        Args:
+            schools: Dictionaries with an "id" key plus the columns to change.
+        """
+        if not schools:
+            return
+
+        db.session.execute(update(School), schools)
+
     @staticmethod
     def soft_delete_school(school_id: int) -> bool:
         """Soft delete a school by setting deleted_at timestamp.
@@ -118,6 +464,8 @@ class SchoolRepository:
 
         school.deleted_at = datetime.utcnow()
         db.session.commit()
+        SchoolRepository.invalidate_cached([school_id])
+        school_count_cache.clear()
         return True
 
     @staticmethod
@@ -133,6 +481,7 @@ class SchoolRepository:
         school = (
             db.session.query(School)
             .filter(School.id == school_id, School.deleted_at.isnot(None))
+            .execution_options(include_deleted=True)
             .first()
         )
 
@@ -141,43 +490,161 @@ class SchoolRepository:
 
         school.deleted_at = None
         db.session.commit()
+        SchoolRepository.invalidate_cached([school_id])
+        school_count_cache.clear()
         return True
 
+    @staticmethod
+    def bulk_set_deleted(
+        deleted: bool,
+        filters: SchoolFilters,
+        school_ids: Optional[List[int]] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        """Soft delete or restore every school matching filters.
+
+        Each chunk selects up to n candidate IDs, then runs one UPDATE ...
+        WHERE id IN (...) RETURNING id, committed on its own so row locks are
+        held briefly. Rows leave the candidate set once updated, so the loop
+        stops when a selection comes back short; the UPDATE may change fewer
+        rows than were selected when another writer got there first, which
+        does not end the loop. No school is loaded into the session.
+
+        Args:
+            deleted: True to soft delete live schools, False to restore
+                deleted ones.
+            filters: Type and address filters; its deleted flags are ignored.
+            school_ids: Restrict the update to these IDs, None for all
+                schools matching filters.
+            chunk_size: Rows updated per statement.
+
+        Returns:
+            Number of schools changed.
+        """
+        current_state = (
+            School.deleted_at.is_(None) if deleted else School.deleted_at.isnot(None)
+        )
+        candidates = SchoolRepository._filtered_query(
+            replace(filters, include_deleted=True, only_deleted=False)
+        ).filter(current_state)
+
+        if school_ids is None:
+            # The same query yields the next chunk until nothing is left
+            chunks = repeat(candidates)
+        else:
+            unique_ids = sorted(set(school_ids))
+            chunks = (
+                candidates.filter(School.id.in_(unique_ids[start : start + chunk_size]))
+                for start in range(0, len(unique_ids), chunk_size)
+            )
+
+        affected = 0
+        for chunk in chunks:
+            chunk_ids = [
+                school_id
+                for (school_id,) in chunk.with_entities(School.id)
+                .order_by(School.id)
+                .limit(chunk_size)
+            ]
+            if not chunk_ids:
+                if school_ids is None:
+                    break
+                continue
+
+            changed = db.session.execute(
+                update(School)
+                # current_state is re-checked on the locked row: another
+                # writer may have changed it since the IDs were selected
+                .where(School.id.in_(chunk_ids), current_state)
+                .values(deleted_at=datetime.utcnow() if deleted else None)
+                .returning(School.id),
+                execution_options={"synchronize_session": False},
+            ).scalars().all()
+            db.session.commit()
+
+            SchoolRepository.invalidate_cached(changed)
+            affected += len(changed)
+
+            if school_ids is None and len(chunk_ids) < chunk_size:
+                break
+
+        if affected:
+            school_count_cache.clear()
+
+        return affected
+
     @staticmethod
     def get_paginated_schools(
-        page: int = 1, per_page: int = 20, include_deleted: bool = False
+        page: int = 1,
+        per_page: int = 20,
+        include_deleted: bool = False,
+        count: CountStrategy = CountStrategy.EXACT,
+        filters: Optional[SchoolFilters] = None,
+        fields: Optional[FrozenSet[str]] = None,
+        total: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get paginated list of schools.
 
         Args:
             page: Page number (1-based).
             per_page: Items per page.
-            include_deleted: Whether to include soft-deleted schools.
+            include_deleted: Whether to include soft-deleted schools; ignored
+                when filters are given.
+            count: Strategy used to compute the total.
+            filters: Type, address and deleted filters.
+            fields: Fields to load (see SCHOOL_FIELDS), None for all.
+            total: Exact total already known (see get_collection_state), so
+                no count is run.
 
         Returns:
-            Dictionary with schools list and pagination info.
+            Dictionary with schools list (rows with the SCHOOL_COLUMNS
+            attributes, or those of the requested fields) and pagination info.
         """
         page = max(1, int(page))
         per_page = min(max(1, int(per_page)), 100)  # Max 100 per page
 
-        query = db.session.query(School)
+        if filters is None:
+            filters = SchoolFilters(include_deleted=include_deleted)
 
-        if not include_deleted:
-            query = query.filter(School.deleted_at.is_(None))
+        # A total order keeps offset pages disjoint and walks the (name, id)
+        # indexes
+        query = (
+            SchoolRepository._filtered_query(filters)
+            .with_entities(*school_columns(fields))
+            .order_by(School.name, School.id)
+        )
 
-        paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+        return SchoolRepository._paginate(
+            query, page, per_page, count, cache_key=filters, total=total
+        )
 
-        return {
-            "schools": paginated.items,
-            "pagination": {
-                "page": page,
-                "per_page": per_page,
-                "total": paginated.total,
-                "pages": paginated.pages,
-                "has_next": paginated.has_next,
-                "has_prev": paginated.has_prev,
-            },
-        }
+    @staticmethod
+    def get_collection_state(filters: SchoolFilters) -> Tuple[int, Optional[datetime]]:
+        """Get the values that identify the current state of a listing.
+
+        The latest updated_at is taken over every school, deleted or not,
+        because a school that leaves the listing (soft delete, or a change
+        that no longer matches the filters) is no longer counted in it; any
+        write therefore moves it forward. Both values come from a single
+        query, and the count is also an exact total for the page.
+
+        Args:
+            filters: Type, address and deleted filters.
+
+        Returns:
+            Tuple (number of matching schools, latest updated_at of any
+            school or None).
+        """
+        # Core columns are not rewritten by the soft-delete filter
+        schools = School.__table__
+        last_change = select(func.max(schools.c.updated_at)).scalar_subquery()
+
+        total, last_modified = (
+            SchoolRepository._filtered_query(filters)
+            .with_entities(func.count(School.id), last_change)
+            .one()
+        )
+        return total, last_modified
 
     @staticmethod
     def get_schools_by_type_paginated(
@@ -185,6 +652,7 @@ class SchoolRepository:
         page: int = 1,
         per_page: int = 20,
         include_deleted: bool = False,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> Dict[str, Any]:
         """Get paginated list of schools filtered by type.
 
@@ -193,32 +661,178 @@ class SchoolRepository:
             page: Page number (1-based).
             per_page: Items per page.
             include_deleted: Whether to include soft-deleted schools.
+            count: Strategy used to compute the total.
 
         Returns:
-            Dictionary with schools list and pagination info.
+            Dictionary with schools list (rows with the SCHOOL_COLUMNS
+            attributes) and pagination info.
+        """
+        return SchoolRepository.get_paginated_schools(
+            page=page,
+            per_page=per_page,
+            count=count,
+            filters=SchoolFilters(
+                school_type=school_type, include_deleted=include_deleted
+            ),
+        )
+
+    @staticmethod
+    def get_schools_by_cursor(
+        cursor: Optional[str] = None,
+        per_page: int = 20,
+        include_deleted: bool = False,
+        school_type: Optional[SchoolType] = None,
+        filters: Optional[SchoolFilters] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get a page of schools using keyset (cursor) pagination.
+
+        Schools are ordered by (name, id) and the next page starts right
+        after the last row of the previous one, so the query walks the
+        ix_schools_name_id index instead of scanning and discarding an
+        OFFSET, and no COUNT(*) is issued. Schools are returned as rows
+        with the SCHOOL_COLUMNS attributes (or those of the requested fields).
+
+        Args:
+            cursor: Opaque cursor returned as next_cursor by the previous page.
+            per_page: Items per page.
+            include_deleted: Whether to include soft-deleted schools; ignored
+                when filters are given.
+            school_type: Optional school type to filter by; ignored when
+                filters are given.
+            filters: Type, address and deleted filters.
+            fields: Fields to load (see SCHOOL_FIELDS), None for all.
+
+        Returns:
+            Dictionary with schools list and cursor pagination info.
+
+        Raises:
+            ValueError: If the cursor is malformed.
         """
-        page = max(1, int(page))
         per_page = min(max(1, int(per_page)), 100)  # Max 100 per page
 
-        query = db.session.query(School).filter(School.school_type == school_type)
+        if filters is None:
+            filters = SchoolFilters(
+                school_type=school_type, include_deleted=include_deleted
+            )
+
+        query = SchoolRepository._filtered_query(filters).with_entities(
+            *school_columns(fields)
+        )
 
-        if not include_deleted:
-            query = query.filter(School.deleted_at.is_(None))
+        if cursor:
+            last_name, last_id = decode_cursor(cursor, size=2)
+            if not isinstance(last_name, str) or not isinstance(last_id, int):
+                raise ValueError("Invalid cursor")
+            query = query.filter(
+                tuple_(School.name, School.id) > tuple_(last_name, last_id)
+            )
 
-        paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+        rows = query.order_by(School.name, School.id).limit(per_page + 1).all()
+
+        has_next = len(rows) > per_page
+        schools = rows[:per_page]
+        next_cursor = (
+            encode_cursor(schools[-1].name, schools[-1].id) if has_next else None
+        )
 
         return {
-            "schools": paginated.items,
+            "schools": schools,
             "pagination": {
-                "page": page,
+                "mode": "cursor",
                 "per_page": per_page,
-                "total": paginated.total,
-                "pages": paginated.pages,
-                "has_next": paginated.has_next,
-                "has_prev": paginated.has_prev,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
             },
         }
 
+    @staticmethod
+    def search_schools(
+        query_text: str,
+        limit: int = 20,
+        include_deleted: bool = False,
+        school_id: Optional[int] = None,
+    ) -> List[Tuple[School, float]]:
+        """Search schools by name and address, ranked by relevance.
+
+        On PostgreSQL the search is accent-insensitive and typo tolerant
+        using trigram word similarity plus full-text ranking, both served by
+        GIN indexes. Other databases (e.g., SQLite in tests) fall back to
+        scoring the candidates in Python.
+
+        Args:
+            query_text: Text to search for.
+            limit: Maximum number of results.
+            include_deleted: Whether to include soft-deleted schools.
+            school_id: Restrict the search to this school (role scoping).
+
+        Returns:
+            List of (School, score) tuples, best matches first.
+        """
+        limit = min(max(1, int(limit)), 100)
+
+        query = db.session.query(School)
+
+        if school_id is not None:
+            query = query.filter(School.id == school_id)
+
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
+
+        if db.session.get_bind().dialect.name != "postgresql":
+            scored = []
+            for school in query:
+                score = fuzzy_score(
+                    query_text,
+                    [getattr(school, column.key) for column in SEARCH_COLUMNS],
+                )
+                if score >= 0.6:
+                    scored.append((school, score))
+            scored.sort(key=lambda item: (-item[1], item[0].name, item[0].id))
+            return scored[:limit]
+
+        document = _search_document()
+        normalized = func.f_unaccent(func.lower(query_text))
+        ts_query = func.plainto_tsquery(literal_column("'simple'"), normalized)
+        ts_vector = func.to_tsvector(literal_column("'simple'"), document)
+        score = func.greatest(
+            func.word_similarity(normalized, document),
+            func.ts_rank(ts_vector, ts_query),
+        ).label("score")
+
+        rows = (
+            query.add_columns(score)
+            .filter(normalized.op("<%")(document) | ts_vector.op("@@")(ts_query))
+            .order_by(score.desc(), School.name, School.id)
+            .limit(limit)
+            .all()
+        )
+        return [(school, float(row_score)) for school, row_score in rows]
+
+    @staticmethod
+    def iter_schools(filters: SchoolFilters, batch_size: int = 1000) -> Iterator[Any]:
+        """Stream school rows ordered by ID.
+
+        Rows are plain column tuples (see SCHOOL_COLUMNS), not School
+        objects, and are fetched from a server-side cursor ``batch_size`` at a
+        time, so memory use does not grow with the table and nothing is kept
+        in the session identity map.
+
+        Args:
+            filters: Type, address and deleted filters.
+            batch_size: Rows fetched from the cursor at a time.
+
+        Returns:
+            Iterator of rows with the SCHOOL_COLUMNS attributes.
+        """
+        query = (
+            SchoolRepository._filtered_query(filters)
+            .with_entities(*SCHOOL_COLUMNS)
+            .order_by(School.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return iter(query)
+
     @staticmethod
     def get_all_schools(include_deleted: bool = False) -> List[School]:
         """Get all schools (not paginated).
@@ -231,7 +845,7 @@ class SchoolRepository:
         """
         query = db.session.query(School)
 
-        if not include_deleted:
-            query = query.filter(School.deleted_at.is_(None))
+        if include_deleted:
+            query = query.execution_options(include_deleted=True)
 
         return query.all()
@@ -0,0 +1,156 @@
+import math
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.config.db_config import db
+from src.domain.enums.class_grade import ClassGrade
+from src.models.school import School
+from src.models.seat_summary import SeatSummary
+
+# Columns of the statewide availability projection, in the order expected by
+# src.utils.serializers.serialize_seat_row
+VAGAS_COLUMNS = (
+    SeatSummary.school_id,
+    School.name,
+    School.address_city,
+    School.address_state,
+    SeatSummary.class_grade,
+    SeatSummary.capacity,
+    SeatSummary.enrolled,
+    SeatSummary.held,
+)
+
+
+class SeatRepository:
+    @staticmethod
+    def apply_delta(
+        school_id: int,
+        class_grade: ClassGrade,
+        capacity: int = 0,
+        enrolled: int = 0,
+        held: int = 0,
+    ) -> None:
+        """Add seat changes to the summary of a school and grade.
+
+        Runs one INSERT ... ON CONFLICT DO UPDATE that adds the deltas to
+        the current totals, creating the summary row the first time the
+        school gets a class of the grade. Runs in the current transaction
+        and does not commit, so the summary changes together with the class
+        or enrollment that caused them.
+
+        Args:
+            school_id: School's unique identifier.
+            class_grade: Grade of the changed class.
+            capacity: Seats added (negative when removed).
+            enrolled: Enrollments added (negative when removed).
+            held: Held seats added (negative when released).
+        """
+        if not capacity and not enrolled and not held:
+            return
+
+        dialect = db.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        statement = insert(SeatSummary).values(
+            school_id=school_id,
+            class_grade=class_grade,
+            capacity=capacity,
+            enrolled=enrolled,
+            held=held,
+        )
+        db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[SeatSummary.school_id, SeatSummary.class_grade],
+                set_={
+                    "capacity": SeatSummary.capacity + statement.excluded.capacity,
+                    "enrolled": SeatSummary.enrolled + statement.excluded.enrolled,
+                    "held": SeatSummary.held + statement.excluded.held,
+                },
+            )
+        )
+
+    @staticmethod
+    def get_school_seats(school_id: int) -> List[Any]:
+        """Get the seat summary of a school, one row per grade.
+
+        Args:
+            school_id: School's unique identifier.
+
+        Returns:
+            Rows with class_grade, capacity, enrolled and held, ordered by
+            grade;
+            grades whose classes were all removed are left out.
+        """
+        return (
+            db.session.query(
+                SeatSummary.class_grade,
+                SeatSummary.capacity,
+                SeatSummary.enrolled,
+                SeatSummary.held,
+            )
+            .filter(SeatSummary.school_id == school_id, SeatSummary.capacity > 0)
+            .order_by(SeatSummary.class_grade)
+            .all()
+        )
+
+    @staticmethod
+    def get_available_seats(
+        class_grade: Optional[ClassGrade] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> Dict[str, Any]:
+        """Get the live schools with free seats, statewide.
+
+        Reads seat_summaries joined to schools by primary key; deleted
+        schools are left out by the soft-delete criteria. Seats held by
+        unconfirmed reservations are not free.
+
+        Args:
+            class_grade: Only this grade, None for all grades.
+            city: Exact city name, None for any city.
+            state: State abbreviation, None for any state.
+            page: Page number (1-based).
+            per_page: Items per page.
+
+        Returns:
+            Dictionary with the seat rows (VAGAS_COLUMNS attributes), ordered
+            by school name, and pagination info.
+        """
+        page = max(1, int(page))
+        per_page = min(max(1, int(per_page)), 100)  # Max 100 per page
+
+        query = (
+            db.session.query(*VAGAS_COLUMNS)
+            .join(School, School.id == SeatSummary.school_id)
+            .filter(SeatSummary.enrolled + SeatSummary.held < SeatSummary.capacity)
+        )
+
+        if class_grade is not None:
+            query = query.filter(SeatSummary.class_grade == class_grade)
+        if city:
+            query = query.filter(School.address_city == city)
+        if state:
+            query = query.filter(School.address_state == state)
+
+        total = query.order_by(None).count()
+        rows = (
+            query.order_by(School.name, SeatSummary.school_id, SeatSummary.class_grade)
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+            .all()
+        )
+
+        return {
+            "vagas": rows,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "pages": math.ceil(total / per_page),
+                "has_next": page * per_page < total,
+                "has_prev": page > 1,
+            },
+        }
@@ -0,0 +1,300 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from src.config.db_config import db
+from src.domain.enums.reservation_status import ReservationStatus
+from src.models.enrollment import Enrollment
+from src.models.school_class import SchoolClass
+from src.models.seat_reservation import SeatReservation
+from src.repositories.school_class_repository import ClassFullError
+from src.repositories.seat_repository import SeatRepository
+
+# Columns of the reservation projection, in the order expected by
+# src.utils.serializers.serialize_reservation_row
+RESERVATION_COLUMNS = (
+    SeatReservation.id,
+    SeatReservation.school_class_id,
+    SeatReservation.student_name,
+    SeatReservation.status,
+    SeatReservation.expires_at,
+    SeatReservation.enrollment_id,
+)
+
+
+class ReservationConflictError(Exception):
+    """Raised when a reservation ID is already used for another class."""
+
+
+class ReservationStateError(Exception):
+    """Raised when a reservation cannot move to the requested status.
+
+    The argument is the current ReservationStatus.
+    """
+
+
+class SeatReservationRepository:
+    @staticmethod
+    def find_row(reservation_id: str) -> Optional[Any]:
+        """Get a reservation by ID.
+
+        Args:
+            reservation_id: Client-chosen reservation ID.
+
+        Returns:
+            Row with the RESERVATION_COLUMNS attributes, None if not found.
+        """
+        return (
+            db.session.query(*RESERVATION_COLUMNS)
+            .filter(SeatReservation.id == reservation_id)
+            .first()
+        )
+
+    @staticmethod
+    def _take_seat(class_id: int) -> bool:
+        # Conditional increment: the row lock and the capacity check are one
+        # statement, so concurrent holds queue on the row and never oversell
+        row = db.session.execute(
+            update(SchoolClass)
+            .where(
+                SchoolClass.id == class_id,
+                SchoolClass.enrolled + SchoolClass.held < SchoolClass.capacity,
+            )
+            .values(held=SchoolClass.held + 1)
+            .returning(SchoolClass.school_id, SchoolClass.class_grade),
+            execution_options={"synchronize_session": False},
+        ).first()
+        if row is None:
+            return False
+
+        SeatRepository.apply_delta(row.school_id, row.class_grade, held=1)
+        return True
+
+    @staticmethod
+    def hold(
+        class_id: int, reservation_id: str, student_name: str, expires_at: datetime
+    ) -> Tuple[Any, bool]:
+        """Hold one seat of a class, idempotently.
+
+        Retrying with the same reservation ID returns the existing
+        reservation instead of holding another seat. When the class looks
+        full, its expired holds are released and the seat is tried again.
+
+        Args:
+            class_id: Class's unique identifier.
+            reservation_id: Client-chosen reservation ID.
+            student_name: Name of the student.
+            expires_at: When the hold lapses if not confirmed (naive UTC).
+
+        Returns:
+            Tuple (reservation row, True if it was created by this call).
+
+        Raises:
+            ReservationConflictError: If the ID belongs to another class.
+            ClassFullError: If the class has no free seat.
+        """
+        existing = SeatReservationRepository.find_row(reservation_id)
+        if existing is not None:
+            if existing.school_class_id != class_id:
+                raise ReservationConflictError(reservation_id)
+            return existing, False
+
+        if not SeatReservationRepository._take_seat(class_id):
+            db.session.rollback()
+            if not SeatReservationRepository.release_expired(class_id) or (
+                not SeatReservationRepository._take_seat(class_id)
+            ):
+                db.session.rollback()
+                raise ClassFullError(class_id)
+
+        db.session.add(
+            SeatReservation(
+                id=reservation_id,
+                school_class_id=class_id,
+                student_name=student_name,
+                status=ReservationStatus.HELD,
+                expires_at=expires_at,
+            )
+        )
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent retry with the same ID won; its seat is the one kept
+            db.session.rollback()
+            existing = SeatReservationRepository.find_row(reservation_id)
+            if existing is None or existing.school_class_id != class_id:
+                raise ReservationConflictError(reservation_id)
+            return existing, False
+
+        return SeatReservationRepository.find_row(reservation_id), True
+
+    @staticmethod
+    def confirm(school_id: int, class_id: int, reservation_id: str) -> Optional[Any]:
+        """Turn a live hold into an enrollment, idempotently.
+
+        The held seat becomes an enrolled one (held - 1, enrolled + 1), so
+        confirming never needs a free seat and cannot oversell.
+
+        Args:
+            school_id: School's unique identifier, for the seat summary.
+            class_id: Class's unique identifier.
+            reservation_id: Client-chosen reservation ID.
+
+        Returns:
+            The confirmed reservation row (also when it was already
+            confirmed), None if not found in this class.
+
+        Raises:
+            ReservationStateError: If the hold expired or was cancelled.
+        """
+        confirmed = db.session.execute(
+            update(SeatReservation)
+            .where(
+                SeatReservation.id == reservation_id,
+                SeatReservation.school_class_id == class_id,
+                SeatReservation.status == ReservationStatus.HELD,
+                SeatReservation.expires_at > datetime.utcnow(),
+            )
+            .values(status=ReservationStatus.CONFIRMED)
+            .returning(SeatReservation.student_name),
+            execution_options={"synchronize_session": False},
+        ).first()
+
+        if confirmed is None:
+            db.session.rollback()
+            existing = SeatReservationRepository.find_row(reservation_id)
+            if existing is None or existing.school_class_id != class_id:
+                return None
+            if existing.status == ReservationStatus.CONFIRMED:
+                return existing
+            if existing.status == ReservationStatus.HELD:
+                # Lapsed but not swept yet
+                SeatReservationRepository.release_expired(class_id)
+                raise ReservationStateError(ReservationStatus.EXPIRED)
+            raise ReservationStateError(existing.status)
+
+        seat = db.session.execute(
+            update(SchoolClass)
+            .where(SchoolClass.id == class_id)
+            .values(held=SchoolClass.held - 1, enrolled=SchoolClass.enrolled + 1)
+            .returning(SchoolClass.class_grade),
+            execution_options={"synchronize_session": False},
+        ).first()
+
+        enrollment = Enrollment(
+            school_class_id=class_id, student_name=confirmed.student_name
+        )
+        db.session.add(enrollment)
+        db.session.flush()
+
+        db.session.execute(
+            update(SeatReservation)
+            .where(SeatReservation.id == reservation_id)
+            .values(enrollment_id=enrollment.id),
+            execution_options={"synchronize_session": False},
+        )
+        SeatRepository.apply_delta(school_id, seat.class_grade, enrolled=1, held=-1)
+        db.session.commit()
+
+        return SeatReservationRepository.find_row(reservation_id)
+
+    @staticmethod
+    def cancel(class_id: int, reservation_id: str) -> Optional[Any]:
+        """Release a held seat, idempotently.
+
+        Args:
+            class_id: Class's unique identifier.
+            reservation_id: Client-chosen reservation ID.
+
+        Returns:
+            The reservation row (also when it was already cancelled or had
+            expired), None if not found in this class.
+
+        Raises:
+            ReservationStateError: If the reservation was already confirmed.
+        """
+        cancelled = db.session.execute(
+            update(SeatReservation)
+            .where(
+                SeatReservation.id == reservation_id,
+                SeatReservation.school_class_id == class_id,
+                SeatReservation.status == ReservationStatus.HELD,
+            )
+            .values(status=ReservationStatus.CANCELLED)
+            .returning(SeatReservation.id),
+            execution_options={"synchronize_session": False},
+        ).first()
+
+        if cancelled is None:
+            db.session.rollback()
+            existing = SeatReservationRepository.find_row(reservation_id)
+            if existing is None or existing.school_class_id != class_id:
+                return None
+            if existing.status == ReservationStatus.CONFIRMED:
+                raise ReservationStateError(existing.status)
+            return existing
+
+        seat = db.session.execute(
+            update(SchoolClass)
+            .where(SchoolClass.id == class_id)
+            .values(held=SchoolClass.held - 1)
+            .returning(SchoolClass.school_id, SchoolClass.class_grade),
+            execution_options={"synchronize_session": False},
+        ).first()
+        SeatRepository.apply_delta(seat.school_id, seat.class_grade, held=-1)
+        db.session.commit()
+
+        return SeatReservationRepository.find_row(reservation_id)
+
+    @staticmethod
+    def release_expired(class_id: Optional[int] = None) -> int:
+        """Expire lapsed holds and give their seats back.
+
+        Flipping the status is what claims a hold, so concurrent sweeps
+        never release the same seat twice.
+
+        Args:
+            class_id: Only sweep this class, None for every class.
+
+        Returns:
+            Number of holds released.
+        """
+        statement = update(SeatReservation).where(
+            SeatReservation.status == ReservationStatus.HELD,
+            SeatReservation.expires_at <= datetime.utcnow(),
+        )
+        if class_id is not None:
+            statement = statement.where(SeatReservation.school_class_id == class_id)
+
+        expired = Counter(
+            db.session.execute(
+                statement.values(status=ReservationStatus.EXPIRED).returning(
+                    SeatReservation.school_class_id
+                ),
+                execution_options={"synchronize_session": False},
+            ).scalars()
+        )
+
+        # Lock classes in ID order, then summaries in key order, so
+        # concurrent sweeps and holds cannot deadlock
+        released: Counter = Counter()
+        for expired_class_id in sorted(expired):
+            seat = db.session.execute(
+                update(SchoolClass)
+                .where(SchoolClass.id == expired_class_id)
+                .values(held=SchoolClass.held - expired[expired_class_id])
+                .returning(SchoolClass.school_id, SchoolClass.class_grade),
+                execution_options={"synchronize_session": False},
+            ).first()
+            released[seat.school_id, seat.class_grade] += expired[expired_class_id]
+
+        for (school_id, class_grade), count in sorted(
+            released.items(), key=lambda item: (item[0][0], item[0][1].value)
+        ):
+            SeatRepository.apply_delta(school_id, class_grade, held=-count)
+        db.session.commit()
+
+        return sum(expired.values())
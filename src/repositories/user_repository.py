@@ -1,7 +1,54 @@
-from typing import Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 
 from src.config.db_config import db
+from src.models.associations import roles_users
+from src.models.role import Role
 from src.models.user import User
+from src.repositories.role_registry import role_registry
+
+
+# Columns of the user projection returned by listings, in the order expected
+# by src.utils.serializers.serialize_user_row
+USER_COLUMNS = (User.id, User.name, User.email, User.school_id)
+
+# Column loaded for each field of USER_FIELDS (roles come from roles_users)
+USER_FIELD_COLUMNS = {
+    "id": User.id,
+    "name": User.name,
+    "email": User.email,
+    "school_id": User.school_id,
+}
+
+
+def user_columns(fields: Optional[FrozenSet[str]] = None) -> Tuple[Any, ...]:
+    """Columns to select for the requested user fields.
+
+    id and school_id are always selected: they key roles and includes.
+
+    Args:
+        fields: Requested fields, None for all.
+
+    Returns:
+        Tuple of User columns.
+    """
+    if fields is None:
+        return USER_COLUMNS
+    return tuple(
+        column
+        for field, column in USER_FIELD_COLUMNS.items()
+        if field in fields or field in ("id", "school_id")
+    )
+
+
+class DuplicateEmailError(Exception):
+    """Raised when a user is created with an email that is already registered."""
+
+
+class RoleNotFoundError(Exception):
+    """Raised when a user is created with a role that does not exist."""
 
 
 class UserRepository:
@@ -54,6 +101,78 @@ class UserRepository:
         db.session.commit()
         return user
 
+    @staticmethod
+    def create_user_with_role(
+        name: str, email: str, hashed_password: str, school_id: int, role_name: str
+    ) -> User:
+        """Create a user and link it to a role in a single transaction.
+
+        The role id comes from the role registry, so the user INSERT and the
+        roles_users INSERT are the only statements and share one commit.
+        Duplicate emails are detected from the unique constraint, so
+        concurrent registrations with the same email cannot both succeed.
+
+        Args:
+            name: User's full name.
+            email: User's email address.
+            hashed_password: Pre-hashed password.
+            school_id: ID of the school the user belongs to.
+            role_name: Name of the role to assign.
+
+        Returns:
+            Created User object (detached from the session, with its columns loaded).
+
+        Raises:
+            DuplicateEmailError: If the email is already registered.
+            RoleNotFoundError: If the role does not exist.
+        """
+        role_id = role_registry.get_id(role_name)
+        if role_id is None:
+            raise RoleNotFoundError(role_name)
+
+        user = User(
+            name=name,  # pyright: ignore[reportCallIssue]
+            email=email,  # pyright: ignore[reportCallIssue]
+            hash_password=hashed_password,  # pyright: ignore[reportCallIssue]
+            school_id=school_id,  # pyright: ignore[reportCallIssue]
+        )
+        db.session.add(user)
+
+        try:
+            db.session.flush()
+            db.session.execute(
+                insert(roles_users).values(user_id=user.id, role_id=role_id)
+            )
+        except IntegrityError:
+            db.session.rollback()
+            if UserRepository.find_by_email(email):
+                raise DuplicateEmailError(email)
+            raise
+
+        # Keep the loaded columns usable after commit without a refresh query
+        db.session.expunge(user)
+        db.session.commit()
+        return user
+
+    @staticmethod
+    def update_password_hash(user_id: int, hashed_password: str) -> bool:
+        """Replace the stored password hash of a user.
+
+        Args:
+            user_id: User's unique identifier.
+            hashed_password: New pre-hashed password.
+
+        Returns:
+            True if the user was updated, False if not found.
+        """
+        updated = (
+            db.session.query(User)
+            .filter(User.id == user_id)
+            .update({User.hash_password: hashed_password}, synchronize_session=False)
+        )
+        db.session.commit()
+        return bool(updated)
+
     @staticmethod
     def add_role_to_user(user_id: int, role_name: str) -> bool:
         """Assign a role to a user.
@@ -65,19 +184,67 @@ class UserRepository:
         Returns:
             True if role was assigned successfully, False if user or role not found.
         """
-        from src.models.role import Role
-
-        user = db.session.query(User).filter(User.id == user_id).first()
-        role = db.session.query(Role).filter(Role.name == role_name).first()
+        role_id = role_registry.get_id(role_name)
+        if role_id is None:
+            return False
 
-        if not user or not role:
+        user_exists = db.session.query(
+            db.session.query(User.id).filter(User.id == user_id).exists()
+        ).scalar()
+        if not user_exists:
             return False
 
-        if role not in user.roles:
-            user.roles.append(role)
+        try:
+            db.session.execute(
+                insert(roles_users).values(user_id=user_id, role_id=role_id)
+            )
             db.session.commit()
+        except IntegrityError:
+            # User already has the role
+            db.session.rollback()
         return True
 
+    @staticmethod
+    def add_role_to_users(user_ids: Iterable[int], role_name: str) -> int:
+        """Assign a role to many users with one multi-row INSERT.
+
+        Users that already have the role are skipped. Runs in the current
+        transaction and does not commit.
+
+        Args:
+            user_ids: IDs of the users.
+            role_name: Name of the role to assign.
+
+        Returns:
+            Number of role links created.
+
+        Raises:
+            RoleNotFoundError: If the role does not exist.
+        """
+        role_id = role_registry.get_id(role_name)
+        if role_id is None:
+            raise RoleNotFoundError(role_name)
+
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return 0
+
+        existing = {
+            row.user_id
+            for row in db.session.query(roles_users.c.user_id).filter(
+                roles_users.c.role_id == role_id,
+                roles_users.c.user_id.in_(user_ids),
+            )
+        }
+        missing = [user_id for user_id in user_ids if user_id not in existing]
+
+        if missing:
+            db.session.execute(
+                insert(roles_users),
+                [{"user_id": user_id, "role_id": role_id} for user_id in missing],
+            )
+        return len(missing)
+
     @staticmethod
     def get_all_users():
         """Retrieve all users from the database.
@@ -86,3 +253,174 @@ class UserRepository:
             List of all User objects.
         """
         return db.session.query(User).all()
+
+    @staticmethod
+    def get_paginated_users(
+        page: int = 1,
+        per_page: int = 20,
+        school_id: Optional[int] = None,
+        role_name: Optional[str] = None,
+        name: Optional[str] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get a filtered, paginated list of users with their roles.
+
+        Filtering and pagination run in SQL and only the listed columns are
+        selected, as plain rows with the USER_COLUMNS attributes; the role
+        names of the whole page are fetched with a single extra query, so the
+        cost follows the page size instead of the size of the users table.
+
+        Args:
+            page: Page number (1-based).
+            per_page: Items per page.
+            school_id: Only return users from this school.
+            role_name: Only return users that have this role.
+            name: Case-insensitive substring to match against the user name.
+            fields: Fields to load (see USER_FIELDS), None for all. Roles
+                are only queried when requested.
+
+        Returns:
+            Dictionary with users list, role names by user ID ("roles") and
+            pagination info.
+        """
+        page = max(1, int(page))
+        per_page = min(max(1, int(per_page)), 100)  # Max 100 per page
+
+        query = db.session.query(*user_columns(fields))
+
+        if school_id is not None:
+            query = query.filter(User.school_id == school_id)
+
+        if role_name:
+            query = query.filter(User.roles.any(Role.name == role_name))
+
+        if name:
+            query = query.filter(User.name.icontains(name, autoescape=True))
+
+        query = query.order_by(User.id)
+
+        paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+
+        user_ids = [row.id for row in paginated.items]
+        if fields is None or "roles" in fields:
+            roles = UserRepository.get_role_names(user_ids)
+        else:
+            roles = {user_id: [] for user_id in user_ids}
+
+        return {
+            "users": paginated.items,
+            "roles": roles,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total": paginated.total,
+                "pages": paginated.pages,
+                "has_next": paginated.has_next,
+                "has_prev": paginated.has_prev,
+            },
+        }
+
+    @staticmethod
+    def get_role_names(user_ids: Iterable[int]) -> Dict[int, List[str]]:
+        """Get the role names of many users with one query.
+
+        Args:
+            user_ids: User IDs.
+
+        Returns:
+            Dictionary mapping each user ID to its role names.
+        """
+        roles: Dict[int, List[str]] = {user_id: [] for user_id in user_ids}
+        if not roles:
+            return roles
+
+        rows = (
+            db.session.query(roles_users.c.user_id, Role.name)
+            .join(Role, Role.id == roles_users.c.role_id)
+            .filter(roles_users.c.user_id.in_(list(roles)))
+            .order_by(roles_users.c.user_id, Role.id)
+        )
+        for user_id, role in rows:
+            roles[user_id].append(role)
+        return roles
+
+    @staticmethod
+    def get_by_school_ids(school_ids: Iterable[int]) -> Dict[int, List[Any]]:
+        """Get the users of many schools with one query.
+
+        Args:
+            school_ids: School IDs.
+
+        Returns:
+            Dictionary mapping each school ID to its user rows (with the
+            USER_COLUMNS attributes), ordered by ID.
+        """
+        users: Dict[int, List[Any]] = {school_id: [] for school_id in school_ids}
+        if not users:
+            return users
+
+        rows = (
+            db.session.query(*USER_COLUMNS)
+            .filter(User.school_id.in_(list(users)))
+            .order_by(User.id)
+        )
+        for row in rows:
+            users[row.school_id].append(row)
+        return users
+
+    @staticmethod
+    def find_existing_emails(emails: Iterable[str]) -> Set[str]:
+        """Find which of the given emails are already registered.
+
+        Args:
+            emails: Email addresses to check.
+
+        Returns:
+            Set with the emails that already belong to a user.
+        """
+        emails = list(emails)
+        if not emails:
+            return set()
+
+        rows = db.session.query(User.email).filter(User.email.in_(emails))
+        return {row.email for row in rows}
+
+    @staticmethod
+    def bulk_create_users(users: List[Dict[str, Any]]) -> List[int]:
+        """Insert many users and their role links with multi-row statements.
+
+        Runs in the current transaction and does not commit, so the caller
+        decides the transaction boundaries.
+
+        Args:
+            users: Dictionaries with name, email, hash_password, school_id
+                and role_id keys.
+
+        Returns:
+            IDs of the created users, in the same order as users.
+        """
+        if not users:
+            return []
+
+        result = db.session.execute(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": user["name"],
+                    "email": user["email"],
+                    "hash_password": user["hash_password"],
+                    "school_id": user["school_id"],
+                }
+                for user in users
+            ],
+        )
+        user_ids = list(result.scalars())
+
+        db.session.execute(
+            insert(roles_users),
+            [
+                {"user_id": user_id, "role_id": user["role_id"]}
+                for user_id, user in zip(user_ids, users)
+            ],
+        )
+        return user_ids
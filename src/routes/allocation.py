@@ -0,0 +1,216 @@
+import secrets
+
+from flask import Blueprint, jsonify, request
+
+from src.domain.enums.allocation_status import AllocationStatus
+from src.repositories.allocation_repository import AllocationRepository
+from src.services.allocation_jobs import allocation_jobs
+from src.services.allocation_service import (
+    MAX_APPLICANTS_PER_REQUEST,
+    AllocationService,
+)
+from src.utils.decorators import admin_secretaria_only
+from src.utils.serializers import (
+    serialize_allocation_round_row,
+    serialize_applicant_row,
+)
+
+allocation_bp = Blueprint("allocation", __name__, url_prefix="/api/allocation")
+
+# Rounds that still accept applicants and can be (re)started
+OPEN_STATUSES = (AllocationStatus.PENDING, AllocationStatus.FAILED)
+
+
+def _round_not_found():
+    return jsonify(msg="Rodada não encontrada"), 404
+
+
+@allocation_bp.route("/rounds", methods=["POST"])
+@admin_secretaria_only
+def create_round():
+    """Create an allocation round for a grade.
+
+    Only accessible to admin_secretaria.
+
+    Expected JSON body:
+        {
+            "name": str,
+            "class_grade": str or int (FISRT_YEAR/1, SECOND_YEAR/2, THIRD_YEAR/3)
+        }
+
+    Returns:
+        201: Round created successfully with round data
+        400: Invalid data or missing required fields
+        403: Access denied (not admin_secretaria)
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    round_id, error = AllocationService.create_round(data)
+
+    if error:
+        return jsonify(msg=error), 400
+
+    row = AllocationRepository.find_round_row(round_id)
+    return jsonify(
+        {"msg": "Rodada criada com sucesso", "round": serialize_allocation_round_row(row)}
+    ), 201
+
+
+@allocation_bp.route("/rounds/<int:round_id>/applicants", methods=["POST"])
+@admin_secretaria_only
+def add_applicants(round_id):
+    """Add applicants with their ranked school choices to a round.
+
+    Only accessible to admin_secretaria. Large rounds are uploaded in
+    several requests; a request is stored entirely or not at all.
+
+    Expected JSON body:
+        {
+            "applicants": [
+                {
+                    "student_name": str,
+                    "priority": int (optional, default 0),
+                    "preferences": [int or {"school_id": int, "bonus": int}, ...]
+                },
+                ...
+            ]
+        }
+
+    Args:
+        round_id: ID of the round
+
+    Returns:
+        201: IDs of the created applicants, in order
+        400: Invalid data or too many applicants
+        403: Access denied (not admin_secretaria)
+        404: Round not found
+        409: Round is running or already done
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict) or not isinstance(data.get("applicants"), list):
+        return jsonify(msg="Campo 'applicants' deve ser uma lista"), 400
+
+    items = data["applicants"]
+    if len(items) > MAX_APPLICANTS_PER_REQUEST:
+        return jsonify(
+            msg=f"Máximo de {MAX_APPLICANTS_PER_REQUEST} candidatos por requisição"
+        ), 400
+
+    row = AllocationRepository.find_round_row(round_id)
+    if row is None:
+        return _round_not_found()
+    if row.status not in OPEN_STATUSES:
+        return jsonify(msg="Rodada não aceita novos candidatos"), 409
+
+    applicant_ids, error = AllocationService.add_applicants(round_id, items)
+
+    if error:
+        return jsonify(msg=error), 400
+
+    return jsonify(msg="Candidatos adicionados com sucesso", ids=applicant_ids), 201
+
+
+@allocation_bp.route("/rounds/<int:round_id>/run", methods=["POST"])
+@admin_secretaria_only
+def run_round(round_id):
+    """Start solving a round in the background.
+
+    Only accessible to admin_secretaria. Poll GET /rounds/<id> for the
+    progress. The same seed and data always give the same allocation. A
+    round left running by a process that died can be started again after
+    ALLOCATION_TIMEOUT seconds.
+
+    Expected JSON body (optional):
+        {"seed": int (lottery seed; random when omitted)}
+
+    Args:
+        round_id: ID of the round
+
+    Returns:
+        202: Round started, with round data
+        400: Invalid seed
+        403: Access denied (not admin_secretaria)
+        404: Round not found
+        409: Round is already running or done
+    """
+    data = request.get_json(silent=True) or {}
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    seed = data.get("seed")
+    if seed is None:
+        seed = secrets.randbits(63)
+    elif isinstance(seed, bool) or not isinstance(seed, int) or not 0 <= seed < 2**63:
+        return jsonify(msg="Campo 'seed' deve ser um inteiro não negativo"), 400
+
+    started_at = AllocationRepository.claim_round(
+        round_id, seed, allocation_jobs.timeout
+    )
+    if started_at is None:
+        if AllocationRepository.find_round_row(round_id) is None:
+            return _round_not_found()
+        return jsonify(msg="Rodada já em execução ou concluída"), 409
+
+    allocation_jobs.submit(round_id, started_at)
+
+    row = AllocationRepository.find_round_row(round_id)
+    return jsonify(
+        {"msg": "Alocação iniciada", "round": serialize_allocation_round_row(row)}
+    ), 202
+
+
+@allocation_bp.route("/rounds/<int:round_id>", methods=["GET"])
+@admin_secretaria_only
+def get_round(round_id):
+    """Get a round with its status, progress and totals.
+
+    Args:
+        round_id: ID of the round
+
+    Returns:
+        200: Round data
+        403: Access denied (not admin_secretaria)
+        404: Round not found
+    """
+    row = AllocationRepository.find_round_row(round_id)
+    if row is None:
+        return _round_not_found()
+
+    return jsonify(round=serialize_allocation_round_row(row)), 200
+
+
+@allocation_bp.route("/rounds/<int:round_id>/results", methods=["GET"])
+@admin_secretaria_only
+def get_results(round_id):
+    """List the applicants of a round with the class each one got.
+
+    Query parameters:
+        page: Page number (default: 1)
+        per_page: Items per page (default: 100, max: 1000)
+
+    Args:
+        round_id: ID of the round
+
+    Returns:
+        200: Applicants with school_class_id, school_id and assigned_rank
+            (null when not allocated) and pagination info
+        403: Access denied (not admin_secretaria)
+        404: Round not found
+    """
+    if AllocationRepository.find_round_row(round_id) is None:
+        return _round_not_found()
+
+    result = AllocationRepository.get_results(
+        round_id,
+        page=request.args.get("page", 1, type=int),
+        per_page=request.args.get("per_page", 100, type=int),
+    )
+    return jsonify(
+        applicants=[serialize_applicant_row(row) for row in result["applicants"]],
+        pagination=result["pagination"],
+    ), 200
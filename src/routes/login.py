@@ -1,7 +1,11 @@
 from flask import Blueprint, request, jsonify
+from flask_jwt_extended import decode_token, jwt_required
 from src.repositories.user_repository import UserRepository
-from src.services.auth_service import generate_token
-from src.utils.password_utils import verify_password
+from src.services.auth_context import get_auth_context
+from src.services.auth_service import generate_refresh_token, generate_token
+from src.services.token_revocation import revocation_store
+from src.utils.hash_pool import HashPoolBusyError, hash_pool
+from src.utils.password_utils import verify_and_update_password
 
 login_bp = Blueprint("login", __name__, url_prefix="/login")
 
@@ -17,10 +21,11 @@ def login():
         }
 
     Returns:
-        200: Login successful with JWT token, user info, roles, and school_id
+        200: Login successful with access and refresh tokens, user info, roles, and school_id
         400: Missing email or password in request
         401: Invalid credentials (user not found or wrong password)
         403: User has no role assigned
+        503: Password hashing queue is full, retry later
     """
     data = request.get_json()
 
@@ -35,19 +40,94 @@ def login():
     if not user:
         return jsonify(msg="Credenciais inválidas"), 401
 
-    if not verify_password(password, user.hash_password):
+    try:
+        password_ok, new_hash = hash_pool.run(
+            verify_and_update_password, password, user.hash_password
+        )
+    except HashPoolBusyError:
+        return jsonify(msg="Servidor ocupado, tente novamente"), 503, {
+            "Retry-After": "1"
+        }
+
+    if not password_ok:
         return jsonify(msg="Credenciais inválidas"), 401
 
+    if new_hash:
+        # Stored hash uses an outdated scheme or cost; upgrade it transparently
+        UserRepository.update_password_hash(user.id, new_hash)
+
     if not user.roles:
         return jsonify(msg="Usuário não possui role atribuída"), 403
 
     token = generate_token(user)
+    refresh_token = generate_refresh_token(user)
 
     return jsonify(
         {
             "access_token": token,
+            "refresh_token": refresh_token,
             "user": user.to_dict(),
             "roles": [role.name for role in user.roles],
             "school_id": user.school_id,
         }
     ), 200
+
+
+@login_bp.route("/refresh", methods=["POST"])
+@jwt_required(refresh=True)
+def refresh():
+    """Exchange a refresh token for a new access token.
+
+    Expects the refresh token in the Authorization header. Roles and
+    school_id are read again from the database, so role changes take effect
+    on the next refresh.
+
+    Returns:
+        200: New access token
+        401: Missing, expired or revoked refresh token, or user no longer exists
+        403: User has no role assigned
+    """
+    user = UserRepository.find_by_id(get_auth_context().user_id)
+
+    if not user:
+        return jsonify(msg="Usuário não encontrado"), 401
+
+    if not user.roles:
+        return jsonify(msg="Usuário não possui role atribuída"), 403
+
+    return jsonify({"access_token": generate_token(user)}), 200
+
+
+@login_bp.route("/logout", methods=["POST"])
+@jwt_required(verify_type=False)
+def logout():
+    """Revoke the token used in the request.
+
+    Optional JSON body:
+        {
+            "refresh_token": str (revoked too when it belongs to the same user)
+        }
+
+    Returns:
+        200: Token(s) revoked
+        400: Invalid refresh_token
+        401: Missing, expired or revoked token
+    """
+    claims = get_auth_context().claims
+    revocation_store.revoke(claims)
+
+    data = request.get_json(silent=True) or {}
+    refresh_token = data.get("refresh_token")
+
+    if refresh_token:
+        try:
+            refresh_claims = decode_token(refresh_token, allow_expired=True)
+        except Exception:
+            return jsonify(msg="Refresh token inválido"), 400
+
+        if refresh_claims.get("sub") != claims.get("sub"):
+            return jsonify(msg="Refresh token inválido"), 400
+
+        revocation_store.revoke(refresh_claims)
+
+    return jsonify(msg="Logout realizado com sucesso"), 200
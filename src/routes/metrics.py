@@ -0,0 +1,29 @@
+from flask import Blueprint, jsonify
+from src.utils.cache import school_cache
+from src.utils.decorators import admin_secretaria_only
+from src.utils.hash_pool import hash_pool
+
+metrics_bp = Blueprint("metrics", __name__, url_prefix="/api/metrics")
+
+
+@metrics_bp.route("", methods=["GET"])
+@admin_secretaria_only
+def get_metrics():
+    """Get runtime metrics of the API process.
+
+    Only accessible to admin_secretaria.
+
+    Returns:
+        200: Password hashing pool counters (queue depth, hashing time, rejections)
+            and school payload cache counters (hits, misses, evictions)
+        403: Access denied (not admin_secretaria)
+    """
+    return (
+        jsonify(
+            {
+                "password_hashing": hash_pool.metrics(),
+                "school_cache": school_cache.stats(),
+            }
+        ),
+        200,
+    )
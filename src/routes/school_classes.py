@@ -0,0 +1,432 @@
+from flask import Blueprint, jsonify, request
+
+from src.domain.enums.reservation_status import ReservationStatus
+from src.repositories.school_class_repository import (
+    ClassFullError,
+    ClassNotEmptyError,
+    SchoolClassRepository,
+)
+from src.repositories.seat_reservation_repository import (
+    ReservationConflictError,
+    ReservationStateError,
+    SeatReservationRepository,
+)
+from src.services.school_class_service import SchoolClassService
+from src.services.seat_reservation_service import SeatReservationService
+from src.utils.decorators import school_required
+from src.utils.serializers import serialize_reservation_row, serialize_school_class_row
+
+school_classes_bp = Blueprint("school_classes", __name__, url_prefix="/api/schools")
+
+
+def _school_not_found():
+    return jsonify(msg="Escola não encontrada"), 404
+
+
+def _class_not_found():
+    return jsonify(msg="Turma não encontrada"), 404
+
+
+@school_classes_bp.route("/<int:school_id>/classes", methods=["GET"])
+@school_required
+def list_classes(school_id):
+    """List the classes of a school with their occupancy.
+
+    Args:
+        school_id: ID of the school
+
+    Returns:
+        200: Classes with capacity, enrolled and free seats
+        403: Access denied
+        404: School not found
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    classes = SchoolClassService.get_classes(school_id)
+    return jsonify(classes=[serialize_school_class_row(row) for row in classes]), 200
+
+
+@school_classes_bp.route("/<int:school_id>/classes", methods=["POST"])
+@school_required
+def create_class(school_id):
+    """Create a class in a school.
+
+    Expected JSON body:
+        {
+            "class_grade": str or int (FISRT_YEAR/1, SECOND_YEAR/2, THIRD_YEAR/3),
+            "capacity": int
+        }
+
+    Args:
+        school_id: ID of the school
+
+    Returns:
+        201: Class created successfully with class data
+        400: Invalid data or missing required fields
+        403: Access denied
+        404: School not found
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    row, error = SchoolClassService.create_class(school_id, data)
+
+    if error:
+        return jsonify(msg=error), 400
+
+    return jsonify(
+        {"msg": "Turma criada com sucesso", "school_class": serialize_school_class_row(row)}
+    ), 201
+
+
+@school_classes_bp.route("/<int:school_id>/classes/<int:class_id>", methods=["PUT"])
+@school_required
+def update_class(school_id, class_id):
+    """Change the grade and/or capacity of a class.
+
+    Expected JSON body (all optional, at least one field):
+        {"class_grade": str or int, "capacity": int}
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+
+    Returns:
+        200: Class updated successfully
+        400: Invalid data or nothing to update
+        403: Access denied
+        404: School or class not found
+        409: Capacity below the number of enrolled and held seats
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    try:
+        row, error = SchoolClassService.update_class(school_id, class_id, data)
+    except ClassNotEmptyError:
+        return jsonify(msg="Capacidade menor que o número de vagas ocupadas"), 409
+
+    if error:
+        return jsonify(msg=error), 400
+
+    if row is None:
+        return _class_not_found()
+
+    return jsonify(
+        {"msg": "Turma atualizada com sucesso", "school_class": serialize_school_class_row(row)}
+    ), 200
+
+
+@school_classes_bp.route("/<int:school_id>/classes/<int:class_id>", methods=["DELETE"])
+@school_required
+def delete_class(school_id, class_id):
+    """Delete a class without enrollments or held seats.
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+
+    Returns:
+        200: Class deleted successfully
+        403: Access denied
+        404: School or class not found
+        409: Class still has enrolled students or held seats
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    try:
+        deleted = SchoolClassRepository.delete_class(school_id, class_id)
+    except ClassNotEmptyError:
+        return jsonify(msg="Turma possui matrículas ou reservas"), 409
+
+    if not deleted:
+        return _class_not_found()
+
+    return jsonify(msg="Turma excluída com sucesso"), 200
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/enrollments", methods=["GET"]
+)
+@school_required
+def list_enrollments(school_id, class_id):
+    """List the students enrolled in a class.
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+
+    Returns:
+        200: Enrollments, oldest first
+        403: Access denied
+        404: School or class not found
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    if SchoolClassRepository.find_row(school_id, class_id) is None:
+        return _class_not_found()
+
+    enrollments = [
+        {
+            "id": row.id,
+            "student_name": row.student_name,
+            "created_at": row.created_at.isoformat(),
+        }
+        for row in SchoolClassRepository.get_enrollments(class_id)
+    ]
+    return jsonify(enrollments=enrollments), 200
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/enrollments", methods=["POST"]
+)
+@school_required
+def enroll_student(school_id, class_id):
+    """Enroll a student in a class, taking one free seat.
+
+    Expected JSON body:
+        {"student_name": str}
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+
+    Returns:
+        201: Student enrolled, with the enrollment ID
+        400: Invalid data
+        403: Access denied
+        404: School or class not found
+        409: Class has no free seats
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    try:
+        enrollment_id, error = SchoolClassService.enroll(school_id, class_id, data)
+    except ClassFullError:
+        return jsonify(msg="Turma sem vagas"), 409
+
+    if error:
+        return jsonify(msg=error), 400
+
+    if enrollment_id is None:
+        return _class_not_found()
+
+    return jsonify(msg="Matrícula realizada com sucesso", id=enrollment_id), 201
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/enrollments/<int:enrollment_id>",
+    methods=["DELETE"],
+)
+@school_required
+def cancel_enrollment(school_id, class_id, enrollment_id):
+    """Cancel an enrollment, freeing its seat.
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+        enrollment_id: ID of the enrollment
+
+    Returns:
+        200: Enrollment cancelled successfully
+        403: Access denied
+        404: School, class or enrollment not found
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    if not SchoolClassRepository.unenroll(school_id, class_id, enrollment_id):
+        return jsonify(msg="Matrícula não encontrada"), 404
+
+    return jsonify(msg="Matrícula cancelada com sucesso"), 200
+
+
+# Messages for reservations that cannot change status
+_RESERVATION_STATE_MESSAGES = {
+    ReservationStatus.CONFIRMED: "Reserva já confirmada",
+    ReservationStatus.CANCELLED: "Reserva cancelada",
+    ReservationStatus.EXPIRED: "Reserva expirada",
+}
+
+
+def _reservation_not_found():
+    return jsonify(msg="Reserva não encontrada"), 404
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/reservations/<reservation_id>",
+    methods=["PUT"],
+)
+@school_required
+def hold_seat(school_id, class_id, reservation_id):
+    """Hold a seat of a class until it is confirmed or expires.
+
+    The reservation ID is chosen by the client (e.g., a UUID), so retries
+    are safe: repeating the request returns the existing reservation and
+    never takes a second seat. Holds expire after SEAT_HOLD_MINUTES.
+
+    Expected JSON body:
+        {"student_name": str}
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+        reservation_id: Client-chosen reservation ID (8-64 letters, digits, - or _)
+
+    Returns:
+        201: Seat held, with the reservation
+        200: Reservation already existed (retry), with its current status
+        400: Invalid data or reservation ID
+        403: Access denied
+        404: School or class not found
+        409: Class has no free seats, or the ID is used in another class
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    if SchoolClassRepository.find_row(school_id, class_id) is None:
+        return _class_not_found()
+
+    try:
+        row, created, error = SeatReservationService.hold(class_id, reservation_id, data)
+    except ClassFullError:
+        return jsonify(msg="Turma sem vagas"), 409
+    except ReservationConflictError:
+        return jsonify(msg="ID de reserva já usado em outra turma"), 409
+
+    if error:
+        return jsonify(msg=error), 400
+
+    return jsonify(reservation=serialize_reservation_row(row)), 201 if created else 200
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/reservations/<reservation_id>",
+    methods=["GET"],
+)
+@school_required
+def get_reservation(school_id, class_id, reservation_id):
+    """Get a seat reservation.
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+        reservation_id: Reservation ID
+
+    Returns:
+        200: Reservation with its status (held, confirmed, cancelled, expired)
+        403: Access denied
+        404: School, class or reservation not found
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    if SchoolClassRepository.find_row(school_id, class_id) is None:
+        return _class_not_found()
+
+    row = SeatReservationRepository.find_row(reservation_id)
+    if row is None or row.school_class_id != class_id:
+        return _reservation_not_found()
+
+    return jsonify(reservation=serialize_reservation_row(row)), 200
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/reservations/<reservation_id>/confirm",
+    methods=["POST"],
+)
+@school_required
+def confirm_reservation(school_id, class_id, reservation_id):
+    """Confirm a held seat, enrolling the student.
+
+    Confirming an already confirmed reservation returns it unchanged.
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+        reservation_id: Reservation ID
+
+    Returns:
+        200: Reservation confirmed, with its enrollment_id
+        403: Access denied
+        404: School, class or reservation not found
+        409: Reservation expired or was cancelled
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    if SchoolClassRepository.find_row(school_id, class_id) is None:
+        return _class_not_found()
+
+    try:
+        row = SeatReservationRepository.confirm(school_id, class_id, reservation_id)
+    except ReservationStateError as exc:
+        return jsonify(msg=_RESERVATION_STATE_MESSAGES[exc.args[0]]), 409
+
+    if row is None:
+        return _reservation_not_found()
+
+    return jsonify(reservation=serialize_reservation_row(row)), 200
+
+
+@school_classes_bp.route(
+    "/<int:school_id>/classes/<int:class_id>/reservations/<reservation_id>",
+    methods=["DELETE"],
+)
+@school_required
+def cancel_reservation(school_id, class_id, reservation_id):
+    """Cancel a held seat, releasing it.
+
+    Cancelling a reservation that is already cancelled or expired returns
+    it unchanged.
+
+    Args:
+        school_id: ID of the school
+        class_id: ID of the class
+        reservation_id: Reservation ID
+
+    Returns:
+        200: Reservation cancelled
+        403: Access denied
+        404: School, class or reservation not found
+        409: Reservation already confirmed
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return _school_not_found()
+
+    if SchoolClassRepository.find_row(school_id, class_id) is None:
+        return _class_not_found()
+
+    try:
+        row = SeatReservationRepository.cancel(class_id, reservation_id)
+    except ReservationStateError as exc:
+        return jsonify(msg=_RESERVATION_STATE_MESSAGES[exc.args[0]]), 409
+
+    if row is None:
+        return _reservation_not_found()
+
+    return jsonify(reservation=serialize_reservation_row(row)), 200
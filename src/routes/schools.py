@@ -1,7 +1,24 @@
-from flask import Blueprint, request, jsonify
+from datetime import datetime
+
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from src.domain.enums.count_strategy import CountStrategy
+from src.domain.enums.school_type import SchoolType
+from src.domain.school_filters import SchoolFilters
 from src.repositories.school_repository import SchoolRepository
+from src.services.school_batch_service import MAX_BATCH_SIZE, SchoolBatchService
+from src.services.school_export import iter_csv, iter_ndjson
+from src.services.auth_context import get_auth_context
 from src.services.school_service import SchoolService
 from src.utils.decorators import any_admin, admin_secretaria_only, school_required
+from src.utils.serializers import (
+    SCHOOL_FIELDS,
+    SCHOOL_INCLUDES,
+    parse_field_list,
+    pick_fields,
+    serialize_school_fields,
+    serialize_school_row,
+)
+from src.utils.http_cache import is_not_modified, make_etag, not_modified, with_validators
 
 schools_bp = Blueprint("schools", __name__, url_prefix="/api/schools")
 
@@ -54,32 +71,358 @@ def create_school():
     return jsonify({"msg": "Escola criada com sucesso", "school": result}), 201
 
 
+@schools_bp.route("/batch", methods=["POST"])
+@admin_secretaria_only
+def batch_save_schools():
+    """Create and update many schools in one transaction.
+
+    Only accessible to admin_secretaria. Items without "id" are created with
+    the same fields as POST /api/schools; items with "id" update that school
+    with the same fields as PUT /api/schools/<id>. Invalid items are reported
+    and do not prevent the valid ones from being saved.
+
+    Expected JSON body:
+        {
+            "schools": [
+                {"name": str, "address": {...}, "school_type": str},
+                {"id": int, "name": str, ...}
+            ]
+        }
+
+    Returns:
+        200: Created/updated/failed counts and one result per item
+            ({"index", "status": created/updated/error, "id" or "error"})
+        400: Invalid data or too many schools
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict) or not isinstance(data.get("schools"), list):
+        return jsonify(msg="Campo 'schools' deve ser uma lista"), 400
+
+    items = data["schools"]
+    if len(items) > MAX_BATCH_SIZE:
+        return jsonify(msg=f"Máximo de {MAX_BATCH_SIZE} escolas por lote"), 400
+
+    return jsonify(SchoolBatchService.save_schools(items)), 200
+
+
+@schools_bp.route("/batch/delete", methods=["POST"])
+@admin_secretaria_only
+def batch_delete_schools():
+    """Soft delete many schools at once.
+
+    Only accessible to admin_secretaria. Schools are selected by IDs, by a
+    filter, or both; already deleted schools are skipped.
+
+    Expected JSON body:
+        {
+            "ids": [int, ...] (optional),
+            "filter": {"school_type": str, "state": str, "city": str} (optional)
+        }
+
+    Returns:
+        200: Number of schools deleted ({"affected": int})
+        400: Invalid data, no IDs nor filter, or too many IDs
+        403: Access denied (not admin_secretaria)
+    """
+    affected, error = SchoolBatchService.set_deleted(True, request.get_json(silent=True))
+
+    if error is not None:
+        return jsonify(msg=error), 400
+
+    return jsonify(msg="Escolas excluídas com sucesso", affected=affected), 200
+
+
+@schools_bp.route("/batch/restore", methods=["POST"])
+@admin_secretaria_only
+def batch_restore_schools():
+    """Restore many soft-deleted schools at once.
+
+    Only accessible to admin_secretaria. Takes the same body as
+    POST /api/schools/batch/delete; schools that are not deleted are skipped.
+
+    Returns:
+        200: Number of schools restored ({"affected": int})
+        400: Invalid data, no IDs nor filter, or too many IDs
+        403: Access denied (not admin_secretaria)
+    """
+    affected, error = SchoolBatchService.set_deleted(False, request.get_json(silent=True))
+
+    if error is not None:
+        return jsonify(msg=error), 400
+
+    return jsonify(msg="Escolas restauradas com sucesso", affected=affected), 200
+
+
+def _parse_school_filters():
+    """Build SchoolFilters from the request query string.
+
+    Returns:
+        Tuple (filters, error message). Filters is None when a parameter is
+        invalid.
+    """
+    school_type = request.args.get("school_type")
+    if school_type:
+        try:
+            school_type = SchoolType(school_type.lower())
+        except ValueError:
+            return None, "Tipo de escola inválido"
+    else:
+        school_type = None
+
+    deleted = request.args.get("deleted")
+    if deleted is None:
+        # Legacy flag: include_deleted=true is the same as deleted=all
+        include_deleted = request.args.get("include_deleted", "false").lower() == "true"
+        deleted = "all" if include_deleted else "false"
+
+    deleted = deleted.lower()
+    if deleted not in ("false", "true", "all"):
+        return None, "Filtro 'deleted' inválido"
+
+    state = (request.args.get("state") or "").strip().upper() or None
+    city = (request.args.get("city") or "").strip() or None
+    zip_prefix = (request.args.get("zip_prefix") or "").strip() or None
+
+    return (
+        SchoolFilters(
+            school_type=school_type,
+            state=state,
+            city=city,
+            zip_prefix=zip_prefix,
+            include_deleted=deleted == "all",
+            only_deleted=deleted == "true",
+        ),
+        None,
+    )
+
+
+def _parse_sparse_params():
+    """Read ?fields= and ?include= for school reads.
+
+    Returns:
+        Tuple (fields, include, error message); fields and include are None
+        when not requested.
+    """
+    try:
+        fields = parse_field_list(request.args.get("fields"), SCHOOL_FIELDS)
+        include = parse_field_list(request.args.get("include"), SCHOOL_INCLUDES)
+    except ValueError as error:
+        return None, None, f"Campo ou relação inválida: {error}"
+    return fields, include, None
+
+
+def _embed_includes(schools_data, include) -> None:
+    """Add the requested related data to serialized schools, in place."""
+    loaded = SchoolService.get_school_includes(
+        [school["id"] for school in schools_data], include
+    )
+    for school in schools_data:
+        for relation, items in loaded.items():
+            school[relation] = items.get(school["id"], [])
+
+
 @schools_bp.route("", methods=["GET"])
 @any_admin
 def list_schools():
     """List schools with pagination, filtered by role permissions.
 
+    Two pagination modes are available. Offset mode (the default) accepts
+    page/per_page and returns totals. Cursor mode is selected with
+    pagination=cursor or by sending a cursor, orders schools by name and
+    returns an opaque next_cursor; its cost does not depend on page depth.
+
+    In offset mode the total can be computed exactly, taken from a per-filter
+    cache, or estimated from planner statistics; pagination.count says which
+    strategy was actually used.
+
+    Filters can be combined; each common combination is backed by an index.
+
+    Validators (a strong ETag and Last-Modified) are derived from the
+    number of matching schools, the latest modification of any school and
+    the query parameters, read with one aggregate query. It runs when the client
+    revalidates (If-None-Match or If-Modified-Since), and a match gets 304
+    without running the page query or serializing anything. It also runs
+    for offset pages with an exact total, where its count is the total, so
+    those responses always carry validators at no extra cost. Cursor pages
+    and cached or estimated totals skip it on unconditional requests, so
+    they stay free of COUNT queries. Responses with includes carry no
+    validators, since changes to related data do not change the schools.
+
+    Sparse fieldsets select only the columns of the requested fields. Each
+    include is loaded with one extra query for the whole page and only
+    contains data the user can see.
+
     Query parameters:
-        page: Page number (default: 1)
+        pagination: Pagination mode (offset/cursor, default: offset)
+        page: Page number, offset mode only (default: 1)
+        cursor: next_cursor from the previous page, cursor mode only
         per_page: Items per page (default: 20, max: 100)
-        include_deleted: Whether to include soft-deleted schools (true/false, default: false)
+        count: Total strategy, offset mode only (exact/cached/estimated, default: exact)
+        school_type: School type (federal, estadual, municipal, privada)
+        state: State abbreviation (e.g., RS)
+        city: City name, exact match
+        zip_prefix: Leading characters of the zip code
+        deleted: Soft-deleted schools: false (only live), true (only deleted)
+            or all (default: false)
+        include_deleted: Legacy flag, include_deleted=true is deleted=all
+        fields: Comma-separated fields to return (id, name, address,
+            school_type, deleted_at; default: all); id is always returned
+        include: Comma-separated relations to embed (users, school_classes)
 
     Returns:
         200: Paginated list of schools
+        304: Not modified since the client's copy
+        400: Invalid cursor, count strategy, filter, field or include
     """
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 20, type=int)
-    include_deleted = request.args.get("include_deleted", "false").lower() == "true"
+    cursor = request.args.get("cursor")
+    mode = request.args.get("pagination", "offset").lower()
+
+    filters, error = _parse_school_filters()
+    if filters is None:
+        return jsonify(msg=error), 400
+
+    fields, include, error = _parse_sparse_params()
+    if error:
+        return jsonify(msg=error), 400
+
+    use_cursor = mode == "cursor" or cursor is not None
+    count = None
+    if not use_cursor:
+        try:
+            count = CountStrategy(request.args.get("count", "exact").lower())
+        except ValueError:
+            return jsonify(msg="Estratégia de contagem inválida"), 400
+
+    etag = last_modified = total = None
+    conditional = bool(request.if_none_match or request.if_modified_since)
+    if not include and (conditional or count == CountStrategy.EXACT):
+        auth = get_auth_context()
+        total, last_modified = SchoolService.get_accessible_schools_state(filters)
+        etag = make_etag(
+            "schools",
+            total,
+            last_modified.isoformat() if last_modified else None,
+            auth.role_mask,
+            auth.school_id,
+            sorted(request.args.items(multi=True)),
+        )
+        if is_not_modified(etag, last_modified):
+            return not_modified(etag, last_modified)
+
+    if use_cursor:
+        try:
+            result = SchoolService.get_accessible_schools_by_cursor(
+                cursor=cursor, per_page=per_page, filters=filters, fields=fields
+            )
+        except ValueError:
+            return jsonify(msg="Cursor inválido"), 400
+    else:
+        result = SchoolService.get_accessible_schools(
+            page=page,
+            per_page=per_page,
+            count=count,
+            filters=filters,
+            fields=fields,
+            total=total if count == CountStrategy.EXACT else None,
+        )
+
+    include_deleted = filters.include_deleted or filters.only_deleted
+    if fields is None:
+        schools_data = [
+            serialize_school_row(row, include_deleted) for row in result["schools"]
+        ]
+    else:
+        schools_data = [
+            serialize_school_fields(row, fields | {"id"}, include_deleted)
+            for row in result["schools"]
+        ]
+
+    if include:
+        _embed_includes(schools_data, include)
+
+    response = jsonify({"schools": schools_data, "pagination": result["pagination"]})
+    if etag is None:
+        return response, 200
+    return with_validators(response, etag, last_modified), 200
+
+
+@schools_bp.route("/export", methods=["GET"])
+@any_admin
+def export_schools():
+    """Stream every school visible to the user as NDJSON or CSV.
+
+    Rows are read from a server-side cursor and written as they arrive, so
+    the response starts immediately and memory use does not depend on the
+    number of schools. Accepts the same filters as the listing.
 
-    result = SchoolService.get_accessible_schools(
-        page=page, per_page=per_page, include_deleted=include_deleted
+    Query parameters:
+        format: Output format (ndjson/csv, default: ndjson)
+        school_type, state, city, zip_prefix, deleted, include_deleted:
+            Same as GET /api/schools
+
+    Returns:
+        200: Streamed schools ordered by ID
+        400: Invalid format or filter
+    """
+    export_format = request.args.get("format", "ndjson").lower()
+    if export_format not in ("ndjson", "csv"):
+        return jsonify(msg="Formato inválido"), 400
+
+    filters, error = _parse_school_filters()
+    if filters is None:
+        return jsonify(msg=error), 400
+
+    include_deleted = filters.include_deleted or filters.only_deleted
+    rows = SchoolService.iter_accessible_schools(filters)
+
+    if export_format == "csv":
+        body = iter_csv(rows, include_deleted=include_deleted)
+        mimetype = "text/csv"
+    else:
+        body = iter_ndjson(rows, include_deleted=include_deleted)
+        mimetype = "application/x-ndjson"
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=schools.{export_format}"
+        },
     )
 
-    schools_data = [
-        school.to_dict(include_deleted=include_deleted) for school in result["schools"]
-    ]
 
-    return jsonify({"schools": schools_data, "pagination": result["pagination"]}), 200
+@schools_bp.route("/search", methods=["GET"])
+@any_admin
+def search_schools():
+    """Search schools by name, street, neighborhood, city, state or ZIP code.
+
+    Matching is accent-insensitive and tolerant to typos; results are ranked
+    by relevance and limited to the schools the user can access.
+
+    Query parameters:
+        q: Search text (required)
+        limit: Maximum number of results (default: 20, max: 100)
+        include_deleted: Whether to include soft-deleted schools (true/false, default: false)
+
+    Returns:
+        200: Matching schools, best first, each with a relevance score
+        400: Missing search text
+    """
+    query_text = request.args.get("q", "").strip()
+    if not query_text:
+        return jsonify(msg="Parâmetro 'q' é obrigatório"), 400
+
+    limit = request.args.get("limit", 20, type=int)
+    include_deleted = request.args.get("include_deleted", "false").lower() == "true"
+
+    schools = SchoolService.search_accessible_schools(
+        query_text, limit=limit, include_deleted=include_deleted
+    )
+
+    return jsonify({"schools": schools}), 200
 
 
 @schools_bp.route("/<int:school_id>", methods=["GET"])
@@ -87,24 +430,56 @@ def list_schools():
 def get_school(school_id):
     """Get details of a specific school.
 
+    The serialized school is served from the school payload cache when
+    possible. Responses carry a strong ETag built from the school version
+    and a Last-Modified header; conditional requests get 304 when the school did
+    not change.
+
     Query parameters:
         include_deleted: Whether to include deleted_at field (true/false, default: false)
+        fields: Comma-separated fields to return (default: all); id is
+            always returned
+        include: Comma-separated relations to embed (users, school_classes);
+            responses with includes carry no validators
 
     Args:
         school_id: ID of school to retrieve
 
     Returns:
         200: School details
+        304: Not modified since the client's copy
+        400: Invalid field or include
         403: Access denied
         404: School not found
     """
     include_deleted = request.args.get("include_deleted", "false").lower() == "true"
-    school = SchoolRepository.find_by_id(school_id, include_deleted=include_deleted)
 
-    if not school:
+    fields, include, error = _parse_sparse_params()
+    if error:
+        return jsonify(msg=error), 400
+
+    entry = SchoolService.get_school_payload(school_id, include_deleted=include_deleted)
+
+    if entry is None:
         return jsonify(msg="Escola não encontrada"), 404
 
-    return jsonify({"school": school.to_dict(include_deleted=include_deleted)}), 200
+    school_data = pick_fields(entry["school"], fields and fields | {"id"})
+
+    if include:
+        # The payload may be the cached dict itself; embed into a copy
+        school_data = dict(school_data)
+        _embed_includes([school_data], include)
+        return jsonify({"school": school_data}), 200
+
+    updated_at = datetime.fromisoformat(entry["updated_at"])
+    etag = make_etag(
+        "school", school_id, entry["version"], include_deleted, sorted(fields or ())
+    )
+    if is_not_modified(etag, updated_at):
+        return not_modified(etag, updated_at)
+
+    response = jsonify({"school": school_data})
+    return with_validators(response, etag, updated_at), 200
 
 
 @schools_bp.route("/<int:school_id>", methods=["PUT"])
@@ -112,6 +487,9 @@ def get_school(school_id):
 def update_school(school_id):
     """Update a school.
 
+    Sending address replaces the whole address: address fields that are not
+    sent are blanked. Use PATCH to change only some of them.
+
     Query parameters:
         include_deleted: Whether to include deleted_at field in response (true/false, default: false)
 
@@ -163,6 +541,52 @@ def update_school(school_id):
     return jsonify({"msg": "Escola atualizada com sucesso", "school": result}), 200
 
 
+@schools_bp.route("/<int:school_id>", methods=["PATCH"])
+@school_required
+def patch_school(school_id):
+    """Partially update a school.
+
+    Only the fields sent are changed, including inside address (unlike PUT,
+    which blanks the address fields that are not sent). The update runs as
+    a single UPDATE ... RETURNING and the response is built from the
+    returned row, with the new ETag. Deleted schools cannot be patched.
+
+    Expected JSON body (all optional, at least one field):
+        {
+            "name": str,
+            "address": {"street": str, "city": str, ...},
+            "school_type": str
+        }
+
+    Args:
+        school_id: ID of school to update
+
+    Returns:
+        200: School updated successfully
+        400: Invalid data, invalid field or nothing to update
+        403: Access denied
+        404: School not found
+    """
+    data = request.get_json(silent=True)
+
+    if not isinstance(data, dict):
+        return jsonify(msg="Dados inválidos"), 400
+
+    row, error = SchoolService.patch_school(school_id, data)
+
+    if error:
+        return jsonify(msg=error), 400
+
+    if row is None:
+        return jsonify(msg="Escola não encontrada"), 404
+
+    response = jsonify(
+        {"msg": "Escola atualizada com sucesso", "school": serialize_school_row(row)}
+    )
+    etag = make_etag("school", school_id, row.version, False, [])
+    return with_validators(response, etag, row.updated_at), 200
+
+
 @schools_bp.route("/<int:school_id>", methods=["DELETE"])
 @admin_secretaria_only
 def delete_school(school_id):
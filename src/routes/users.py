@@ -1,8 +1,28 @@
 from flask import Blueprint, request, jsonify
-from src.repositories.user_repository import UserRepository
+from src.domain.enums.role_name import RoleName
+from src.repositories.user_repository import (
+    DuplicateEmailError,
+    RoleNotFoundError,
+    UserRepository,
+)
+from src.utils.hash_pool import HashPoolBusyError, hash_pool
 from src.utils.password_utils import hash_password
 from src.utils.decorators import any_admin, admin_secretaria_only
-from src.services.auth_service import get_current_user_school_id, is_admin_secretaria
+from src.utils.serializers import (
+    USER_FIELDS,
+    USER_INCLUDES,
+    parse_field_list,
+    pick_fields,
+    serialize_user_fields,
+    serialize_user_row,
+)
+from src.services.school_service import SchoolService
+from src.services.auth_context import get_auth_context
+from src.services.user_import_service import (
+    UserImportService,
+    iter_csv_rows,
+    iter_ndjson_rows,
+)
 
 users_bp = Blueprint("users", __name__, url_prefix="/api/users")
 
@@ -11,6 +31,9 @@ users_bp = Blueprint("users", __name__, url_prefix="/api/users")
 def register():
     """Register a new user.
 
+    The user and its role are written in a single transaction; duplicate
+    emails are detected from the unique constraint.
+
     Expected JSON body:
         {
             "name": str,
@@ -22,8 +45,9 @@ def register():
 
     Returns:
         201: User created successfully with user data
-        400: Invalid data or missing required fields
+        400: Invalid data, missing required fields or unknown role
         409: Email already registered
+        503: Password hashing queue is full, retry later
     """
     data = request.get_json()
 
@@ -35,54 +59,166 @@ def register():
         if field not in data:
             return jsonify(msg=f"Campo '{field}' é obrigatório"), 400
 
-    email = data.get("email")
+    try:
+        hashed_password = hash_pool.run(hash_password, data.get("password"))
+    except HashPoolBusyError:
+        return jsonify(msg="Servidor ocupado, tente novamente"), 503, {
+            "Retry-After": "1"
+        }
 
-    if UserRepository.find_by_email(email):
+    try:
+        user = UserRepository.create_user_with_role(
+            name=data.get("name"),
+            email=data.get("email"),
+            hashed_password=hashed_password,
+            school_id=data.get("school_id"),
+            role_name=data.get("role", RoleName.ADMIN_ESCOLA.value),
+        )
+    except DuplicateEmailError:
         return jsonify(msg="Email já cadastrado"), 409
+    except RoleNotFoundError:
+        return jsonify(msg="Role não encontrada"), 400
+
+    return jsonify({"msg": "Usuário criado com sucesso", "user": user.to_dict()}), 201
+
+
+@users_bp.route("/import", methods=["POST"])
+@admin_secretaria_only
+def import_users():
+    """Bulk import users from a CSV or NDJSON upload.
+
+    Only accessible to admin_secretaria. The body is read as a stream and
+    processed in chunked transactions, so rows before a failing one stay
+    committed and the response reports every row that was not imported.
 
-    hashed_password = hash_password(data.get("password"))
+    Content types:
+        text/csv: Header row with name,email,password,school_id[,role]
+        application/x-ndjson: One JSON object per line with the same fields
 
-    user = UserRepository.create_user(
-        name=data.get("name"),
-        email=email,
-        hashed_password=hashed_password,
-        school_id=data.get("school_id"),
+    Query parameters:
+        default_role: Role for rows without one (default: admin_escola)
+
+    Returns:
+        200: Import report with created/failed counts and per-row errors
+        415: Unsupported content type
+    """
+    content_type = request.mimetype
+
+    if content_type == "text/csv":
+        rows = iter_csv_rows(request.stream)
+    elif content_type in ("application/x-ndjson", "application/jsonl"):
+        rows = iter_ndjson_rows(request.stream)
+    else:
+        return jsonify(msg="Envie text/csv ou application/x-ndjson"), 415
+
+    report = UserImportService.import_users(
+        rows, default_role=request.args.get("default_role", RoleName.ADMIN_ESCOLA.value)
     )
 
-    role_name = data.get("role", "admin_escola")
+    return jsonify(report), 200
 
-    UserRepository.add_role_to_user(user.id, role_name)
 
-    return jsonify({"msg": "Usuário criado com sucesso", "user": user.to_dict()}), 201
+def _parse_sparse_params():
+    """Read ?fields= and ?include= for user reads.
+
+    Returns:
+        Tuple (fields, include, error message); fields and include are None
+        when not requested.
+    """
+    try:
+        fields = parse_field_list(request.args.get("fields"), USER_FIELDS)
+        include = parse_field_list(request.args.get("include"), USER_INCLUDES)
+    except ValueError as error:
+        return None, None, f"Campo ou relação inválida: {error}"
+    return fields, include, None
+
+
+def _embed_school(users_data, school_ids) -> None:
+    """Add each user's school to serialized users, in place.
+
+    Args:
+        users_data: Serialized users.
+        school_ids: School ID of each user, in the same order.
+    """
+    schools = SchoolService.get_accessible_schools_by_ids(school_ids)
+    for user, school_id in zip(users_data, school_ids):
+        user["school"] = schools.get(school_id)
 
 
 @users_bp.route("", methods=["GET"])
 @any_admin
 def list_users():
-    """List all users, filtered by role permissions.
+    """List users with pagination, filtered by role permissions.
 
     - admin_secretaria: Can see all users across all schools
     - admin_escola: Can only see users from their own school
 
+    Query parameters:
+        page: Page number (default: 1)
+        per_page: Items per page (default: 20, max: 100)
+        school_id: Only users from this school (ignored for admin_escola)
+        role: Only users with this role
+        name: Case-insensitive search on the user name
+        fields: Comma-separated fields to return (id, name, email, roles,
+            school_id; default: all); id is always returned
+        include: Comma-separated relations to embed (school), loaded with one
+            extra query for the whole page
+
     Returns:
-        200: List of users with their roles and school_id
+        200: Paginated list of users with their roles and school_id
+        400: Invalid field or include
     """
-    users = UserRepository.get_all_users()
-
-    result = []
-    for user in users:
-        user_data = user.to_dict()
-        user_data["roles"] = [role.name for role in user.roles]
-        user_data["school_id"] = user.school_id
-        result.append(user_data)
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 20, type=int)
+    school_id = request.args.get("school_id", type=int)
+    role_name = request.args.get("role")
+    name = request.args.get("name")
+
+    fields, include, error = _parse_sparse_params()
+    if error:
+        return jsonify(msg=error), 400
+
+    auth = get_auth_context()
+
+    if not auth.is_secretaria:
+        school_id = auth.school_id
+        if not school_id:
+            return jsonify(
+                {
+                    "users": [],
+                    "pagination": {
+                        "page": page,
+                        "per_page": per_page,
+                        "total": 0,
+                        "pages": 0,
+                        "has_next": False,
+                        "has_prev": False,
+                    },
+                }
+            ), 200
+
+    result = UserRepository.get_paginated_users(
+        page=page,
+        per_page=per_page,
+        school_id=school_id,
+        role_name=role_name,
+        name=name,
+        fields=fields,
+    )
 
-    if is_admin_secretaria():
-        return jsonify({"users": result}), 200
+    roles = result["roles"]
+    if fields is None:
+        users_data = [serialize_user_row(row, roles[row.id]) for row in result["users"]]
+    else:
+        users_data = [
+            serialize_user_fields(row, roles[row.id], fields | {"id"})
+            for row in result["users"]
+        ]
 
-    user_school_id = get_current_user_school_id()
-    filtered_users = [u for u in result if u["school_id"] == user_school_id]
+    if include:
+        _embed_school(users_data, [row.school_id for row in result["users"]])
 
-    return jsonify({"users": filtered_users}), 200
+    return jsonify({"users": users_data, "pagination": result["pagination"]}), 200
 
 
 @users_bp.route("/<int:user_id>/role", methods=["PUT"])
@@ -127,26 +263,42 @@ def get_user(user_id):
     - admin_secretaria: Can access any user
     - admin_escola: Can only access users from their own school
 
+    Query parameters:
+        fields: Comma-separated fields to return (default: all); id is
+            always returned
+        include: Comma-separated relations to embed (school)
+
     Args:
         user_id: ID of user to retrieve
 
     Returns:
         200: User details including roles and school_id
+        400: Invalid field or include
         403: Access denied (admin_escola trying to access different school)
         404: User not found
     """
+    fields, include, error = _parse_sparse_params()
+    if error:
+        return jsonify(msg=error), 400
+
     user = UserRepository.find_by_id(user_id)
 
     if not user:
         return jsonify(msg="Usuário não encontrado"), 404
 
-    if not is_admin_secretaria():
-        user_school_id = get_current_user_school_id()
+    auth = get_auth_context()
+
+    if not auth.is_secretaria:
+        user_school_id = auth.school_id
         if user.school_id != user_school_id:
             return jsonify(msg="Acesso negado"), 403
 
     user_data = user.to_dict()
     user_data["roles"] = [role.name for role in user.roles]
     user_data["school_id"] = user.school_id
+    user_data = pick_fields(user_data, fields and fields | {"id"})
+
+    if include:
+        _embed_school([user_data], [user.school_id])
 
     return jsonify({"user": user_data}), 200
@@ -0,0 +1,62 @@
+from flask import Blueprint, jsonify, request
+
+from src.services.school_class_service import SchoolClassService, parse_class_grade
+from src.services.seat_service import SeatService
+from src.utils.decorators import any_admin, school_required
+
+vagas_bp = Blueprint("vagas", __name__, url_prefix="/api")
+
+
+@vagas_bp.route("/schools/<int:school_id>/vagas", methods=["GET"])
+@school_required
+def get_school_vagas(school_id):
+    """Get the seats of a school per grade and per class.
+
+    Args:
+        school_id: ID of the school
+
+    Returns:
+        200: Capacity, enrolled and free seats per grade and per class
+        403: Access denied
+        404: School not found
+    """
+    if not SchoolClassService.school_exists(school_id):
+        return jsonify(msg="Escola não encontrada"), 404
+
+    return jsonify(SeatService.get_school_seats(school_id)), 200
+
+
+@vagas_bp.route("/vagas", methods=["GET"])
+@any_admin
+def list_vagas():
+    """List the schools with free seats, statewide.
+
+    Query parameters:
+        grade: Grade name or number (e.g., SECOND_YEAR or 2; default: all)
+        city: Exact city name (optional)
+        state: State abbreviation (optional)
+        page: Page number (default: 1)
+        per_page: Items per page (default: 20, max: 100)
+
+    Returns:
+        200: One item per school and grade with free seats, ordered by
+            school name, and pagination info
+        400: Invalid grade
+    """
+    class_grade = None
+    grade = request.args.get("grade")
+    if grade:
+        class_grade = parse_class_grade(grade)
+        if class_grade is None:
+            return jsonify(msg="Série inválida"), 400
+
+    city = (request.args.get("city") or "").strip() or None
+    state = (request.args.get("state") or "").strip().upper() or None
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 20, type=int)
+
+    return jsonify(
+        SeatService.get_available_seats(
+            class_grade=class_grade, city=city, state=state, page=page, per_page=per_page
+        )
+    ), 200
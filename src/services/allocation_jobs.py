@@ -0,0 +1,99 @@
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.config.db_config import db
+from src.repositories.allocation_repository import (
+    AllocationConflictError,
+    AllocationRepository,
+)
+from src.services.allocation_service import AllocationService
+
+logger = logging.getLogger(__name__)
+
+
+class AllocationJobs:
+    """Runs allocation rounds in background threads.
+
+    Each job gets its own application context and database session. The
+    round row is the job's state: status, progress and results are stored
+    there, so any process can report them.
+    """
+
+    def __init__(self):
+        self.workers = 0
+        self.timeout = timedelta(seconds=900)
+        self._app = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Create the executor from the application config.
+
+        Config keys:
+            ALLOCATION_WORKERS: Rounds solved at the same time (default: 1).
+            ALLOCATION_TIMEOUT: Seconds after which a running round is
+                considered abandoned (its process died) and can be run
+                again (default: 900).
+
+        Args:
+            app: Flask application instance.
+        """
+        workers = int(
+            app.config.get("ALLOCATION_WORKERS")
+            or os.getenv("ALLOCATION_WORKERS")
+            or 1
+        )
+        timeout = float(
+            app.config.get("ALLOCATION_TIMEOUT")
+            or os.getenv("ALLOCATION_TIMEOUT")
+            or 900
+        )
+
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+
+            self.workers = max(1, workers)
+            self.timeout = timedelta(seconds=timeout)
+            self._app = app
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="allocation"
+            )
+
+        app.extensions["allocation_jobs"] = self
+
+    def submit(self, round_id: int, started_at: datetime) -> Future:
+        """Run a claimed round in the background.
+
+        Args:
+            round_id: ID of a round marked running by claim_round.
+            started_at: Run returned by claim_round.
+
+        Returns:
+            Future resolved with the number of applicants enrolled.
+        """
+        if self._executor is None:
+            raise RuntimeError("AllocationJobs is not initialized; call init_app first")
+        return self._executor.submit(self._run, round_id, started_at)
+
+    def _run(self, round_id: int, started_at: datetime) -> Optional[int]:
+        with self._app.app_context():
+            try:
+                return AllocationService.run_round(round_id, started_at)
+            except AllocationConflictError as exc:
+                AllocationRepository.fail_round(round_id, started_at, str(exc))
+            except Exception:
+                logger.exception("Allocation round %s failed", round_id)
+                AllocationRepository.fail_round(
+                    round_id, started_at, "Erro interno na alocação"
+                )
+            finally:
+                db.session.remove()
+        return None
+
+
+allocation_jobs = AllocationJobs()
@@ -0,0 +1,231 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.repositories.allocation_repository import AllocationRepository
+from src.repositories.school_repository import SchoolRepository
+from src.services.allocation_solver import (
+    compact_preferences,
+    deferred_acceptance,
+    fill_classes,
+    priority_keys,
+)
+from src.services.school_class_service import parse_class_grade
+
+MAX_APPLICANTS_PER_REQUEST = 5000
+MAX_PREFERENCES = 10
+MAX_PRIORITY_POINTS = 10_000
+
+# Share of the progress bar given to each stage of a run
+LOAD_DONE = 0.1
+SOLVE_DONE = 0.8
+
+# Minimum seconds between two progress writes
+PROGRESS_INTERVAL = 0.5
+
+
+def _points(value: Any, field: str) -> Tuple[Optional[int], Optional[str]]:
+    if value is None:
+        return 0, None
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, int)
+        or not 0 <= value <= MAX_PRIORITY_POINTS
+    ):
+        return None, f"Campo '{field}' deve estar entre 0 e {MAX_PRIORITY_POINTS}"
+    return value, None
+
+
+class AllocationService:
+    @staticmethod
+    def create_round(data: Dict[str, Any]) -> Tuple[Optional[int], Optional[str]]:
+        """Create an allocation round.
+
+        Args:
+            data: Round payload (name, class_grade).
+
+        Returns:
+            Tuple (round ID, error message).
+        """
+        name = data.get("name")
+        if not isinstance(name, str) or not name.strip():
+            return None, "Campo 'name' é obrigatório"
+        if len(name) > 80:
+            return None, "Campo 'name' excede o tamanho máximo"
+
+        class_grade = parse_class_grade(data.get("class_grade"))
+        if class_grade is None:
+            return None, "Série inválida"
+
+        return AllocationRepository.create_round(name.strip(), class_grade), None
+
+    @staticmethod
+    def add_applicants(
+        round_id: int, items: List[Any]
+    ) -> Tuple[Optional[List[int]], Optional[str]]:
+        """Validate and insert applicants with their ranked school choices.
+
+        The whole request is rejected on the first invalid applicant or on
+        any unknown or deleted school, so a round never holds half of an
+        upload.
+
+        Args:
+            round_id: Round ID.
+            items: Applicant payloads: {"student_name", "priority",
+                "preferences": [school_id or {"school_id", "bonus"}, ...]},
+                preferences best first.
+
+        Returns:
+            Tuple (created applicant IDs, error message).
+        """
+        applicants = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return None, f"Candidato {index}: dados inválidos"
+
+            student_name = item.get("student_name")
+            if not isinstance(student_name, str) or not student_name.strip():
+                return None, f"Candidato {index}: campo 'student_name' é obrigatório"
+            if len(student_name) > 80:
+                return None, f"Candidato {index}: campo 'student_name' excede o tamanho máximo"
+
+            priority, error = _points(item.get("priority"), "priority")
+            if error:
+                return None, f"Candidato {index}: {error}"
+
+            raw_preferences = item.get("preferences")
+            if (
+                not isinstance(raw_preferences, list)
+                or not 0 < len(raw_preferences) <= MAX_PREFERENCES
+            ):
+                return None, (
+                    f"Candidato {index}: campo 'preferences' deve ter de 1 a "
+                    f"{MAX_PREFERENCES} escolas"
+                )
+
+            preferences = []
+            for preference in raw_preferences:
+                if not isinstance(preference, dict):
+                    preference = {"school_id": preference}
+                school_id = preference.get("school_id")
+                if isinstance(school_id, bool) or not isinstance(school_id, int):
+                    return None, f"Candidato {index}: escola inválida"
+                bonus, error = _points(preference.get("bonus"), "bonus")
+                if error:
+                    return None, f"Candidato {index}: {error}"
+                preferences.append({"school_id": school_id, "bonus": bonus})
+
+            if len({preference["school_id"] for preference in preferences}) != len(
+                preferences
+            ):
+                return None, f"Candidato {index}: escola repetida nas preferências"
+
+            applicants.append(
+                {
+                    "student_name": student_name.strip(),
+                    "priority": priority,
+                    "preferences": preferences,
+                }
+            )
+
+        school_ids = {
+            preference["school_id"]
+            for applicant in applicants
+            for preference in applicant["preferences"]
+        }
+        missing = school_ids - SchoolRepository.find_existing_ids(school_ids)
+        if missing:
+            return None, f"Escolas não encontradas: {sorted(missing)}"
+
+        return AllocationRepository.add_applicants(round_id, applicants), None
+
+    @staticmethod
+    def run_round(round_id: int, started_at: datetime) -> int:
+        """Solve a claimed round and write the allocation back.
+
+        Applicants and free seats are loaded into arrays; each school's free
+        seats of the round's grade form one program. Programs rank
+        applicants by priority points plus the school's bonus, ties broken
+        by a lottery drawn from the round's seed, and deferred acceptance
+        gives the applicant-optimal stable allocation. Progress is stored
+        on the round while it runs.
+
+        Args:
+            round_id: ID of a round marked running by claim_round.
+            started_at: Run returned by claim_round.
+
+        Returns:
+            Number of applicants enrolled.
+
+        Raises:
+            AllocationConflictError: If seats were taken while solving, or
+                the round was claimed again by another run.
+        """
+        allocation_round = AllocationRepository.find_round_row(round_id)
+
+        applicant_ids, priorities = AllocationRepository.load_applicants(round_id)
+        preferences = AllocationRepository.load_preferences(round_id)
+        classes = AllocationRepository.load_free_classes(allocation_round.class_grade)
+        AllocationRepository.set_progress(round_id, started_at, LOAD_DONE)
+
+        # Programs: schools with free seats in the grade, sorted by ID
+        class_ids, class_schools, class_free = classes.T
+        school_ids, class_programs = np.unique(class_schools, return_inverse=True)
+        capacities = np.bincount(
+            class_programs, weights=class_free, minlength=school_ids.size
+        ).astype(np.int64)
+
+        # Applicant x rank matrices; choices of schools without seats are -1
+        width = int(preferences[:, 1].max(initial=0))
+        choice_programs = np.full((applicant_ids.size, width), -1, dtype=np.int64)
+        points = np.zeros((applicant_ids.size, width), dtype=np.int64)
+        if preferences.size and school_ids.size:
+            rows = np.searchsorted(applicant_ids, preferences[:, 0])
+            columns = preferences[:, 1] - 1
+            programs = np.searchsorted(school_ids, preferences[:, 2])
+            programs = np.minimum(programs, school_ids.size - 1)
+            offered = school_ids[programs] == preferences[:, 2]
+            choice_programs[rows[offered], columns[offered]] = programs[offered]
+            points[rows, columns] = priorities[rows] + preferences[:, 3]
+
+        # Submitted rank of each column, kept through the compaction
+        submitted_ranks = np.broadcast_to(np.arange(width), choice_programs.shape)
+        choice_programs, points, submitted_ranks = compact_preferences(
+            choice_programs, points, submitted_ranks
+        )
+        keys = priority_keys(points, allocation_round.seed)
+
+        last_report = time.monotonic()
+
+        def report(proposing: int) -> None:
+            nonlocal last_report
+            if time.monotonic() - last_report < PROGRESS_INTERVAL:
+                return
+            last_report = time.monotonic()
+            settled = 1 - proposing / max(applicant_ids.size, 1)
+            AllocationRepository.set_progress(
+                round_id, started_at, LOAD_DONE + (SOLVE_DONE - LOAD_DONE) * settled
+            )
+
+        assigned, ranks = deferred_acceptance(
+            choice_programs, keys, capacities, on_round=report
+        )
+        allocated_classes = fill_classes(
+            assigned, keys, ranks, class_ids, class_programs, class_free, school_ids.size
+        )
+        AllocationRepository.set_progress(round_id, started_at, SOLVE_DONE)
+
+        admitted = np.flatnonzero(assigned >= 0)
+        granted_ranks = np.full(applicant_ids.size, -1, dtype=np.int64)
+        granted_ranks[admitted] = submitted_ranks[admitted, ranks[admitted]]
+
+        return AllocationRepository.write_results(
+            round_id,
+            started_at,
+            allocation_round.class_grade,
+            applicant_ids,
+            allocated_classes,
+            granted_ranks,
+        )
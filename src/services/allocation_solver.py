@@ -0,0 +1,168 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+def compact_preferences(
+    preferences: np.ndarray, *columns: np.ndarray
+) -> Tuple[np.ndarray, ...]:
+    """Move the valid choices of each applicant to the left, keeping order.
+
+    Choices of programs without free seats are marked -1 when loaded; this
+    drops the gaps so an applicant's k-th proposal is always column k.
+
+    Args:
+        preferences: Program index per applicant and rank, -1 for none.
+        *columns: Arrays of the same shape reordered along (e.g., points).
+
+    Returns:
+        Tuple (preferences, *columns), compacted and trimmed to the longest
+        list.
+    """
+    order = np.argsort(preferences < 0, axis=1, kind="stable")
+    width = int((preferences >= 0).sum(axis=1).max(initial=0))
+    return tuple(
+        np.take_along_axis(array, order, axis=1)[:, :width]
+        for array in (preferences, *columns)
+    )
+
+
+def priority_keys(points: np.ndarray, seed: int) -> np.ndarray:
+    """Build the programs' ranking keys from priority points and a lottery.
+
+    Ties on points are broken by one lottery number per applicant, drawn
+    from the seed, so every key is unique and the allocation deterministic.
+
+    Args:
+        points: Priority points per applicant and rank.
+        seed: Lottery seed.
+
+    Returns:
+        int64 keys with the shape of points; higher keys are served first.
+    """
+    applicants = points.shape[0]
+    lottery = np.random.default_rng(seed).permutation(applicants)
+    return points.astype(np.int64) * applicants + lottery[:, None]
+
+
+def deferred_acceptance(
+    preferences: np.ndarray,
+    keys: np.ndarray,
+    capacities: np.ndarray,
+    on_round: Optional[Callable[[int], None]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Applicant-proposing deferred acceptance (Gale-Shapley).
+
+    Every round, each unmatched applicant proposes to their next choice.
+    Each program that received proposals keeps its best ``capacity``
+    candidates among the new proposers and the applicants it already
+    holds, and rejects the rest. Rounds are fully vectorized: one lexsort
+    groups the candidates by program and orders them by key.
+
+    The result is the applicant-optimal stable allocation: no applicant
+    prefers a program that would rank them above someone it admitted.
+
+    Args:
+        preferences: Program index per applicant and rank (compacted, -1
+            padding).
+        keys: Ranking key of the applicant at each chosen program.
+        capacities: Seats per program.
+        on_round: Called after each round with the number of applicants
+            still proposing.
+
+    Returns:
+        Tuple (program per applicant, 0-based rank of that choice); both -1
+        for unassigned applicants.
+    """
+    applicants = preferences.shape[0]
+    choices = (preferences >= 0).sum(axis=1)
+
+    next_rank = np.zeros(applicants, dtype=np.int64)
+    assigned = np.full(applicants, -1, dtype=np.int64)
+    held_key = np.zeros(applicants, dtype=np.int64)
+    touched = np.zeros(capacities.shape[0], dtype=bool)
+
+    while True:
+        proposers = np.flatnonzero((assigned < 0) & (next_rank < choices))
+        if on_round is not None:
+            on_round(proposers.size)
+        if proposers.size == 0:
+            break
+
+        ranks = next_rank[proposers]
+        programs = preferences[proposers, ranks]
+        proposal_keys = keys[proposers, ranks]
+        next_rank[proposers] += 1
+
+        # Applicants held by programs without new proposals keep their seat
+        touched[:] = False
+        touched[programs] = True
+        holders = np.flatnonzero(assigned >= 0)
+        holders = holders[touched[assigned[holders]]]
+
+        candidates = np.concatenate((holders, proposers))
+        candidate_programs = np.concatenate((assigned[holders], programs))
+        candidate_keys = np.concatenate((held_key[holders], proposal_keys))
+
+        order = np.lexsort((-candidate_keys, candidate_programs))
+        candidates = candidates[order]
+        candidate_programs = candidate_programs[order]
+        candidate_keys = candidate_keys[order]
+
+        group_start = np.searchsorted(candidate_programs, candidate_programs)
+        position = np.arange(candidates.size) - group_start
+        accepted = position < capacities[candidate_programs]
+
+        assigned[candidates[~accepted]] = -1
+        assigned[candidates[accepted]] = candidate_programs[accepted]
+        held_key[candidates[accepted]] = candidate_keys[accepted]
+
+    rank = np.where(assigned >= 0, next_rank - 1, -1)
+    return assigned, rank
+
+
+def fill_classes(
+    assigned: np.ndarray,
+    keys: np.ndarray,
+    rank: np.ndarray,
+    class_ids: np.ndarray,
+    class_programs: np.ndarray,
+    class_free: np.ndarray,
+    programs: int,
+) -> np.ndarray:
+    """Seat each admitted applicant in a class of their program.
+
+    Classes of a program are filled in ID order, best-ranked applicants
+    first.
+
+    Args:
+        assigned: Program per applicant, -1 if unassigned.
+        keys: Ranking keys used by deferred_acceptance.
+        rank: Rank of the assigned choice per applicant.
+        class_ids: Class IDs, grouped by program and sorted by ID.
+        class_programs: Program index of each class.
+        class_free: Free seats of each class.
+        programs: Number of programs.
+
+    Returns:
+        Class ID per applicant, -1 if unassigned.
+    """
+    seats = np.repeat(class_ids, class_free)
+    capacity = np.bincount(class_programs, weights=class_free, minlength=programs)
+    offsets = np.concatenate(([0], np.cumsum(capacity)[:-1])).astype(np.int64)
+
+    admitted = np.flatnonzero(assigned >= 0)
+    admitted_programs = assigned[admitted]
+    admitted_keys = keys[admitted, rank[admitted]]
+
+    order = np.lexsort((-admitted_keys, admitted_programs))
+    admitted = admitted[order]
+    admitted_programs = admitted_programs[order]
+
+    position = np.arange(admitted.size) - np.searchsorted(
+        admitted_programs, admitted_programs
+    )
+
+    classes = np.full(assigned.shape[0], -1, dtype=np.int64)
+    classes[admitted] = seats[offsets[admitted_programs] + position]
+    return classes
@@ -0,0 +1,204 @@
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Iterable, Mapping, Optional
+
+from flask import current_app, g, has_request_context, request
+from flask_jwt_extended import get_jwt, get_jwt_request_location, verify_jwt_in_request
+
+from src.domain.enums.role_name import ROLE_BITS, RoleName
+from src.utils.token_cache import token_cache
+
+SECRETARIA_BIT = ROLE_BITS[RoleName.ADMIN_SECRETARIA.value]
+ESCOLA_BIT = ROLE_BITS[RoleName.ADMIN_ESCOLA.value]
+ANY_ADMIN_MASK = SECRETARIA_BIT | ESCOLA_BIT
+
+
+def roles_to_mask(role_names: Iterable[str]) -> int:
+    """Encode role names as a bitmask; unknown roles are ignored.
+
+    Args:
+        role_names: Role names to encode.
+
+    Returns:
+        Bitmask with one bit per known role.
+    """
+    mask = 0
+    for name in role_names:
+        mask |= ROLE_BITS.get(name, 0)
+    return mask
+
+
+def mask_to_roles(mask: int) -> FrozenSet[str]:
+    """Decode a role bitmask into role names.
+
+    Args:
+        mask: Bitmask produced by roles_to_mask.
+
+    Returns:
+        Frozenset of role names.
+    """
+    return frozenset(name for name, bit in ROLE_BITS.items() if mask & bit)
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    """Identity and permissions of the current request, built once from the JWT."""
+
+    user_id: Optional[int]
+    roles: FrozenSet[str]
+    role_mask: int
+    school_id: Optional[int]
+    is_secretaria: bool
+    is_escola: bool
+    # Decoded JWT payload, for what the fields above don't cover (jti, exp)
+    claims: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def is_any_admin(self) -> bool:
+        return bool(self.role_mask & ANY_ADMIN_MASK)
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self.user_id is not None
+
+    @classmethod
+    def from_claims(cls, claims: Mapping[str, Any]) -> "AuthContext":
+        """Build a context from decoded JWT claims.
+
+        Args:
+            claims: Decoded JWT payload.
+
+        Returns:
+            AuthContext for the token owner.
+        """
+        identity = claims.get("sub")
+        roles = frozenset(claims.get("roles", ()))
+
+        if "rb" in claims:
+            # Compact format: known roles as a bitmask, unknown ones listed
+            role_mask = int(claims["rb"])
+            roles = roles | mask_to_roles(role_mask)
+        else:
+            role_mask = roles_to_mask(roles)
+
+        return cls(
+            user_id=int(identity) if identity is not None else None,
+            roles=roles,
+            role_mask=role_mask,
+            school_id=claims.get("school_id"),
+            is_secretaria=bool(role_mask & SECRETARIA_BIT),
+            is_escola=bool(role_mask & ESCOLA_BIT),
+            claims=claims,
+        )
+
+
+ANONYMOUS = AuthContext(
+    user_id=None,
+    roles=frozenset(),
+    role_mask=0,
+    school_id=None,
+    is_secretaria=False,
+    is_escola=False,
+)
+
+
+def reset_auth_context() -> None:
+    """Drop the auth state cached in g by a previous request."""
+    g.pop("auth_context", None)
+    g.pop("auth_user", None)
+
+
+def init_auth_context(app) -> None:
+    """Register the request hook that resets the cached auth state.
+
+    g lives in the application context, which can outlive a single request
+    (e.g., when requests are dispatched inside an existing app context), so
+    the cached context is cleared at the start of every request.
+
+    Args:
+        app: Flask application instance.
+    """
+    app.before_request(reset_auth_context)
+
+
+def _get_header_token() -> Optional[str]:
+    """Get the raw JWT sent in the Authorization header, if any."""
+    config = current_app.config
+    locations = config.get("JWT_TOKEN_LOCATION", ("headers",))
+    if isinstance(locations, str):
+        locations = (locations,)
+    if "headers" not in locations:
+        return None
+
+    header = request.headers.get(config.get("JWT_HEADER_NAME", "Authorization"))
+    if not header:
+        return None
+
+    header_type = config.get("JWT_HEADER_TYPE", "Bearer")
+    if not header_type:
+        return header
+
+    parts = header.split()
+    if len(parts) != 2 or parts[0] != header_type:
+        return None
+    return parts[1]
+
+
+def load_auth_context() -> AuthContext:
+    """Verify the request JWT and build the request auth context.
+
+    Used by the route decorators. Tokens verified by earlier requests are
+    served from the verified-token cache, skipping decoding and signature
+    verification. flask_jwt_extended never sees those requests, so code
+    behind the decorators must read the claims from get_auth_context(),
+    not get_jwt(). On a miss, errors from verify_jwt_in_request propagate
+    so flask_jwt_extended answers with 401/422 as usual.
+
+    Returns:
+        AuthContext of the current request.
+    """
+    ctx = g.get("auth_context")
+    if ctx is not None:
+        return ctx
+
+    token = _get_header_token()
+    cached = token_cache.get(token) if token else None
+
+    if cached is not None:
+        jwt_data = cached[1]
+    else:
+        verified = verify_jwt_in_request()
+        if verified is None:
+            # Exempt method (e.g., OPTIONS): no identity
+            return ANONYMOUS
+        jwt_header, jwt_data = verified
+        if token and get_jwt_request_location() == "headers":
+            token_cache.set(token, jwt_header, jwt_data)
+
+    ctx = AuthContext.from_claims(jwt_data)
+    g.auth_context = ctx
+    return ctx
+
+
+def get_auth_context() -> AuthContext:
+    """Get the auth context of the current request.
+
+    Returns the context built by the decorators. When the route was not
+    protected by them (e.g., @jwt_required routes), the context is built
+    from the JWT flask_jwt_extended verified, or is anonymous if there is
+    none.
+
+    Returns:
+        AuthContext of the current request.
+    """
+    if not has_request_context():
+        return ANONYMOUS
+
+    ctx = g.get("auth_context")
+    if ctx is None:
+        try:
+            claims = get_jwt()
+        except Exception:
+            return ANONYMOUS
+        ctx = AuthContext.from_claims(claims)
+        g.auth_context = ctx
+    return ctx
@@ -1,9 +1,12 @@
 from typing import List, Optional
 
-from flask_jwt_extended import create_access_token, get_jwt_identity
+from flask import current_app, g, has_request_context
+from flask_jwt_extended import create_access_token, create_refresh_token
 
 from src.config.db_config import db
+from src.domain.enums.role_name import ROLE_BITS
 from src.models.user import User
+from src.services.auth_context import get_auth_context, roles_to_mask
 
 
 def generate_token(user: User) -> str:
@@ -12,40 +15,67 @@ def generate_token(user: User) -> str:
     Args:
         user: User object to generate token for.
 
+    With JWT_COMPACT_ROLES enabled, known roles are encoded as a bitmask in
+    the "rb" claim and only roles without a bit are listed in "roles".
+
     Returns:
         JWT access token string containing user ID, roles, and school_id in claims.
     """
     roles = [role.name for role in user.roles]
 
-    additional_claims = {"roles": roles, "school_id": user.school_id}
+    if current_app.config.get("JWT_COMPACT_ROLES"):
+        additional_claims = {"rb": roles_to_mask(roles), "school_id": user.school_id}
+        unknown_roles = [name for name in roles if name not in ROLE_BITS]
+        if unknown_roles:
+            additional_claims["roles"] = unknown_roles
+    else:
+        additional_claims = {"roles": roles, "school_id": user.school_id}
 
     return create_access_token(
         identity=str(user.id), additional_claims=additional_claims
     )
 
 
+def generate_refresh_token(user: User) -> str:
+    """Generate a JWT refresh token for a user.
+
+    Args:
+        user: User object to generate token for.
+
+    Returns:
+        JWT refresh token string; it only carries the user ID, roles are
+        read again from the database when it is exchanged.
+    """
+    return create_refresh_token(identity=str(user.id))
+
+
 def get_current_user_id() -> Optional[int]:
     """Get the ID of the currently authenticated user from JWT.
 
     Returns:
         User ID if token is valid, None otherwise.
     """
-    try:
-        return get_jwt_identity()
-    except Exception:
-        return None
+    return get_auth_context().user_id
 
 
 def get_current_user() -> Optional[User]:
     """Get the currently authenticated user object.
 
+    The user is loaded on first use and cached for the rest of the request.
+
     Returns:
         User object if found, None otherwise.
     """
     user_id = get_current_user_id()
-    if user_id:
-        return db.session.query(User).filter(User.id == user_id).first()
-    return None
+    if not user_id:
+        return None
+
+    if not has_request_context():
+        return db.session.get(User, user_id)
+
+    if "auth_user" not in g:
+        g.auth_user = db.session.get(User, user_id)
+    return g.auth_user
 
 
 def get_current_user_roles() -> List[str]:
@@ -54,13 +84,7 @@ def get_current_user_roles() -> List[str]:
     Returns:
         List of role names from JWT claims, empty list if not found.
     """
-    from flask_jwt_extended import get_jwt
-
-    try:
-        claims = get_jwt()
-        return claims.get("roles", [])
-    except Exception:
-        return []
+    return list(get_auth_context().roles)
 
 
 def get_current_user_school_id() -> Optional[int]:
@@ -69,13 +93,7 @@ def get_current_user_school_id() -> Optional[int]:
     Returns:
         School ID from JWT claims, None otherwise.
     """
-    from flask_jwt_extended import get_jwt
-
-    try:
-        claims = get_jwt()
-        return claims.get("school_id")
-    except Exception:
-        return None
+    return get_auth_context().school_id
 
 
 def has_role(role_name: str) -> bool:
@@ -87,7 +105,7 @@ def has_role(role_name: str) -> bool:
     Returns:
         True if user has the role, False otherwise.
     """
-    return role_name in get_current_user_roles()
+    return role_name in get_auth_context().roles
 
 
 def has_any_role(*role_names: str) -> bool:
@@ -99,9 +117,7 @@ def has_any_role(*role_names: str) -> bool:
     Returns:
         True if user has at least one of the roles, False otherwise.
     """
-    user_roles = set(get_current_user_roles())
-    required_roles = set(role_names)
-    return bool(user_roles.intersection(required_roles))
+    return not get_auth_context().roles.isdisjoint(role_names)
 
 
 def is_admin_secretaria() -> bool:
@@ -110,7 +126,7 @@ def is_admin_secretaria() -> bool:
     Returns:
         True if user is admin_secretaria, False otherwise.
     """
-    return has_role("admin_secretaria")
+    return get_auth_context().is_secretaria
 
 
 def is_admin_escola() -> bool:
@@ -119,7 +135,7 @@ def is_admin_escola() -> bool:
     Returns:
         True if user is admin_escola, False otherwise.
     """
-    return has_role("admin_escola")
+    return get_auth_context().is_escola
 
 
 def is_any_admin() -> bool:
@@ -128,4 +144,4 @@ def is_any_admin() -> bool:
     Returns:
         True if user is admin_secretaria or admin_escola, False otherwise.
     """
-    return is_admin_secretaria() or is_admin_escola()
+    return get_auth_context().is_any_admin
@@ -0,0 +1,177 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.db_config import db
+from src.domain.enums.school_type import SchoolType
+from src.domain.school_filters import SchoolFilters
+from src.repositories.school_repository import SchoolRepository
+from src.services.school_validation import validate_school_fields
+from src.utils.count_cache import school_count_cache
+
+MAX_BATCH_SIZE = 1000
+
+# Largest id list accepted by bulk delete/restore; filters are unbounded
+MAX_BULK_IDS = 10_000
+
+
+class SchoolBatchService:
+    @staticmethod
+    def save_schools(items: List[Any]) -> Dict[str, Any]:
+        """Create and update many schools in one transaction.
+
+        Items without an "id" are created and items with one update that
+        school, with the same field semantics as POST and PUT. Every item is
+        validated before anything is written, existing IDs are checked with
+        one query, and valid items are written with one multi-row INSERT and
+        executemany UPDATEs by primary key, followed by a single commit.
+        Invalid items never stop the batch; they are reported by index.
+
+        Args:
+            items: School payloads from the request body.
+
+        Returns:
+            Dictionary with created, updated and failed counts and one
+            result per item, in request order.
+        """
+        results: List[Dict[str, Any]] = [None] * len(items)
+        creates: List[Tuple[int, Dict[str, Any]]] = []
+        updates: List[Tuple[int, Dict[str, Any]]] = []
+        seen_ids = set()
+
+        for index, item in enumerate(items):
+            values, error = SchoolBatchService._validate(item)
+            if error is None and "id" in values:
+                if values["id"] in seen_ids:
+                    error = "Escola repetida no lote"
+                seen_ids.add(values["id"])
+
+            if error is not None:
+                results[index] = {"index": index, "status": "error", "error": error}
+            elif "id" in values:
+                updates.append((index, values))
+            else:
+                creates.append((index, values))
+
+        existing_ids = SchoolRepository.find_existing_ids(
+            values["id"] for _, values in updates
+        )
+        valid_updates = []
+        for index, values in updates:
+            if values["id"] in existing_ids:
+                valid_updates.append((index, values))
+            else:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "error": "Escola não encontrada",
+                }
+
+        created_ids = SchoolRepository.bulk_create_schools(
+            [values for _, values in creates]
+        )
+        SchoolRepository.bulk_update_schools([values for _, values in valid_updates])
+        db.session.commit()
+        SchoolRepository.invalidate_cached(values["id"] for _, values in valid_updates)
+
+        if creates or valid_updates:
+            school_count_cache.clear()
+
+        for (index, _), school_id in zip(creates, created_ids):
+            results[index] = {"index": index, "status": "created", "id": school_id}
+        for index, values in valid_updates:
+            results[index] = {"index": index, "status": "updated", "id": values["id"]}
+
+        return {
+            "created": len(creates),
+            "updated": len(valid_updates),
+            "failed": len(items) - len(creates) - len(valid_updates),
+            "results": results,
+        }
+
+    @staticmethod
+    def _validate(item: Any) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Validate one batch item and map it to School column values.
+
+        Args:
+            item: School payload.
+
+        Returns:
+            Tuple (column values, error message). Values include "id" for
+            updates; the error is None when the item is valid.
+        """
+        if not isinstance(item, dict):
+            return {}, "Dados inválidos"
+
+        values: Dict[str, Any] = {}
+        is_update = item.get("id") is not None
+
+        if is_update:
+            school_id = item["id"]
+            if isinstance(school_id, bool) or not isinstance(school_id, int):
+                return {}, "Campo 'id' inválido"
+            values["id"] = school_id
+        else:
+            for field in ("name", "address", "school_type"):
+                if item.get(field) is None:
+                    return {}, f"Campo '{field}' é obrigatório"
+
+        fields, error = validate_school_fields(item)
+        if error is not None:
+            return {}, error
+        values.update(fields)
+
+        if is_update and len(values) == 1:
+            return {}, "Nenhum campo para atualizar"
+
+        return values, None
+
+    @staticmethod
+    def set_deleted(deleted: bool, data: Any) -> Tuple[Optional[int], Optional[str]]:
+        """Soft delete or restore many schools selected by IDs or a filter.
+
+        Args:
+            deleted: True to soft delete, False to restore.
+            data: Request body with "ids" (list of school IDs) or "filter"
+                (object with school_type, state and/or city); when both are
+                given, only the listed schools that match the filter change.
+
+        Returns:
+            Tuple (number of schools changed, error message). The count is
+            None when the body is invalid.
+        """
+        if not isinstance(data, dict):
+            return None, "Dados inválidos"
+
+        school_ids = data.get("ids")
+        if school_ids is not None:
+            if not isinstance(school_ids, list) or any(
+                isinstance(school_id, bool) or not isinstance(school_id, int)
+                for school_id in school_ids
+            ):
+                return None, "Campo 'ids' deve ser uma lista de IDs"
+            if len(school_ids) > MAX_BULK_IDS:
+                return None, f"Máximo de {MAX_BULK_IDS} escolas por lote"
+
+        raw_filter = data.get("filter")
+        if raw_filter is None:
+            raw_filter = {}
+        elif not isinstance(raw_filter, dict):
+            return None, "Campo 'filter' deve ser um objeto"
+
+        school_type = raw_filter.get("school_type")
+        if school_type is not None:
+            try:
+                school_type = SchoolType(str(school_type).lower())
+            except ValueError:
+                return None, "Tipo de escola inválido"
+
+        filters = SchoolFilters(
+            school_type=school_type,
+            state=str(raw_filter.get("state") or "").strip().upper() or None,
+            city=str(raw_filter.get("city") or "").strip() or None,
+        )
+
+        if school_ids is None and filters == SchoolFilters():
+            # Never touch the whole table by accident
+            return None, "Informe 'ids' ou ao menos um filtro"
+
+        return SchoolRepository.bulk_set_deleted(deleted, filters, school_ids), None
@@ -0,0 +1,174 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.enums.class_grade import ClassGrade
+from src.repositories.school_class_repository import SchoolClassRepository
+from src.repositories.school_repository import SchoolRepository
+
+# Largest class accepted; keeps typos like 3000 out of the seat totals
+MAX_CLASS_CAPACITY = 200
+
+
+def parse_class_grade(value: Any) -> Optional[ClassGrade]:
+    """Parse a grade given by name (e.g., "SECOND_YEAR") or number (e.g., 2).
+
+    Args:
+        value: Grade from a request body or query string.
+
+    Returns:
+        The ClassGrade, None if the value is not a grade.
+    """
+    if isinstance(value, bool):
+        return None
+
+    if isinstance(value, str):
+        value = value.strip()
+        if value.isdigit():
+            value = int(value)
+        else:
+            return ClassGrade.__members__.get(value.upper())
+
+    try:
+        return ClassGrade(value)
+    except ValueError:
+        return None
+
+
+def validate_class_fields(
+    data: Dict[str, Any], partial: bool = False
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Validate the class_grade and capacity of a class payload.
+
+    Args:
+        data: Class payload.
+        partial: If True, absent fields are allowed (PUT); otherwise both
+            are required (POST).
+
+    Returns:
+        Tuple (values with class_grade and/or capacity, error message); the
+        error is None when the payload is valid.
+    """
+    values: Dict[str, Any] = {}
+
+    if data.get("class_grade") is not None:
+        class_grade = parse_class_grade(data["class_grade"])
+        if class_grade is None:
+            return {}, "Série inválida"
+        values["class_grade"] = class_grade
+    elif not partial:
+        return {}, "Campo 'class_grade' é obrigatório"
+
+    if data.get("capacity") is not None:
+        capacity = data["capacity"]
+        if (
+            isinstance(capacity, bool)
+            or not isinstance(capacity, int)
+            or not 0 < capacity <= MAX_CLASS_CAPACITY
+        ):
+            return {}, f"Campo 'capacity' deve estar entre 1 e {MAX_CLASS_CAPACITY}"
+        values["capacity"] = capacity
+    elif not partial:
+        return {}, "Campo 'capacity' é obrigatório"
+
+    return values, None
+
+
+class SchoolClassService:
+    @staticmethod
+    def school_exists(school_id: int) -> bool:
+        """Check that a school exists and is not deleted.
+
+        Args:
+            school_id: School ID.
+
+        Returns:
+            True if the school is live.
+        """
+        return bool(SchoolRepository.find_existing_ids([school_id]))
+
+    @staticmethod
+    def get_classes(school_id: int) -> List[Any]:
+        """Get the classes of a school.
+
+        Args:
+            school_id: School ID.
+
+        Returns:
+            Class rows (SCHOOL_CLASS_COLUMNS attributes), ordered by ID.
+        """
+        return SchoolClassRepository.get_by_school_ids([school_id])[school_id]
+
+    @staticmethod
+    def create_class(
+        school_id: int, data: Dict[str, Any]
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """Create a class in a school.
+
+        Args:
+            school_id: School ID.
+            data: Class payload (class_grade, capacity).
+
+        Returns:
+            Tuple (created class row, error message).
+        """
+        values, error = validate_class_fields(data)
+        if error is not None:
+            return None, error
+
+        class_id = SchoolClassRepository.create_class(school_id, **values)
+        return SchoolClassRepository.find_row(school_id, class_id), None
+
+    @staticmethod
+    def update_class(
+        school_id: int, class_id: int, data: Dict[str, Any]
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """Change the grade and/or capacity of a class.
+
+        Args:
+            school_id: School ID.
+            class_id: Class ID.
+            data: Partial class payload (class_grade, capacity).
+
+        Returns:
+            Tuple (updated class row, error message). Both are None if the
+            class was not found.
+
+        Raises:
+            ClassNotEmptyError: If capacity is below the current enrollments.
+        """
+        values, error = validate_class_fields(data, partial=True)
+        if error is not None:
+            return None, error
+
+        if not values:
+            return None, "Nenhum campo para atualizar"
+
+        if not SchoolClassRepository.update_class(school_id, class_id, **values):
+            return None, None
+
+        return SchoolClassRepository.find_row(school_id, class_id), None
+
+    @staticmethod
+    def enroll(
+        school_id: int, class_id: int, data: Dict[str, Any]
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Enroll a student in a class.
+
+        Args:
+            school_id: School ID.
+            class_id: Class ID.
+            data: Enrollment payload (student_name).
+
+        Returns:
+            Tuple (enrollment ID, error message). Both are None if the class
+            was not found.
+
+        Raises:
+            ClassFullError: If the class has no free seat.
+        """
+        student_name = data.get("student_name")
+        if not isinstance(student_name, str) or not student_name.strip():
+            return None, "Campo 'student_name' é obrigatório"
+        if len(student_name) > 80:
+            return None, "Campo 'student_name' excede o tamanho máximo"
+
+        return SchoolClassRepository.enroll(school_id, class_id, student_name.strip()), None
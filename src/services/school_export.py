@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+from typing import Any, Iterable, Iterator
+
+from src.utils.serializers import serialize_school_row
+
+# Rows written per chunk; the first chunk (header) is sent right away
+CHUNK_ROWS = 500
+
+CSV_COLUMNS = (
+    "id",
+    "name",
+    "street",
+    "number",
+    "neighborhood",
+    "city",
+    "state",
+    "zip_code",
+    "school_type",
+)
+
+
+def iter_ndjson(rows: Iterable[Any], include_deleted: bool = False) -> Iterator[str]:
+    """Encode export rows as NDJSON, one school per line.
+
+    Args:
+        rows: Rows from SchoolRepository.iter_schools.
+        include_deleted: Whether to include the deleted_at field.
+
+    Yields:
+        Chunks of NDJSON text.
+    """
+    lines = []
+    for row in rows:
+        data = serialize_school_row(row, include_deleted)
+        lines.append(json.dumps(data, ensure_ascii=False))
+        if len(lines) >= CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(rows: Iterable[Any], include_deleted: bool = False) -> Iterator[str]:
+    """Encode export rows as CSV with a header row.
+
+    Args:
+        rows: Rows from SchoolRepository.iter_schools.
+        include_deleted: Whether to add a deleted_at column.
+
+    Yields:
+        Chunks of CSV text.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    header = list(CSV_COLUMNS)
+    if include_deleted:
+        header.append("deleted_at")
+    writer.writerow(header)
+    yield buffer.getvalue()
+
+    buffer.seek(0)
+    buffer.truncate()
+    pending = 0
+
+    for row in rows:
+        values = [
+            row.id,
+            row.name,
+            row.address_street,
+            row.address_number,
+            row.address_neighborhood,
+            row.address_city,
+            row.address_state,
+            row.address_zip_code,
+            row.school_type.value if row.school_type else None,
+        ]
+        if include_deleted:
+            values.append(row.deleted_at.isoformat() if row.deleted_at else None)
+        writer.writerow(values)
+
+        pending += 1
+        if pending >= CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if pending:
+        yield buffer.getvalue()
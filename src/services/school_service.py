@@ -1,8 +1,21 @@
-from typing import Dict, Any, List, Optional
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
+from src.repositories.school_class_repository import SchoolClassRepository
 from src.repositories.school_repository import SchoolRepository
-from src.services.auth_service import is_admin_secretaria, get_current_user_school_id
+from src.repositories.user_repository import UserRepository
+from src.services.auth_context import get_auth_context
+from src.services.school_validation import validate_school_fields
+from src.domain.enums.count_strategy import CountStrategy
 from src.domain.enums.school_type import SchoolType
+from src.domain.school_filters import SchoolFilters
+from src.utils.cache import school_cache
+from src.utils.serializers import (
+    serialize_school_class_row,
+    serialize_school_row,
+    serialize_user_row,
+)
 
 
 class SchoolService:
@@ -90,58 +103,317 @@ class SchoolService:
 
         return None
 
+    @staticmethod
+    def _scoped_filters(filters: SchoolFilters) -> Optional[SchoolFilters]:
+        """Restrict filters to the schools the current user can see.
+
+        Args:
+            filters: Filters requested by the user.
+
+        Returns:
+            Filters scoped to the user's school for admin_escola, or None if
+            the user cannot see any school.
+        """
+        auth = get_auth_context()
+        if auth.is_secretaria:
+            # admin_secretaria can see all schools
+            return filters
+
+        # admin_escola can only see their own school
+        if not auth.school_id:
+            return None
+        return replace(filters, school_id=auth.school_id)
+
+    @staticmethod
+    def patch_school(
+        school_id: int, data: Dict[str, Any]
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """Apply a partial update to a school.
+
+        Only the fields sent are changed; inside address, only the keys
+        sent are changed.
+
+        Args:
+            school_id: School ID to update.
+            data: Partial school payload (name, address, school_type).
+
+        Returns:
+            Tuple (updated row from SchoolRepository.patch_school, error
+            message). Both are None if the school was not found.
+        """
+        values, error = validate_school_fields(data, partial_address=True)
+        if error is not None:
+            return None, error
+
+        if not values:
+            return None, "Nenhum campo para atualizar"
+
+        return SchoolRepository.patch_school(school_id, values), None
+
+    @staticmethod
+    def get_school_payload(
+        school_id: int, include_deleted: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Get a serialized school, reading through school_cache.
+
+        Payloads are cached per school and include_deleted, and dropped by
+        the repository whenever the school is written.
+
+        Args:
+            school_id: School ID.
+            include_deleted: Whether deleted schools are returned, with
+                their deleted_at field.
+
+        Returns:
+            Dictionary with the school data ("school"), its "version" and
+            "updated_at" (ISO 8601), None if not found.
+        """
+        key = SchoolRepository.payload_cache_key(school_id, include_deleted)
+        entry = school_cache.get(key)
+        if entry is not None:
+            return entry
+
+        school = SchoolRepository.find_by_id(school_id, include_deleted=include_deleted)
+        if not school:
+            return None
+
+        entry = {
+            "school": school.to_dict(include_deleted=include_deleted),
+            "version": school.version,
+            "updated_at": school.updated_at.isoformat(),
+        }
+        school_cache.set(key, entry)
+        return entry
+
     @staticmethod
     def get_accessible_schools(
-        page: int = 1, per_page: int = 20, include_deleted: bool = False
+        page: int = 1,
+        per_page: int = 20,
+        include_deleted: bool = False,
+        count: CountStrategy = CountStrategy.EXACT,
+        filters: Optional[SchoolFilters] = None,
+        fields: Optional[FrozenSet[str]] = None,
+        total: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get schools based on user permissions.
 
         Args:
             page: Page number.
             per_page: Items per page.
-            include_deleted: Whether to include deleted schools.
+            include_deleted: Whether to include deleted schools; ignored when
+                filters are given.
+            count: Strategy used to compute the total.
+            filters: Type, address and deleted filters.
+            fields: Fields to load (see SCHOOL_FIELDS), None for all.
+            total: Exact total from get_accessible_schools_state, if known.
 
         Returns:
             Dictionary with schools and pagination info.
         """
-        if is_admin_secretaria():
-            # admin_secretaria can see all schools
-            return SchoolRepository.get_paginated_schools(
-                page=page, per_page=per_page, include_deleted=include_deleted
-            )
-        else:
-            # admin_escola can only see their own school
-            user_school_id = get_current_user_school_id()
-            if not user_school_id:
-                return {
-                    "schools": [],
-                    "pagination": {
-                        "page": page,
-                        "per_page": per_page,
-                        "total": 0,
-                        "pages": 0,
-                        "has_next": False,
-                        "has_prev": False,
-                    },
-                }
-
-            school = SchoolRepository.find_by_id(
-                user_school_id, include_deleted=include_deleted
-            )
-            schools = [school] if school else []
+        if filters is None:
+            filters = SchoolFilters(include_deleted=include_deleted)
 
+        scoped = SchoolService._scoped_filters(filters)
+        if scoped is None:
             return {
-                "schools": schools,
+                "schools": [],
                 "pagination": {
                     "page": page,
                     "per_page": per_page,
-                    "total": len(schools),
-                    "pages": 1,
+                    "total": 0,
+                    "pages": 0,
                     "has_next": False,
                     "has_prev": False,
+                    "count": CountStrategy.EXACT.value,
+                },
+            }
+
+        return SchoolRepository.get_paginated_schools(
+            page=page,
+            per_page=per_page,
+            count=count,
+            filters=scoped,
+            fields=fields,
+            total=total,
+        )
+
+    @staticmethod
+    def get_accessible_schools_state(
+        filters: SchoolFilters,
+    ) -> Tuple[int, Optional[datetime]]:
+        """Get the state of the listing visible to the current user.
+
+        Args:
+            filters: Type, address and deleted filters.
+
+        Returns:
+            Tuple (number of matching schools, latest updated_at or None).
+        """
+        scoped = SchoolService._scoped_filters(filters)
+        if scoped is None:
+            return 0, None
+
+        return SchoolRepository.get_collection_state(scoped)
+
+    @staticmethod
+    def get_accessible_schools_by_cursor(
+        cursor: Optional[str] = None,
+        per_page: int = 20,
+        include_deleted: bool = False,
+        filters: Optional[SchoolFilters] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get schools based on user permissions using cursor pagination.
+
+        Args:
+            cursor: Opaque cursor from the previous page.
+            per_page: Items per page.
+            include_deleted: Whether to include deleted schools; ignored when
+                filters are given.
+            filters: Type, address and deleted filters.
+            fields: Fields to load (see SCHOOL_FIELDS), None for all.
+
+        Returns:
+            Dictionary with schools and cursor pagination info.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        if filters is None:
+            filters = SchoolFilters(include_deleted=include_deleted)
+
+        scoped = SchoolService._scoped_filters(filters)
+        if scoped is None:
+            return {
+                "schools": [],
+                "pagination": {
+                    "mode": "cursor",
+                    "per_page": per_page,
+                    "next_cursor": None,
+                    "has_next": False,
                 },
             }
 
+        return SchoolRepository.get_schools_by_cursor(
+            cursor=cursor, per_page=per_page, filters=scoped, fields=fields
+        )
+
+    @staticmethod
+    def iter_accessible_schools(filters: SchoolFilters) -> Iterator[Any]:
+        """Stream the school rows visible to the current user.
+
+        Args:
+            filters: Type, address and deleted filters.
+
+        Returns:
+            Iterator of rows as returned by SchoolRepository.iter_schools.
+        """
+        scoped = SchoolService._scoped_filters(filters)
+        if scoped is None:
+            return iter(())
+
+        return SchoolRepository.iter_schools(scoped)
+
+    @staticmethod
+    def search_accessible_schools(
+        query_text: str, limit: int = 20, include_deleted: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Search schools visible to the current user.
+
+        Args:
+            query_text: Text to search in name and address.
+            limit: Maximum number of results.
+            include_deleted: Whether to include deleted schools.
+
+        Returns:
+            List of school dictionaries with a relevance score, best first.
+        """
+        auth = get_auth_context()
+
+        if auth.is_secretaria:
+            school_id = None
+        elif auth.school_id:
+            # admin_escola can only find their own school
+            school_id = auth.school_id
+        else:
+            return []
+
+        results = SchoolRepository.search_schools(
+            query_text,
+            limit=limit,
+            include_deleted=include_deleted,
+            school_id=school_id,
+        )
+
+        schools = []
+        for school, score in results:
+            data = school.to_dict(include_deleted=include_deleted)
+            data["score"] = round(score, 4)
+            schools.append(data)
+        return schools
+
+    @staticmethod
+    def _accessible_ids(school_ids: Iterable[int]) -> List[int]:
+        """Keep only the school IDs the current user can see."""
+        auth = get_auth_context()
+        if auth.is_secretaria:
+            return list(school_ids)
+        return [school_id for school_id in school_ids if school_id == auth.school_id]
+
+    @staticmethod
+    def get_school_includes(
+        school_ids: Iterable[int], includes: FrozenSet[str]
+    ) -> Dict[str, Dict[int, List[Dict[str, Any]]]]:
+        """Load related data of many schools, one query per relation.
+
+        Schools the current user cannot see get no related data.
+
+        Args:
+            school_ids: IDs of the listed schools.
+            includes: Relations to load (see SCHOOL_INCLUDES).
+
+        Returns:
+            Dictionary mapping each relation to {school ID: serialized items}.
+        """
+        school_ids = SchoolService._accessible_ids(school_ids)
+        loaded: Dict[str, Dict[int, List[Dict[str, Any]]]] = {}
+
+        if "users" in includes:
+            users = UserRepository.get_by_school_ids(school_ids)
+            roles = UserRepository.get_role_names(
+                row.id for rows in users.values() for row in rows
+            )
+            loaded["users"] = {
+                school_id: [serialize_user_row(row, roles[row.id]) for row in rows]
+                for school_id, rows in users.items()
+            }
+
+        if "school_classes" in includes:
+            classes = SchoolClassRepository.get_by_school_ids(school_ids)
+            loaded["school_classes"] = {
+                school_id: [serialize_school_class_row(row) for row in rows]
+                for school_id, rows in classes.items()
+            }
+
+        return loaded
+
+    @staticmethod
+    def get_accessible_schools_by_ids(
+        school_ids: Iterable[int],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get many live schools visible to the current user with one query.
+
+        Args:
+            school_ids: School IDs.
+
+        Returns:
+            Dictionary mapping school IDs to serialized schools; schools the
+            user cannot see or that do not exist are left out.
+        """
+        school_ids = SchoolService._accessible_ids(set(school_ids))
+        rows = SchoolRepository.get_by_ids(school_ids)
+        return {school_id: serialize_school_row(row) for school_id, row in rows.items()}
+
     @staticmethod
     def validate_school_access(school_id: int) -> bool:
         """Check if current user can access a specific school.
@@ -152,10 +424,11 @@ class SchoolService:
         Returns:
             True if user has access, False otherwise.
         """
-        if is_admin_secretaria():
+        auth = get_auth_context()
+        if auth.is_secretaria:
             return True
 
-        user_school_id = get_current_user_school_id()
+        user_school_id = auth.school_id
         return user_school_id == school_id
 
     @staticmethod
@@ -164,6 +437,7 @@ class SchoolService:
         page: int = 1,
         per_page: int = 20,
         include_deleted: bool = False,
+        count: CountStrategy = CountStrategy.EXACT,
     ) -> Optional[Dict[str, Any]]:
         """Get schools filtered by type based on user permissions.
 
@@ -172,6 +446,7 @@ class SchoolService:
             page: Page number.
             per_page: Items per page.
             include_deleted: Whether to include deleted schools.
+            count: Strategy used to compute the total.
 
         Returns:
             Dictionary with schools and pagination info, None if invalid type.
@@ -181,56 +456,14 @@ class SchoolService:
         except ValueError:
             return None
 
-        if is_admin_secretaria():
-            return SchoolRepository.get_schools_by_type_paginated(
-                school_type=school_type_enum,
-                page=page,
-                per_page=per_page,
-                include_deleted=include_deleted,
-            )
-        else:
-            # admin_escola can only see their own school
-            user_school_id = get_current_user_school_id()
-            if not user_school_id:
-                return {
-                    "schools": [],
-                    "pagination": {
-                        "page": page,
-                        "per_page": per_page,
-                        "total": 0,
-                        "pages": 0,
-                        "has_next": False,
-                        "has_prev": False,
-                    },
-                }
-
-            school = SchoolRepository.find_by_id(
-                user_school_id, include_deleted=include_deleted
-            )
-            if school and school.school_type == school_type_enum:
-                return {
-                    "schools": [school],
-                    "pagination": {
-                        "page": page,
-                        "per_page": per_page,
-                        "total": 1,
-                        "pages": 1,
-                        "has_next": False,
-                        "has_prev": False,
-                    },
-                }
-            else:
-                return {
-                    "schools": [],
-                    "pagination": {
-                        "page": page,
-                        "per_page": per_page,
-                        "total": 0,
-                        "pages": 0,
-                        "has_next": False,
-                        "has_prev": False,
-                    },
-                }
+        return SchoolService.get_accessible_schools(
+            page=page,
+            per_page=per_page,
+            count=count,
+            filters=SchoolFilters(
+                school_type=school_type_enum, include_deleted=include_deleted
+            ),
+        )
 
     @staticmethod
     def restore_school(school_id: int) -> bool:
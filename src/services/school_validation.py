@@ -0,0 +1,69 @@
+from typing import Any, Dict, Optional, Tuple
+
+from src.domain.enums.school_type import SchoolType
+from src.models.school import School
+
+# Request address keys and the School columns they map to
+ADDRESS_COLUMNS = {
+    "street": "address_street",
+    "number": "address_number",
+    "neighborhood": "address_neighborhood",
+    "city": "address_city",
+    "state": "address_state",
+    "zip_code": "address_zip_code",
+}
+
+
+def _column_length(column: str) -> Optional[int]:
+    return School.__table__.c[column].type.length
+
+
+def validate_school_fields(
+    data: Dict[str, Any], partial_address: bool = False
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Validate the name, address and school_type of a school payload.
+
+    Fields that are absent or null are left out of the result.
+
+    Args:
+        data: School payload.
+        partial_address: If True, only the address keys that were sent are
+            returned (PATCH); otherwise missing keys are blanked (POST/PUT).
+
+    Returns:
+        Tuple (School column values, error message); the error is None when
+        the payload is valid.
+    """
+    values: Dict[str, Any] = {}
+
+    if data.get("name") is not None:
+        name = data["name"]
+        if not isinstance(name, str) or not name.strip():
+            return {}, "Campo 'name' inválido"
+        if len(name) > _column_length("name"):
+            return {}, "Campo 'name' excede o tamanho máximo"
+        values["name"] = name
+
+    address = data.get("address")
+    if address is not None:
+        if not isinstance(address, dict):
+            return {}, "Campo 'address' deve ser um objeto"
+        for key, column in ADDRESS_COLUMNS.items():
+            if partial_address and key not in address:
+                continue
+            value = address.get(key, "")
+            if value is None:
+                value = ""
+            if not isinstance(value, str):
+                return {}, f"Campo 'address.{key}' inválido"
+            if len(value) > _column_length(column):
+                return {}, f"Campo 'address.{key}' excede o tamanho máximo"
+            values[column] = value
+
+    if data.get("school_type") is not None:
+        try:
+            values["school_type"] = SchoolType(data["school_type"])
+        except (TypeError, ValueError):
+            return {}, "Tipo de escola inválido"
+
+    return values, None
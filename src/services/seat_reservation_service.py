@@ -0,0 +1,64 @@
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from flask import current_app
+
+from src.repositories.seat_reservation_repository import SeatReservationRepository
+
+# Client-chosen reservation IDs, e.g. a UUID
+RESERVATION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+
+
+def hold_duration() -> timedelta:
+    """How long an unconfirmed reservation keeps its seat.
+
+    Config keys:
+        SEAT_HOLD_MINUTES: Hold duration in minutes (default: 15).
+
+    Returns:
+        Hold duration.
+    """
+    minutes = current_app.config.get("SEAT_HOLD_MINUTES") or os.getenv(
+        "SEAT_HOLD_MINUTES", "15"
+    )
+    return timedelta(minutes=float(minutes))
+
+
+class SeatReservationService:
+    @staticmethod
+    def hold(
+        class_id: int, reservation_id: str, data: Dict[str, Any]
+    ) -> Tuple[Optional[Any], bool, Optional[str]]:
+        """Hold a seat of a class for a student.
+
+        Args:
+            class_id: Class ID.
+            reservation_id: Client-chosen reservation ID.
+            data: Reservation payload (student_name).
+
+        Returns:
+            Tuple (reservation row, True if created by this call, error
+            message).
+
+        Raises:
+            ReservationConflictError: If the ID belongs to another class.
+            ClassFullError: If the class has no free seat.
+        """
+        if not RESERVATION_ID_PATTERN.match(reservation_id):
+            return None, False, "ID de reserva inválido"
+
+        student_name = data.get("student_name")
+        if not isinstance(student_name, str) or not student_name.strip():
+            return None, False, "Campo 'student_name' é obrigatório"
+        if len(student_name) > 80:
+            return None, False, "Campo 'student_name' excede o tamanho máximo"
+
+        row, created = SeatReservationRepository.hold(
+            class_id,
+            reservation_id,
+            student_name.strip(),
+            datetime.utcnow() + hold_duration(),
+        )
+        return row, created, None
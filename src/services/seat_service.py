@@ -0,0 +1,70 @@
+from typing import Any, Dict, Optional
+
+from src.domain.enums.class_grade import ClassGrade
+from src.repositories.school_class_repository import SchoolClassRepository
+from src.repositories.seat_repository import SeatRepository
+from src.utils.serializers import serialize_school_class_row, serialize_seat_row
+
+
+class SeatService:
+    @staticmethod
+    def get_school_seats(school_id: int) -> Dict[str, Any]:
+        """Get the seats of a school per grade and per class.
+
+        Both come from maintained counters (seat_summaries and
+        school_classes.enrolled/held); nothing is aggregated at read time.
+        Seats held by unconfirmed reservations are not free.
+
+        Args:
+            school_id: School ID.
+
+        Returns:
+            Dictionary with school_id, "grades" (capacity, enrolled, held and
+            free seats per grade) and "classes" (the same per class).
+        """
+        grades = [
+            {
+                "class_grade": row.class_grade.name,
+                "capacity": row.capacity,
+                "enrolled": row.enrolled,
+                "held": row.held,
+                "free": row.capacity - row.enrolled - row.held,
+            }
+            for row in SeatRepository.get_school_seats(school_id)
+        ]
+        classes = SchoolClassRepository.get_by_school_ids([school_id])[school_id]
+
+        return {
+            "school_id": school_id,
+            "grades": grades,
+            "classes": [serialize_school_class_row(row) for row in classes],
+        }
+
+    @staticmethod
+    def get_available_seats(
+        class_grade: Optional[ClassGrade] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> Dict[str, Any]:
+        """Get the schools with free seats, statewide.
+
+        Args:
+            class_grade: Only this grade, None for all grades.
+            city: Exact city name, None for any city.
+            state: State abbreviation, None for any state.
+            page: Page number.
+            per_page: Items per page.
+
+        Returns:
+            Dictionary with "vagas" (one item per school and grade) and
+            pagination info.
+        """
+        result = SeatRepository.get_available_seats(
+            class_grade=class_grade, city=city, state=state, page=page, per_page=per_page
+        )
+        return {
+            "vagas": [serialize_seat_row(row) for row in result["vagas"]],
+            "pagination": result["pagination"],
+        }
@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from src.repositories.revoked_token_repository import RevokedTokenRepository
+from src.utils.bloom_filter import BloomFilter
+
+
+class TokenRevocationStore:
+    """In-memory view of the revoked_tokens table.
+
+    Revoked JTIs are kept in a Bloom filter that is refreshed incrementally
+    (only rows with an id above the last one seen) at most every
+    ``refresh_seconds``. A token whose JTI is not in the filter is known to
+    be valid without touching the database; only filter hits, i.e. revoked
+    tokens and rare false positives, are confirmed with a query.
+    """
+
+    def __init__(self):
+        self.capacity = 100_000
+        self.error_rate = 0.001
+        self.refresh_seconds = 5.0
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._last_id = 0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Configure the store from the application config.
+
+        Config keys:
+            JWT_REVOCATION_CAPACITY: Expected live revocations (default: 100000).
+            JWT_REVOCATION_REFRESH_SECONDS: Max staleness of the in-memory
+                filter for revocations made by other processes (default: 5).
+
+        Args:
+            app: Flask application instance.
+        """
+        self.capacity = int(
+            app.config.get(
+                "JWT_REVOCATION_CAPACITY", os.getenv("JWT_REVOCATION_CAPACITY", 100_000)
+            )
+        )
+        self.refresh_seconds = float(
+            app.config.get(
+                "JWT_REVOCATION_REFRESH_SECONDS",
+                os.getenv("JWT_REVOCATION_REFRESH_SECONDS", 5),
+            )
+        )
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._last_id = 0
+        self._last_refresh = 0.0
+
+    def _refresh(self) -> None:
+        """Load revocations recorded since the last refresh."""
+        if time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return
+
+        # Only one thread refreshes; the others keep using the current filter
+        if not self._lock.acquire(blocking=False):
+            return
+
+        try:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+            if self._bloom.count >= self.capacity:
+                # Filter is saturated: rebuild it without expired tokens
+                self._reset()
+
+            for row_id, jti in RevokedTokenRepository.get_revoked_since(
+                self._last_id, now=now
+            ):
+                self._bloom.add(jti)
+                self._last_id = row_id
+
+            self._last_refresh = time.monotonic()
+        finally:
+            self._lock.release()
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """Check whether a token was revoked.
+
+        Args:
+            jti: Unique identifier of the token.
+
+        Returns:
+            True if the token is revoked, False otherwise.
+        """
+        if not jti:
+            return False
+
+        self._refresh()
+
+        if jti not in self._bloom:
+            return False
+
+        return RevokedTokenRepository.exists(jti)
+
+    def check_blocklist(self, jwt_header: Dict[str, Any], jwt_data: Dict[str, Any]) -> bool:
+        """flask_jwt_extended token_in_blocklist_loader callback.
+
+        Args:
+            jwt_header: Decoded JWT header.
+            jwt_data: Decoded JWT payload.
+
+        Returns:
+            True if the token is revoked.
+        """
+        return self.is_revoked(jwt_data.get("jti"))
+
+    def revoke(self, jwt_data: Dict[str, Any]) -> bool:
+        """Revoke a token.
+
+        Args:
+            jwt_data: Decoded JWT payload of the token to revoke.
+
+        Returns:
+            True if the token was revoked now, False if it already was.
+        """
+        expires_at = None
+        if jwt_data.get("exp") is not None:
+            expires_at = datetime.fromtimestamp(jwt_data["exp"], tz=timezone.utc).replace(
+                tzinfo=None
+            )
+
+        identity = jwt_data.get("sub")
+        revoked = RevokedTokenRepository.add(
+            jti=jwt_data["jti"],
+            token_type=jwt_data.get("type", "access"),
+            user_id=int(identity) if identity is not None else None,
+            expires_at=expires_at,
+        )
+
+        # Visible in this process right away; others pick it up on refresh
+        with self._lock:
+            self._bloom.add(jwt_data["jti"])
+
+        return revoked
+
+
+revocation_store = TokenRevocationStore()
@@ -0,0 +1,261 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from email_validator import EmailNotValidError, validate_email
+from sqlalchemy.exc import DataError, IntegrityError
+
+from src.config.db_config import db
+from src.domain.enums.role_name import RoleName
+from src.models.user import User
+from src.repositories.role_registry import role_registry
+from src.repositories.school_repository import SchoolRepository
+from src.repositories.user_repository import UserRepository
+from src.utils.hash_pool import HashPoolBusyError, hash_pool
+from src.utils.password_utils import hash_password
+
+# (line number, parsed row or None when the line could not be parsed)
+ImportRow = Tuple[int, Optional[Dict[str, Any]]]
+
+REQUIRED_FIELDS = ("name", "email", "password", "school_id")
+
+# bcrypt only accepts passwords up to 72 bytes
+MAX_PASSWORD_BYTES = 72
+
+
+def _column_length(column: str) -> int:
+    return User.__table__.c[column].type.length
+
+
+def _validate_row(name: str, email: str, password: str) -> Optional[str]:
+    """Check a row's values against the users columns and bcrypt limits.
+
+    Returns:
+        Error message, None when the row is valid.
+    """
+    if len(name) > _column_length("name"):
+        return "Campo 'name' excede o tamanho máximo"
+    if len(email) > _column_length("email"):
+        return "Campo 'email' excede o tamanho máximo"
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError:
+        return "Campo 'email' inválido"
+    if len(password.encode("utf-8")) > MAX_PASSWORD_BYTES:
+        return f"Campo 'password' excede {MAX_PASSWORD_BYTES} bytes"
+    return None
+
+
+def _hash_or_none(password: str) -> Optional[str]:
+    try:
+        return hash_password(password)
+    except ValueError:
+        return None
+
+
+def iter_csv_rows(stream) -> Iterator[ImportRow]:
+    """Parse a CSV upload with a header row, one user per line.
+
+    Args:
+        stream: Binary stream with the request body.
+
+    Yields:
+        Tuples (line number, row dictionary).
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_ndjson_rows(stream) -> Iterator[ImportRow]:
+    """Parse an NDJSON upload, one JSON object per line.
+
+    Args:
+        stream: Binary stream with the request body.
+
+    Yields:
+        Tuples (line number, row dictionary or None if the line is not a JSON object).
+    """
+    for line_number, line in enumerate(io.TextIOWrapper(stream, encoding="utf-8"), 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+class UserImportService:
+    @staticmethod
+    def import_users(
+        rows: Iterable[ImportRow],
+        default_role: str = RoleName.ADMIN_ESCOLA.value,
+        chunk_size: int = 500,
+    ) -> Dict[str, Any]:
+        """Create users from a stream of rows in chunked transactions.
+
+        Each chunk is validated as a whole: values are checked against the
+        users columns, the email format and the bcrypt password limit; emails
+        are deduplicated within the upload and checked against the database
+        with one query, and school IDs with another. Passwords are then hashed
+        in parallel on the hashing pool, and users plus their roles_users rows
+        are written with multi-row INSERTs and a single commit. Rows that fail
+        never stop the import; they are reported with their line number.
+
+        Args:
+            rows: Iterable of (line number, row) tuples.
+            default_role: Role assigned when a row has no role.
+            chunk_size: Rows per transaction.
+
+        Returns:
+            Dictionary with created and failed counts and per-row errors.
+        """
+        report: Dict[str, Any] = {"created": 0, "failed": 0, "errors": []}
+        role_ids: Dict[str, Optional[int]] = {}
+        seen_emails: Set[str] = set()
+        chunk: List[ImportRow] = []
+
+        try:
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    UserImportService._import_chunk(
+                        chunk, role_ids, default_role, seen_emails, report
+                    )
+                    chunk = []
+        except (UnicodeDecodeError, csv.Error):
+            UserImportService._fail(report, None, None, "Arquivo inválido")
+
+        if chunk:
+            UserImportService._import_chunk(
+                chunk, role_ids, default_role, seen_emails, report
+            )
+
+        return report
+
+    @staticmethod
+    def _fail(
+        report: Dict[str, Any], line: Optional[int], email: Optional[str], error: str
+    ) -> None:
+        report["failed"] += 1
+        report["errors"].append({"line": line, "email": email, "error": error})
+
+    @staticmethod
+    def _import_chunk(
+        chunk: List[ImportRow],
+        role_ids: Dict[str, Optional[int]],
+        default_role: str,
+        seen_emails: Set[str],
+        report: Dict[str, Any],
+    ) -> None:
+        fail = UserImportService._fail
+        candidates = []
+
+        for line, row in chunk:
+            if row is None:
+                fail(report, line, None, "Linha inválida")
+                continue
+
+            email = str(row.get("email") or "").strip()
+            missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+            if missing:
+                fail(report, line, email or None, f"Campo '{missing[0]}' é obrigatório")
+                continue
+
+            try:
+                school_id = int(row["school_id"])
+            except (TypeError, ValueError):
+                fail(report, line, email, "Campo 'school_id' inválido")
+                continue
+
+            name, password = str(row["name"]), str(row["password"])
+            error = _validate_row(name, email, password)
+            if error:
+                fail(report, line, email, error)
+                continue
+
+            role_name = row.get("role") or default_role
+            if role_name not in role_ids:
+                role_ids[role_name] = role_registry.get_id(role_name)
+            if role_ids[role_name] is None:
+                fail(report, line, email, "Role não encontrada")
+                continue
+
+            if email in seen_emails:
+                fail(report, line, email, "Email duplicado no arquivo")
+                continue
+            seen_emails.add(email)
+
+            candidates.append(
+                (
+                    line,
+                    {
+                        "name": name,
+                        "email": email,
+                        "password": password,
+                        "school_id": school_id,
+                        "role_id": role_ids[role_name],
+                    },
+                )
+            )
+
+        existing_emails = UserRepository.find_existing_emails(
+            user["email"] for _, user in candidates
+        )
+        existing_schools = SchoolRepository.find_existing_ids(
+            {user["school_id"] for _, user in candidates}
+        )
+
+        valid = []
+        for line, user in candidates:
+            if user["email"] in existing_emails:
+                fail(report, line, user["email"], "Email já cadastrado")
+            elif user["school_id"] not in existing_schools:
+                fail(report, line, user["email"], "Escola não encontrada")
+            else:
+                valid.append((line, user))
+
+        if not valid:
+            return
+
+        try:
+            hashes = hash_pool.map(_hash_or_none, [user["password"] for _, user in valid])
+        except HashPoolBusyError:
+            for line, user in valid:
+                fail(report, line, user["email"], "Servidor ocupado, tente novamente")
+            return
+
+        hashed_rows = []
+        for (line, user), hashed in zip(valid, hashes):
+            if hashed is None:
+                fail(report, line, user["email"], "Campo 'password' inválido")
+                continue
+            user["hash_password"] = hashed
+            hashed_rows.append((line, user))
+        valid = hashed_rows
+
+        if not valid:
+            return
+
+        try:
+            UserRepository.bulk_create_users([user for _, user in valid])
+            db.session.commit()
+            report["created"] += len(valid)
+            return
+        except (IntegrityError, DataError):
+            db.session.rollback()
+
+        # A concurrent insert won the race for some email, or the database
+        # rejected a value: retry row by row
+        for line, user in valid:
+            try:
+                with db.session.begin_nested():
+                    UserRepository.bulk_create_users([user])
+                report["created"] += 1
+            except IntegrityError:
+                fail(report, line, user["email"], "Email já cadastrado")
+            except DataError:
+                fail(report, line, user["email"], "Dados inválidos")
+        db.session.commit()
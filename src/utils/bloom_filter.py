@@ -0,0 +1,43 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Membership tests never give false negatives; false positives happen at
+    roughly ``error_rate`` once ``capacity`` items were added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter.
+
+        Args:
+            item: Item to add.
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """Interface of the key-value stores used by CacheRegion.
+
+    Keys are strings and values are JSON-compatible, so a shared backend
+    (e.g., Redis or memcached) can implement this interface and be plugged
+    in through the application config without changing the callers. Every
+    method is abstract, so a backend missing one fails when instantiated.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Drop the given keys; missing keys are ignored."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Thread-safe in-process LRU cache with a TTL.
+
+    At most ``max_entries`` values are kept; storing a new one evicts the
+    least recently used. Entries also expire ``ttl_seconds`` after being
+    stored, which bounds staleness for writes made by other processes.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": "memory",
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+
+class CacheRegion:
+    """Named cache whose backend is chosen at application startup.
+
+    Keys are prefixed with the region name so several regions can share
+    one backend.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.backend: CacheBackend = MemoryCacheBackend()
+
+    def init_app(self, app) -> None:
+        """Configure the backend from the application config.
+
+        Config keys (NAME is the upper-cased region name):
+            NAME_CACHE_BACKEND: CacheBackend instance to use instead of the
+                in-memory one (e.g., a shared cache).
+            NAME_CACHE_SIZE: Max entries of the in-memory backend (default: 10000).
+            NAME_CACHE_TTL: Seconds entries live in the in-memory backend (default: 60).
+
+        Args:
+            app: Flask application instance.
+        """
+        prefix = self.name.upper()
+        backend = app.config.get(f"{prefix}_CACHE_BACKEND")
+
+        if backend is None:
+            backend = MemoryCacheBackend(
+                max_entries=int(
+                    app.config.get(f"{prefix}_CACHE_SIZE")
+                    or os.getenv(f"{prefix}_CACHE_SIZE")
+                    or 10_000
+                ),
+                ttl_seconds=float(
+                    app.config.get(f"{prefix}_CACHE_TTL")
+                    or os.getenv(f"{prefix}_CACHE_TTL")
+                    or 60
+                ),
+            )
+
+        self.backend = backend
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.backend.get(self._key(key))
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(self._key(key), value)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        self.backend.delete_many([self._key(key) for key in keys])
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.backend.stats()
+
+
+# Serialized school payloads, see SchoolService.get_school_payload
+school_cache = CacheRegion("school")
@@ -0,0 +1,63 @@
+import os
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class CountCache:
+    """Thread-safe cache of total counts keyed by filter combination.
+
+    Entries are dropped explicitly by the repositories whenever a write can
+    change a total, and also expire after a TTL so that processes which did
+    not see the write converge eventually.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """Get a cached total.
+
+        Args:
+            key: Filter combination the total was computed for.
+
+        Returns:
+            Cached total, None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            return value
+
+    def set(self, key: Hashable, value: int) -> None:
+        """Store a total.
+
+        Args:
+            key: Filter combination the total was computed for.
+            value: Total number of rows.
+        """
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Drop the oldest entry; dicts keep insertion order
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+
+    def clear(self) -> None:
+        """Drop every cached total."""
+        with self._lock:
+            self._entries.clear()
+
+
+school_count_cache = CountCache(
+    ttl_seconds=float(os.getenv("SCHOOL_COUNT_CACHE_TTL", "300"))
+)
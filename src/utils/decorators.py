@@ -1,7 +1,8 @@
 from functools import wraps
 
 from flask import jsonify, request
-from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+from src.services.auth_context import load_auth_context, roles_to_mask
 
 
 def roles_required(*required_roles):
@@ -19,14 +20,19 @@ def roles_required(*required_roles):
             return jsonify(msg="Access granted")
     """
 
+    required = frozenset(required_roles)
+    required_mask = roles_to_mask(required)
+    # Roles without a bit can only be matched by name
+    check_names = len(required) != bin(required_mask).count("1")
+
     def wrapper(fn):
         @wraps(fn)
         def decorator(*args, **kwargs):
-            verify_jwt_in_request()
-            claims = get_jwt()
-            user_roles = set(claims.get("roles", []))
+            auth = load_auth_context()
 
-            if user_roles.intersection(required_roles):
+            if auth.role_mask & required_mask or (
+                check_names and not auth.roles.isdisjoint(required)
+            ):
                 return fn(*args, **kwargs)
 
             return jsonify(msg="Acesso negado"), 403
@@ -55,21 +61,17 @@ def school_required(fn):
 
     @wraps(fn)
     def decorator(*args, **kwargs):
-        verify_jwt_in_request()
-        claims = get_jwt()
-
-        user_roles = claims.get("roles", [])
-        user_school_id = claims.get("school_id")
+        auth = load_auth_context()
 
-        if "admin_secretaria" in user_roles:
+        if auth.is_secretaria:
             return fn(*args, **kwargs)
 
-        if "admin_escola" in user_roles:
+        if auth.is_escola:
             school_id = kwargs.get("school_id")
             if not school_id and request.view_args:
                 school_id = request.view_args.get("school_id")
 
-            if school_id and school_id != user_school_id:
+            if school_id and school_id != auth.school_id:
                 return jsonify(
                     msg="Acesso negado: você não tem permissão para acessar esta escola"
                 ), 403
@@ -95,10 +97,7 @@ def admin_secretaria_only(fn):
 
     @wraps(fn)
     def decorator(*args, **kwargs):
-        verify_jwt_in_request()
-        claims = get_jwt()
-
-        if "admin_secretaria" in claims.get("roles", []):
+        if load_auth_context().is_secretaria:
             return fn(*args, **kwargs)
 
         return jsonify(msg="Acesso negado: requer permissão de admin_secretaria"), 403
@@ -120,12 +119,7 @@ def any_admin(fn):
 
     @wraps(fn)
     def decorator(*args, **kwargs):
-        verify_jwt_in_request()
-        claims = get_jwt()
-
-        user_roles = claims.get("roles", [])
-
-        if "admin_secretaria" in user_roles or "admin_escola" in user_roles:
+        if load_auth_context().is_any_admin:
             return fn(*args, **kwargs)
 
         return jsonify(msg="Acesso negado"), 403
@@ -0,0 +1,205 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+
+class HashPoolBusyError(Exception):
+    """Raised when a password hash cannot be scheduled in time."""
+
+
+class HashPool:
+    """Bounded thread pool for password hashing.
+
+    bcrypt releases the GIL, so a thread pool gives real parallelism while
+    capping how many hashes run at once. At most ``workers + queue_size``
+    hashes can be pending; callers beyond that wait up to ``queue_timeout``
+    seconds for a slot and then get HashPoolBusyError, which routes turn
+    into a 503 instead of letting logins pile up on every worker.
+    """
+
+    def __init__(self):
+        self.workers = 0
+        self.queue_size = 0
+        self.queue_timeout = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._dequeued = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+        self._hash_seconds = 0.0
+        self._max_hash_seconds = 0.0
+
+    def init_app(self, app) -> None:
+        """Create the executor from the application config.
+
+        Config keys:
+            PASSWORD_HASH_WORKERS: Concurrent hashes (default: CPU count).
+            PASSWORD_HASH_QUEUE_SIZE: Hashes allowed to wait for a worker
+                (default: 4 per worker).
+            PASSWORD_HASH_QUEUE_TIMEOUT: Seconds a hash may wait before it
+                is rejected (default: 2).
+
+        Args:
+            app: Flask application instance.
+        """
+        workers = int(
+            app.config.get("PASSWORD_HASH_WORKERS")
+            or os.getenv("PASSWORD_HASH_WORKERS")
+            or os.cpu_count()
+            or 1
+        )
+        queue_size = int(
+            app.config.get("PASSWORD_HASH_QUEUE_SIZE")
+            or os.getenv("PASSWORD_HASH_QUEUE_SIZE")
+            or workers * 4
+        )
+        queue_timeout = float(
+            app.config.get("PASSWORD_HASH_QUEUE_TIMEOUT")
+            or os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT")
+            or 2
+        )
+
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+
+            self.workers = max(1, workers)
+            self.queue_size = max(0, queue_size)
+            self.queue_timeout = queue_timeout
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+            self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+
+        app.extensions["hash_pool"] = self
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a hashing function on the pool and wait for its result.
+
+        Args:
+            fn: Function to run (e.g., hash_password or verify_password).
+            *args: Arguments passed to fn.
+
+        Returns:
+            Whatever fn returns.
+
+        Raises:
+            HashPoolBusyError: If the queue stayed full or the task waited
+                longer than the queue timeout.
+        """
+        return self._submit(fn, args).result()
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Run a hashing function over many items in parallel.
+
+        A batch keeps at most ``workers`` hashes in flight, submitting the
+        next item when the oldest one finishes, so it uses every worker
+        while the queue stays free for logins.
+
+        Args:
+            fn: Function of one argument (e.g., hash_password).
+            items: Arguments, one call per item.
+
+        Returns:
+            Results in the same order as items.
+
+        Raises:
+            HashPoolBusyError: If a slot could not be obtained in time.
+        """
+        results: List[Any] = []
+        in_flight: Deque[Future] = deque()
+        try:
+            for item in items:
+                if len(in_flight) >= self.workers:
+                    results.append(in_flight.popleft().result())
+                in_flight.append(self._submit(fn, (item,)))
+        finally:
+            # Submitted hashes hold slots until they finish
+            wait(in_flight)
+        return results + [future.result() for future in in_flight]
+
+    def _submit(self, fn: Callable[..., Any], args: tuple):
+        if self._executor is None or self._slots is None:
+            raise RuntimeError("HashPool is not initialized; call init_app first")
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self._rejected += 1
+            raise HashPoolBusyError("Password hashing queue is full")
+
+        with self._lock:
+            self._queued += 1
+
+        queued_at = time.monotonic()
+        try:
+            return self._executor.submit(self._execute, queued_at, fn, args)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+
+    def _execute(self, queued_at: float, fn: Callable[..., Any], args: tuple) -> Any:
+        started_at = time.monotonic()
+        waited = started_at - queued_at
+
+        with self._lock:
+            self._queued -= 1
+            self._dequeued += 1
+            self._wait_seconds += waited
+            if waited > self.queue_timeout:
+                self._rejected += 1
+                rejected = True
+            else:
+                self._running += 1
+                rejected = False
+
+        if rejected:
+            self._slots.release()
+            raise HashPoolBusyError("Password hash waited too long in the queue")
+
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.monotonic() - started_at
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._hash_seconds += elapsed
+                self._max_hash_seconds = max(self._max_hash_seconds, elapsed)
+            self._slots.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get a snapshot of the pool counters.
+
+        Returns:
+            Dictionary with pool size, queue depth and hashing times.
+        """
+        with self._lock:
+            completed = self._completed
+            dequeued = self._dequeued
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": (
+                    round(self._wait_seconds / dequeued * 1000, 2) if dequeued else 0.0
+                ),
+                "avg_hash_ms": (
+                    round(self._hash_seconds / completed * 1000, 2) if completed else 0.0
+                ),
+                "max_hash_ms": round(self._max_hash_seconds * 1000, 2),
+            }
+
+
+hash_pool = HashPool()
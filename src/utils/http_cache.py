@@ -0,0 +1,84 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from flask import Response, request
+
+
+def make_etag(*parts: Any) -> str:
+    """Build an opaque entity tag from the values that identify a payload.
+
+    Args:
+        *parts: Values that change whenever the payload changes (e.g., ID,
+            version, query parameters).
+
+    Returns:
+        Tag value without quotes.
+    """
+    digest = hashlib.sha1("|".join(map(str, parts)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _to_http_date(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a naive UTC timestamp to an aware one with second precision."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate the request's conditional headers against the current state.
+
+    If-None-Match takes precedence; If-Modified-Since is only used when the
+    client did not send an entity tag.
+
+    Args:
+        etag: Current tag of the resource.
+        last_modified: Current last modification time (naive UTC).
+
+    Returns:
+        True if the client's copy is current and 304 should be returned.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+
+    last_modified = _to_http_date(last_modified)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+
+    return False
+
+
+def with_validators(
+    response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> Response:
+    """Set the ETag and Last-Modified headers of a response.
+
+    Args:
+        response: Response to update.
+        etag: Strong tag of the payload.
+        last_modified: Last modification time (naive UTC).
+
+    Returns:
+        The same response.
+    """
+    response.set_etag(etag)
+    last_modified = _to_http_date(last_modified)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """Build an empty 304 response carrying the current validators.
+
+    Args:
+        etag: Current tag of the resource.
+        last_modified: Current last modification time (naive UTC).
+
+    Returns:
+        304 response.
+    """
+    return with_validators(Response(status=304), etag, last_modified)
@@ -0,0 +1,69 @@
+import os
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Output matches DefaultJSONProvider: keys are sorted when sort_keys is
+    set, and dates, decimals, UUIDs and dataclasses go through the default
+    Flask conversion. Calls with extra json.dumps/json.loads arguments fall
+    back to the standard library.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self._options(indent) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app) -> None:
+    """Use the orjson provider for app.json when orjson is installed.
+
+    Config keys:
+        JSON_FAST_PROVIDER: Set to false to keep Flask's default provider
+            (default: true).
+
+    Args:
+        app: Flask application instance.
+    """
+    enabled = str(
+        app.config.get("JSON_FAST_PROVIDER", os.getenv("JSON_FAST_PROVIDER", "true"))
+    ).lower()
+
+    if orjson is not None and enabled == "true":
+        app.json = OrjsonProvider(app)
@@ -0,0 +1,82 @@
+import base64
+import json
+from typing import Any, Optional, Tuple
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from src.models.soft_delete import live_only
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper around a SELECT statement (PostgreSQL)."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        *values: Sort key values of the last returned row (e.g., name and id).
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> Tuple[Any, ...]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: Cursor string received from the client.
+        size: Expected number of values in the sort key.
+
+    Returns:
+        Tuple with the sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+
+    return tuple(values)
+
+
+def estimate_count(query) -> Optional[int]:
+    """Estimate the number of rows a query returns from planner statistics.
+
+    Args:
+        query: SQLAlchemy ORM query to estimate.
+
+    Returns:
+        Estimated row count, None if the database cannot provide one.
+    """
+    session = query.session
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+
+    # EXPLAIN wraps the statement, so the soft-delete hook does not see it
+    statement = live_only(query.order_by(None).statement)
+    plan = session.execute(Explain(statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
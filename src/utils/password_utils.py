@@ -1,4 +1,83 @@
+import math
+import os
+import time
+from typing import Optional, Tuple
+
 import bcrypt
+from passlib.context import CryptContext
+
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+DEFAULT_BCRYPT_ROUNDS = 12
+
+_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=DEFAULT_BCRYPT_ROUNDS
+)
+
+
+def calibrate_bcrypt_rounds(target_ms: float, samples: int = 3) -> int:
+    """Find the bcrypt cost whose verify time is closest to a target.
+
+    Each extra round doubles the work, so the cost is extrapolated from a
+    cheap measurement instead of timing every candidate.
+
+    Args:
+        target_ms: Desired duration of one hash/verify in milliseconds.
+        samples: Number of measurements; the fastest one is used.
+
+    Returns:
+        bcrypt cost clamped to [MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS].
+    """
+    probe_rounds = 8
+    salt = bcrypt.gensalt(probe_rounds)
+    elapsed = math.inf
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", salt)
+        elapsed = min(elapsed, time.perf_counter() - started_at)
+
+    elapsed_ms = max(elapsed * 1000, 0.001)
+    rounds = probe_rounds + round(math.log2(target_ms / elapsed_ms))
+    return min(max(rounds, MIN_BCRYPT_ROUNDS), MAX_BCRYPT_ROUNDS)
+
+
+def configure_password_hashing(rounds: int) -> None:
+    """Set the bcrypt cost used for new hashes.
+
+    Hashes stored with a different cost are reported as outdated by
+    verify_and_update_password so they can be replaced on the next login.
+
+    Args:
+        rounds: bcrypt cost factor.
+    """
+    global _context
+    _context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def init_password_hashing(app) -> None:
+    """Calibrate password hashing at application startup.
+
+    Config keys:
+        PASSWORD_HASH_TARGET_MS: Target time of one login hash (default: 250).
+        PASSWORD_HASH_ROUNDS: Fixed bcrypt cost; skips calibration when set.
+
+    Args:
+        app: Flask application instance.
+    """
+    rounds = app.config.get("PASSWORD_HASH_ROUNDS") or os.getenv("PASSWORD_HASH_ROUNDS")
+
+    if rounds:
+        rounds = int(rounds)
+    else:
+        target_ms = float(
+            app.config.get("PASSWORD_HASH_TARGET_MS")
+            or os.getenv("PASSWORD_HASH_TARGET_MS")
+            or 250
+        )
+        rounds = calibrate_bcrypt_rounds(target_ms)
+
+    configure_password_hashing(rounds)
+    app.config["PASSWORD_HASH_ROUNDS"] = rounds
 
 
 def hash_password(password: str) -> str:
@@ -8,10 +87,9 @@ def hash_password(password: str) -> str:
         password: Plain text password to hash.
 
     Returns:
-        Hashed password as a UTF-8 decoded string.
+        Hashed password string using the configured cost.
     """
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+    return _context.hash(password)
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
@@ -25,6 +103,25 @@ def verify_password(password: str, hashed_password: str) -> bool:
         True if passwords match, False otherwise.
     """
     try:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return _context.verify(password, hashed_password)
     except Exception:
         return False
+
+
+def verify_and_update_password(
+    password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password and rehash it if its scheme or cost is outdated.
+
+    Args:
+        password: Plain text password to verify.
+        hashed_password: Hashed password to compare against.
+
+    Returns:
+        Tuple (matches, new_hash). new_hash is None unless the password
+        matches and the stored hash should be replaced.
+    """
+    try:
+        return _context.verify_and_update(password, hashed_password)
+    except Exception:
+        return False, None
@@ -0,0 +1,314 @@
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+
+def serialize_school_row(row: Any, include_deleted: bool = False) -> Dict[str, Any]:
+    """Serialize a school projection row.
+
+    Produces the same dictionary as School.to_dict from a plain row
+    selected with SCHOOL_COLUMNS (src/repositories/school_repository.py),
+    unpacked by position so no ORM instance, composite or attribute
+    instrumentation is involved.
+
+    Args:
+        row: Row starting with the SCHOOL_COLUMNS values, in order; extra
+            trailing columns are ignored.
+        include_deleted: Whether to include the deleted_at field.
+
+    Returns:
+        Dictionary with school data.
+    """
+    (
+        school_id,
+        name,
+        street,
+        number,
+        neighborhood,
+        city,
+        state,
+        zip_code,
+        school_type,
+        deleted_at,
+        *_,
+    ) = row
+
+    data = {
+        "id": school_id,
+        "name": name,
+        "address": {
+            "street": street,
+            "number": number,
+            "neighborhood": neighborhood,
+            "city": city,
+            "state": state,
+            "zip_code": zip_code,
+        },
+        "school_type": school_type.value if school_type else None,
+    }
+
+    if include_deleted and deleted_at:
+        data["deleted_at"] = deleted_at.isoformat()
+
+    return data
+
+
+def serialize_user_row(row: Any, roles: Iterable[str]) -> Dict[str, Any]:
+    """Serialize a user projection row.
+
+    Args:
+        row: Row with the USER_COLUMNS values
+            (src/repositories/user_repository.py), in order.
+        roles: Names of the user's roles.
+
+    Returns:
+        Dictionary with user data, roles and school_id.
+    """
+    user_id, name, email, school_id = row
+    return {
+        "id": user_id,
+        "name": name,
+        "email": email,
+        "roles": list(roles),
+        "school_id": school_id,
+    }
+
+
+# Fields that can be requested with ?fields= on each resource
+SCHOOL_FIELDS = frozenset({"id", "name", "address", "school_type", "deleted_at"})
+USER_FIELDS = frozenset({"id", "name", "email", "roles", "school_id"})
+
+# Relations that can be embedded with ?include= on each resource
+SCHOOL_INCLUDES = frozenset({"users", "school_classes"})
+USER_INCLUDES = frozenset({"school"})
+
+
+def parse_field_list(
+    raw: Optional[str], allowed: FrozenSet[str]
+) -> Optional[FrozenSet[str]]:
+    """Parse a comma-separated ?fields= or ?include= value.
+
+    Args:
+        raw: Query string value, None when the parameter was not sent.
+        allowed: Accepted names.
+
+    Returns:
+        Frozenset of requested names, None when the parameter was not sent
+        or is empty.
+
+    Raises:
+        ValueError: If a name is not allowed; the message is the name.
+    """
+    if raw is None:
+        return None
+
+    names = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    for name in names:
+        if name not in allowed:
+            raise ValueError(name)
+    return names or None
+
+
+def pick_fields(data: Dict[str, Any], fields: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    """Keep only the requested top-level fields of a payload.
+
+    Args:
+        data: Serialized resource.
+        fields: Requested fields, None for all.
+
+    Returns:
+        The payload restricted to fields.
+    """
+    if fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in fields}
+
+
+def serialize_school_fields(
+    row: Any, fields: FrozenSet[str], include_deleted: bool = False
+) -> Dict[str, Any]:
+    """Serialize the requested fields of a sparse school row.
+
+    Args:
+        row: Row selected with school_columns(fields).
+        fields: Requested fields (see SCHOOL_FIELDS).
+        include_deleted: Whether deleted_at may be included.
+
+    Returns:
+        Dictionary with the requested school fields.
+    """
+    data: Dict[str, Any] = {}
+
+    if "id" in fields:
+        data["id"] = row.id
+    if "name" in fields:
+        data["name"] = row.name
+    if "address" in fields:
+        data["address"] = {
+            "street": row.address_street,
+            "number": row.address_number,
+            "neighborhood": row.address_neighborhood,
+            "city": row.address_city,
+            "state": row.address_state,
+            "zip_code": row.address_zip_code,
+        }
+    if "school_type" in fields:
+        data["school_type"] = row.school_type.value if row.school_type else None
+    if "deleted_at" in fields and include_deleted and row.deleted_at:
+        data["deleted_at"] = row.deleted_at.isoformat()
+
+    return data
+
+
+def serialize_school_class_row(row: Any) -> Dict[str, Any]:
+    """Serialize a school class projection row.
+
+    Args:
+        row: Row with the SCHOOL_CLASS_COLUMNS values
+            (src/repositories/school_class_repository.py), in order.
+
+    Returns:
+        Dictionary with school class data.
+    """
+    class_id, school_id, class_grade, capacity, enrolled, held = row
+    return {
+        "id": class_id,
+        "school_id": school_id,
+        "class_grade": class_grade.name,
+        "capacity": capacity,
+        "enrolled": enrolled,
+        "held": held,
+        "free": capacity - enrolled - held,
+    }
+
+
+def serialize_seat_row(row: Any) -> Dict[str, Any]:
+    """Serialize a statewide seat availability row.
+
+    Args:
+        row: Row with the VAGAS_COLUMNS values
+            (src/repositories/seat_repository.py), in order.
+
+    Returns:
+        Dictionary with the school and its seats in one grade.
+    """
+    school_id, name, city, state, class_grade, capacity, enrolled, held = row
+    return {
+        "school_id": school_id,
+        "school_name": name,
+        "city": city,
+        "state": state,
+        "class_grade": class_grade.name,
+        "capacity": capacity,
+        "enrolled": enrolled,
+        "held": held,
+        "free": capacity - enrolled - held,
+    }
+
+
+def serialize_user_fields(
+    row: Any, roles: Iterable[str], fields: FrozenSet[str]
+) -> Dict[str, Any]:
+    """Serialize the requested fields of a sparse user row.
+
+    Args:
+        row: Row selected with user_columns(fields).
+        roles: Names of the user's roles.
+        fields: Requested fields (see USER_FIELDS).
+
+    Returns:
+        Dictionary with the requested user fields.
+    """
+    data: Dict[str, Any] = {}
+
+    if "id" in fields:
+        data["id"] = row.id
+    if "name" in fields:
+        data["name"] = row.name
+    if "email" in fields:
+        data["email"] = row.email
+    if "roles" in fields:
+        data["roles"] = list(roles)
+    if "school_id" in fields:
+        data["school_id"] = row.school_id
+
+    return data
+
+
+def serialize_reservation_row(row: Any) -> Dict[str, Any]:
+    """Serialize a seat reservation projection row.
+
+    Args:
+        row: Row with the RESERVATION_COLUMNS values
+            (src/repositories/seat_reservation_repository.py), in order.
+
+    Returns:
+        Dictionary with reservation data.
+    """
+    reservation_id, class_id, student_name, status, expires_at, enrollment_id = row
+    return {
+        "id": reservation_id,
+        "school_class_id": class_id,
+        "student_name": student_name,
+        "status": status.value,
+        "expires_at": expires_at.isoformat(),
+        "enrollment_id": enrollment_id,
+    }
+
+
+def serialize_allocation_round_row(row: Any) -> Dict[str, Any]:
+    """Serialize an allocation round projection row.
+
+    Args:
+        row: Row with the ROUND_COLUMNS values
+            (src/repositories/allocation_repository.py), in order.
+
+    Returns:
+        Dictionary with round data, progress and results.
+    """
+    (
+        round_id,
+        name,
+        class_grade,
+        status,
+        seed,
+        progress,
+        assigned,
+        unassigned,
+        error,
+        created_at,
+        started_at,
+        finished_at,
+    ) = row
+    return {
+        "id": round_id,
+        "name": name,
+        "class_grade": class_grade.name,
+        "status": status.value,
+        "seed": seed,
+        "progress": progress,
+        "assigned": assigned,
+        "unassigned": unassigned,
+        "error": error,
+        "created_at": created_at.isoformat(),
+        "started_at": started_at.isoformat() if started_at else None,
+        "finished_at": finished_at.isoformat() if finished_at else None,
+    }
+
+
+def serialize_applicant_row(row: Any) -> Dict[str, Any]:
+    """Serialize an applicant allocation row.
+
+    Args:
+        row: Row from AllocationRepository.get_results.
+
+    Returns:
+        Dictionary with applicant data and allocated class, if any.
+    """
+    applicant_id, student_name, priority, class_id, school_id, assigned_rank = row
+    return {
+        "id": applicant_id,
+        "student_name": student_name,
+        "priority": priority,
+        "school_class_id": class_id,
+        "school_id": school_id,
+        "assigned_rank": assigned_rank,
+    }
@@ -0,0 +1,61 @@
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Iterable, List
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase a text and strip its accents.
+
+    Args:
+        text: Text to normalize.
+
+    Returns:
+        Normalized text (e.g., "São João" -> "sao joao").
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a normalized text into alphanumeric words.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        List of words.
+    """
+    return "".join(ch if ch.isalnum() else " " for ch in normalize_text(text)).split()
+
+
+def fuzzy_score(query: str, fields: Iterable[str]) -> float:
+    """Score how well a query matches a set of text fields.
+
+    Every query word is matched against its most similar word in the
+    fields (prefix matches count as exact), and the scores are averaged,
+    so "escla sao jose" still matches "Escola São José". Used as the
+    search engine on databases without trigram/full-text support.
+
+    Args:
+        query: Search text typed by the user.
+        fields: Field values to search in.
+
+    Returns:
+        Score between 0 and 1.
+    """
+    query_words = tokenize(query)
+    field_words = [word for field in fields for word in tokenize(field or "")]
+    if not query_words or not field_words:
+        return 0.0
+
+    total = 0.0
+    for query_word in query_words:
+        best = 0.0
+        for field_word in field_words:
+            if field_word.startswith(query_word):
+                best = 1.0
+                break
+            best = max(best, SequenceMatcher(None, query_word, field_word).ratio())
+        total += best
+
+    return total / len(query_words)
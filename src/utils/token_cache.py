@@ -0,0 +1,119 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of already verified JWTs.
+
+    Entries are keyed by a SHA-256 digest of the raw token, so the cache
+    never holds usable credentials, and live until the earlier of the
+    token's own ``exp`` and the cache TTL. A hit skips decoding and HMAC
+    verification; the optional revocation check still runs on every hit.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.revocation_check: Optional[Callable[[Dict[str, Any]], bool]] = None
+        self._entries: "OrderedDict[bytes, Tuple[dict, dict, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Configure the cache from the application config.
+
+        Config keys:
+            JWT_VERIFIED_CACHE_SIZE: Max cached tokens, 0 disables (default: 4096).
+            JWT_VERIFIED_CACHE_TTL: Max seconds a token stays cached (default: 60).
+
+        Args:
+            app: Flask application instance.
+        """
+        self.max_entries = int(
+            app.config.get(
+                "JWT_VERIFIED_CACHE_SIZE", os.getenv("JWT_VERIFIED_CACHE_SIZE", 4096)
+            )
+        )
+        self.ttl_seconds = float(
+            app.config.get(
+                "JWT_VERIFIED_CACHE_TTL", os.getenv("JWT_VERIFIED_CACHE_TTL", 60)
+            )
+        )
+        self.clear()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Tuple[dict, dict]]:
+        """Get the verified header and claims of a token.
+
+        Args:
+            token: Raw encoded JWT.
+
+        Returns:
+            Tuple (jwt_header, jwt_data), None on miss, expiry or revocation.
+        """
+        if self.max_entries <= 0:
+            return None
+
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            header, claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        if self.revocation_check is not None and self.revocation_check(claims):
+            self.discard(token)
+            return None
+
+        return header, claims
+
+    def set(self, token: str, header: dict, claims: dict) -> None:
+        """Store a token that was just verified.
+
+        Args:
+            token: Raw encoded JWT.
+            header: Decoded JWT header.
+            claims: Decoded and verified JWT payload.
+        """
+        if self.max_entries <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        if claims.get("exp") is not None:
+            expires_at = min(expires_at, float(claims["exp"]))
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (header, claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        """Drop a token from the cache.
+
+        Args:
+            token: Raw encoded JWT.
+        """
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache()
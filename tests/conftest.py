@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+# Tests run against TEST_DATABASE_URL (a throwaway database: every table is
+# dropped at the end of each test), or an in-memory SQLite database
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key-with-32-bytes!!")
+os.environ.setdefault("PASSWORD_HASH_ROUNDS", "4")
+
+from benchmarks._app import create_app_for  # noqa: E402
+from src.config.db_config import db  # noqa: E402
+from src.domain.enums.school_type import SchoolType  # noqa: E402
+from src.models import Role  # noqa: E402
+from src.repositories.role_registry import role_registry  # noqa: E402
+from src.repositories.school_repository import SchoolRepository  # noqa: E402
+from src.utils.count_cache import school_count_cache  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    app = create_app_for(TEST_DATABASE_URL or "sqlite://")
+    app.config["TESTING"] = True
+
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(
+            [Role(name="admin_secretaria"), Role(name="admin_escola")]
+        )
+        db.session.commit()
+        role_registry.refresh()
+        school_count_cache.clear()
+
+        yield app
+
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def benchmark_database_url(app, tmp_path):
+    """Database a benchmark can recreate: the test database, or a SQLite file.
+
+    In-memory SQLite is private to one connection, so benchmarks with
+    several workers need a file.
+    """
+    # An open transaction of the test session would block the benchmark
+    db.session.remove()
+    return TEST_DATABASE_URL or f"sqlite:///{tmp_path / 'benchmark.db'}"
+
+
+@pytest.fixture
+def dialect(app):
+    return db.engine.dialect.name
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def schools(app):
+    """Two live schools: (Escola A, Porto Alegre), (Escola B, Canoas)."""
+    a = SchoolRepository.create_school(
+        "Escola A", "Rua 1", "10", "Centro", "Porto Alegre", "RS", "90000-000",
+        SchoolType.ESTADUAL,
+    )
+    b = SchoolRepository.create_school(
+        "Escola B", "Rua 2", "20", "Centro", "Canoas", "RS", "92000-000",
+        SchoolType.MUNICIPAL,
+    )
+    return a.id, b.id
+
+
+def _register(client, school_id, email, role):
+    response = client.post(
+        "/api/users/register",
+        json={
+            "name": email.split("@")[0],
+            "email": email,
+            "password": "secret",
+            "school_id": school_id,
+            "role": role,
+        },
+    )
+    assert response.status_code == 201, response.get_json()
+
+
+def _login(client, email):
+    response = client.post("/login", json={"email": email, "password": "secret"})
+    assert response.status_code == 200, response.get_json()
+    return {"Authorization": "Bearer " + response.get_json()["access_token"]}
+
+
+@pytest.fixture
+def secretaria(client, schools):
+    """Authorization headers of an admin_secretaria user."""
+    _register(client, schools[0], "secretaria@example.com", "admin_secretaria")
+    return _login(client, "secretaria@example.com")
+
+
+@pytest.fixture
+def escola(client, schools):
+    """Authorization headers of an admin_escola user of the second school."""
+    _register(client, schools[1], "escola@example.com", "admin_escola")
+    return _login(client, "escola@example.com")
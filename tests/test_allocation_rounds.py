@@ -0,0 +1,225 @@
+from concurrent.futures import Future
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import update
+
+from benchmarks import allocation_round
+from src.config.db_config import db
+from src.domain.enums.class_grade import ClassGrade
+from src.models.allocation_round import AllocationRound
+from src.models.enrollment import Enrollment
+from src.models.school_class import SchoolClass
+from src.repositories.allocation_repository import (
+    AllocationConflictError,
+    AllocationRepository,
+)
+from src.repositories.school_class_repository import SchoolClassRepository
+from src.services.allocation_jobs import allocation_jobs
+
+
+@pytest.fixture
+def run_inline(monkeypatch):
+    """Run submitted rounds synchronously, through the job wrapper."""
+
+    def submit(round_id, started_at):
+        future = Future()
+        future.set_result(allocation_jobs._run(round_id, started_at))
+        return future
+
+    monkeypatch.setattr(allocation_jobs, "submit", submit)
+
+
+def _create_round(client, headers):
+    response = client.post(
+        "/api/allocation/rounds",
+        json={"name": "Rodada 2027", "class_grade": 1},
+        headers=headers,
+    )
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["round"]["id"]
+
+
+@pytest.fixture
+def admission(client, secretaria, schools):
+    """A round with four applicants for two seats in A and one in B."""
+    school_a, school_b = schools
+    class_a = SchoolClassRepository.create_class(school_a, ClassGrade.FISRT_YEAR, 2)
+    class_b = SchoolClassRepository.create_class(school_b, ClassGrade.FISRT_YEAR, 1)
+    round_id = _create_round(client, secretaria)
+
+    response = client.post(
+        f"/api/allocation/rounds/{round_id}/applicants",
+        json={
+            "applicants": [
+                {"student_name": "Ana", "priority": 10, "preferences": [school_a, school_b]},
+                {"student_name": "Bia", "priority": 5, "preferences": [school_a]},
+                {"student_name": "Caio", "priority": 1, "preferences": [school_a, school_b]},
+                {"student_name": "Duda", "priority": 0, "preferences": [school_b]},
+            ]
+        },
+        headers=secretaria,
+    )
+    assert response.status_code == 201, response.get_json()
+    return round_id, class_a, class_b
+
+
+def _run(client, headers, round_id):
+    response = client.post(
+        f"/api/allocation/rounds/{round_id}/run", json={"seed": 7}, headers=headers
+    )
+    assert response.status_code == 202, response.get_json()
+    return _round(client, headers, round_id)
+
+
+def _results(client, headers, round_id):
+    response = client.get(f"/api/allocation/rounds/{round_id}/results", headers=headers)
+    return {
+        applicant["student_name"]: (applicant["school_id"], applicant["assigned_rank"])
+        for applicant in response.get_json()["applicants"]
+    }
+
+
+def _enrolled(client, headers, schools):
+    """(enrolled per class, enrolled per school summary) in school order."""
+    classes = dict(db.session.query(SchoolClass.id, SchoolClass.enrolled))
+    summaries = [
+        client.get(f"/api/schools/{school_id}/vagas", headers=headers).get_json()[
+            "grades"
+        ][0]["enrolled"]
+        for school_id in schools
+    ]
+    return classes, summaries
+
+
+def _round(client, headers, round_id):
+    return client.get(f"/api/allocation/rounds/{round_id}", headers=headers).get_json()[
+        "round"
+    ]
+
+
+def _backdate(round_id, minutes):
+    db.session.execute(
+        update(AllocationRound)
+        .where(AllocationRound.id == round_id)
+        .values(started_at=AllocationRound.started_at - timedelta(minutes=minutes))
+    )
+    db.session.commit()
+
+
+def test_running_round_is_reclaimed_after_timeout(client, secretaria, run_inline):
+    round_id = _create_round(client, secretaria)
+    stale_run = AllocationRepository.claim_round(round_id, 1, allocation_jobs.timeout)
+    assert stale_run is not None
+
+    # The claiming process died: the round stays running until the timeout
+    response = client.post(f"/api/allocation/rounds/{round_id}/run", headers=secretaria)
+    assert response.status_code == 409
+
+    _backdate(round_id, allocation_jobs.timeout.total_seconds() / 60 + 1)
+    response = client.post(
+        f"/api/allocation/rounds/{round_id}/run", json={"seed": 7}, headers=secretaria
+    )
+    assert response.status_code == 202, response.get_json()
+    assert _round(client, secretaria, round_id)["status"] == "done"
+
+
+def test_stale_run_cannot_touch_a_reclaimed_round(app):
+    round_id = AllocationRepository.create_round("Rodada", ClassGrade.FISRT_YEAR)
+    stale_run = AllocationRepository.claim_round(round_id, 1, timedelta(minutes=15))
+    _backdate(round_id, 16)
+    stale_run -= timedelta(minutes=16)
+    current_run = AllocationRepository.claim_round(round_id, 2, timedelta(minutes=15))
+    assert current_run is not None
+
+    AllocationRepository.set_progress(round_id, stale_run, 0.5)
+    AllocationRepository.fail_round(round_id, stale_run, "Erro")
+    with pytest.raises(AllocationConflictError):
+        AllocationRepository.write_results(
+            round_id,
+            stale_run,
+            ClassGrade.FISRT_YEAR,
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+        )
+    db.session.rollback()
+
+    row = AllocationRepository.find_round_row(round_id)
+    assert (row.status.value, row.seed, row.progress) == ("running", 2, 0.0)
+
+
+def test_round_enrolls_applicants_in_bulk(
+    client, secretaria, schools, admission, run_inline, monkeypatch
+):
+    round_id, class_a, class_b = admission
+    progress = []
+    set_progress = AllocationRepository.set_progress
+
+    def record(round_id, started_at, value):
+        progress.append(value)
+        set_progress(round_id, started_at, value)
+
+    monkeypatch.setattr(AllocationRepository, "set_progress", record)
+
+    allocation = _run(client, secretaria, round_id)
+
+    assert (allocation["status"], allocation["progress"]) == ("done", 1.0)
+    assert (allocation["assigned"], allocation["unassigned"]) == (3, 1)
+    assert progress == sorted(progress) and progress[0] > 0
+
+    school_a, school_b = schools
+    assert _results(client, secretaria, round_id) == {
+        "Ana": (school_a, 1),
+        "Bia": (school_a, 1),
+        "Caio": (school_b, 2),
+        "Duda": (None, None),
+    }
+    assert _enrolled(client, secretaria, schools) == ({class_a: 2, class_b: 1}, [2, 1])
+    assert db.session.query(Enrollment).count() == 3
+
+
+def test_seats_taken_while_solving_fail_the_round(
+    client, secretaria, schools, admission, run_inline, monkeypatch
+):
+    round_id, class_a, class_b = admission
+    load_free_classes = AllocationRepository.load_free_classes
+
+    def enroll_meanwhile(class_grade):
+        classes = load_free_classes(class_grade)
+        # Someone takes a seat in A after the solver read the free seats
+        SchoolClassRepository.enroll(schools[0], class_a, "Eva")
+        return classes
+
+    monkeypatch.setattr(AllocationRepository, "load_free_classes", enroll_meanwhile)
+    allocation = _run(client, secretaria, round_id)
+
+    assert allocation["status"] == "failed"
+    assert allocation["error"] == "Vagas ocupadas durante a alocação"
+    # Nothing of the round was written
+    assert _enrolled(client, secretaria, schools) == ({class_a: 1, class_b: 0}, [1, 0])
+    assert set(_results(client, secretaria, round_id).values()) == {(None, None)}
+
+    # A failed round can run again, with the seats left
+    monkeypatch.setattr(AllocationRepository, "load_free_classes", load_free_classes)
+    allocation = _run(client, secretaria, round_id)
+
+    assert (allocation["status"], allocation["assigned"]) == ("done", 2)
+    assert _results(client, secretaria, round_id) == {
+        "Ana": (schools[0], 1),
+        "Bia": (None, None),
+        "Caio": (schools[1], 2),
+        "Duda": (None, None),
+    }
+    assert _enrolled(client, secretaria, schools) == ({class_a: 2, class_b: 1}, [2, 1])
+
+
+def test_round_benchmark_keeps_counters_consistent(benchmark_database_url):
+    result = allocation_round.run_round(
+        benchmark_database_url, applicants=300, schools=10, choices=3
+    )
+
+    assert result["assigned"] + result["unassigned"] == 300
+    assert result["over_capacity"] == 0
+    assert result["consistent"]
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from src.services.allocation_solver import (
+    compact_preferences,
+    deferred_acceptance,
+    fill_classes,
+    priority_keys,
+)
+
+
+def _instance(seed, applicants=2000, programs=150, choices=5):
+    """Random round: distinct choices, some of them without seats (-1)."""
+    rng = np.random.default_rng(seed)
+    preferences = np.argsort(rng.random((applicants, programs)), axis=1)[:, :choices]
+    preferences[rng.random(preferences.shape) < 0.1] = -1
+    points = rng.integers(0, 4, size=preferences.shape)
+    capacities = rng.integers(0, 15, size=programs)
+    return preferences, points, capacities
+
+
+def _solve(preferences, points, capacities, seed):
+    preferences, points = compact_preferences(preferences, points)
+    keys = priority_keys(points, seed)
+    assigned, ranks = deferred_acceptance(preferences, keys, capacities)
+    return preferences, keys, assigned, ranks
+
+
+def _blocking_pairs(preferences, keys, capacities, assigned, ranks):
+    """Applicant/program pairs that would both rather be matched together."""
+    admitted = np.flatnonzero(assigned >= 0)
+    cutoff = np.full(capacities.size, np.iinfo(np.int64).max)
+    np.minimum.at(cutoff, assigned[admitted], keys[admitted, ranks[admitted]])
+    # Programs with free seats take anyone who asks
+    full = np.bincount(assigned[admitted], minlength=capacities.size) >= capacities
+    cutoff[~full] = np.iinfo(np.int64).min
+
+    limit = np.where(assigned >= 0, ranks, preferences.shape[1])
+    columns = np.arange(preferences.shape[1])
+    preferred = (columns < limit[:, None]) & (preferences >= 0)
+    rows, ranks_ = np.nonzero(preferred)
+    programs = preferences[rows, ranks_]
+    return np.flatnonzero(keys[rows, ranks_] > cutoff[programs])
+
+
+def test_small_round():
+    # Both applicants want program 0 (one seat); applicant 1 has more points
+    preferences = np.array([[0, 1], [0, 1]])
+    points = np.array([[0, 0], [1, 0]])
+    _, _, assigned, ranks = _solve(preferences, points, np.array([1, 1]), seed=1)
+
+    assert assigned.tolist() == [1, 0]
+    assert ranks.tolist() == [1, 0]
+
+
+def test_compact_preferences_keeps_order():
+    preferences = np.array([[-1, 3, -1, 2], [4, -1, -1, -1]])
+    ranks = np.broadcast_to(np.arange(4), preferences.shape)
+
+    compacted, original = compact_preferences(preferences, ranks)
+
+    assert compacted.tolist() == [[3, 2], [4, -1]]
+    assert original[:, :1].tolist() == [[1], [0]]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_allocation_is_stable_and_within_capacity(seed):
+    preferences, points, capacities = _instance(seed)
+    preferences, keys, assigned, ranks = _solve(preferences, points, capacities, seed)
+
+    admitted = assigned >= 0
+    assert (np.bincount(assigned[admitted], minlength=capacities.size) <= capacities).all()
+    assert (preferences[admitted, ranks[admitted]] == assigned[admitted]).all()
+    assert (ranks[~admitted] == -1).all()
+    assert _blocking_pairs(preferences, keys, capacities, assigned, ranks).size == 0
+
+
+def test_same_seed_same_allocation():
+    preferences, points, capacities = _instance(7)
+
+    first = _solve(preferences, points, capacities, seed=42)[2]
+    second = _solve(preferences, points, capacities, seed=42)[2]
+    other = _solve(preferences, points, capacities, seed=43)[2]
+
+    assert np.array_equal(first, second)
+    # Ties on points are broken by the lottery, so the seed matters
+    assert not np.array_equal(first, other)
+
+
+def test_fill_classes_respects_class_seats():
+    preferences, points, capacities = _instance(5, programs=40)
+    preferences, keys, assigned, ranks = _solve(preferences, points, capacities, 5)
+
+    # Split each program's seats over up to two classes
+    rng = np.random.default_rng(5)
+    first = rng.integers(0, capacities + 1)
+    class_programs = np.repeat(np.arange(capacities.size), 2)
+    class_free = np.column_stack((first, capacities - first)).ravel()
+    class_ids = np.arange(class_programs.size) + 100
+
+    classes = fill_classes(
+        assigned, keys, ranks, class_ids, class_programs, class_free, capacities.size
+    )
+
+    seated = classes >= 0
+    assert np.array_equal(seated, assigned >= 0)
+    assert (class_programs[classes[seated] - 100] == assigned[seated]).all()
+    assert (
+        np.bincount(classes[seated] - 100, minlength=class_ids.size) <= class_free
+    ).all()
@@ -0,0 +1,37 @@
+from flask import g
+
+from src.services import auth_context
+
+
+def _jwt_extended_state():
+    return sorted(key for key in vars(g) if key.startswith("_jwt_extended"))
+
+
+def test_cached_token_leaves_flask_jwt_extended_alone(
+    client, secretaria, schools, monkeypatch
+):
+    # The first request verifies the token and caches it
+    assert client.get("/api/schools", headers=secretaria).status_code == 200
+    claims = dict(g.auth_context.claims)
+    assert claims["jti"]
+
+    for key in _jwt_extended_state():
+        g.pop(key)
+
+    def verify_jwt_in_request():
+        raise AssertionError("cached token verified again")
+
+    monkeypatch.setattr(auth_context, "verify_jwt_in_request", verify_jwt_in_request)
+    assert client.get("/api/schools", headers=secretaria).status_code == 200
+
+    assert _jwt_extended_state() == []
+    assert g.auth_context.claims == claims
+
+
+def test_logout_revokes_a_cached_token(client, secretaria, schools):
+    assert client.get("/api/schools", headers=secretaria).status_code == 200
+
+    response = client.post("/login/logout", headers=secretaria)
+    assert response.status_code == 200, response.get_json()
+
+    assert client.get("/api/schools", headers=secretaria).status_code == 401
@@ -0,0 +1,33 @@
+import pytest
+
+from src.utils.cache import CacheBackend, CacheRegion, MemoryCacheBackend
+
+
+def test_incomplete_backend_fails_when_instantiated():
+    class NoStatsBackend(CacheBackend):
+        def get(self, key):
+            return None
+
+        def set(self, key, value):
+            pass
+
+        def delete_many(self, keys):
+            pass
+
+        def clear(self):
+            pass
+
+    with pytest.raises(TypeError, match="stats"):
+        NoStatsBackend()
+
+
+def test_region_prefixes_keys():
+    backend = MemoryCacheBackend()
+    region = CacheRegion("school")
+    region.backend = backend
+
+    region.set("1", {"id": 1})
+
+    assert backend.get("school:1") == {"id": 1}
+    region.delete_many(["1"])
+    assert region.get("1") is None
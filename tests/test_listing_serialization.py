@@ -0,0 +1,13 @@
+from benchmarks import listing_serialization
+
+
+def test_listing_variants_render_the_same_payload(benchmark_database_url):
+    result = listing_serialization.run(
+        benchmark_database_url, schools=50, pages=2, per_page=20
+    )
+
+    assert result["same_payload"]
+    assert result["pages"] == 2
+    for name in ("entities", "projection"):
+        assert result[name]["cpu_us_per_row"] > 0
+        assert result[name]["peak_bytes_per_row"] > 0
@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import event
+
+from src.config.db_config import db
+from src.domain.enums.school_type import SchoolType
+from src.domain.school_filters import SchoolFilters
+from src.repositories.school_repository import SchoolRepository
+
+
+@pytest.fixture
+def more_schools(schools):
+    """Three more schools in Canoas: (Escola C, D, E)."""
+    return [
+        SchoolRepository.create_school(
+            f"Escola {name}", "Rua 3", "30", "Centro", "Canoas", "RS", "92000-000",
+            SchoolType.MUNICIPAL,
+        ).id
+        for name in "CDE"
+    ]
+
+
+def _batch(client, headers, action, body):
+    return client.post(f"/api/schools/batch/{action}", json=body, headers=headers)
+
+
+def _names(client, headers, deleted="false"):
+    response = client.get(f"/api/schools?deleted={deleted}", headers=headers)
+    return [school["name"] for school in response.get_json()["schools"]]
+
+
+@pytest.mark.parametrize(
+    "by_ids, by_filter, removed",
+    [
+        (True, False, ["Escola A", "Escola B"]),
+        (False, True, ["Escola B", "Escola C", "Escola D", "Escola E"]),
+        # Only the listed schools that match the filter
+        (True, True, ["Escola B"]),
+    ],
+)
+def test_batch_delete_and_restore(
+    client, secretaria, schools, more_schools, by_ids, by_filter, removed
+):
+    body = {}
+    if by_ids:
+        # Repeated and unknown IDs are ignored
+        body["ids"] = [*schools, schools[0], 999]
+    if by_filter:
+        body["filter"] = {"city": "Canoas"}
+    everyone = ["Escola A", "Escola B", "Escola C", "Escola D", "Escola E"]
+
+    response = _batch(client, secretaria, "delete", body)
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()["affected"] == len(removed)
+    assert _names(client, secretaria) == [name for name in everyone if name not in removed]
+    assert _names(client, secretaria, "true") == removed
+
+    # Already deleted schools are skipped
+    assert _batch(client, secretaria, "delete", body).get_json()["affected"] == 0
+
+    response = _batch(client, secretaria, "restore", body)
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()["affected"] == len(removed)
+    assert _names(client, secretaria) == everyone
+
+
+@pytest.mark.parametrize("body", [{}, {"filter": {}}, {"ids": None, "filter": None}])
+def test_batch_requires_ids_or_filter(client, secretaria, schools, body):
+    response = _batch(client, secretaria, "delete", body)
+
+    assert response.status_code == 400
+    assert _names(client, secretaria) == ["Escola A", "Escola B"]
+
+
+@pytest.mark.parametrize("action", ["delete", "restore"])
+def test_batch_is_secretaria_only(client, escola, schools, action):
+    response = _batch(client, escola, action, {"ids": list(schools)})
+
+    assert response.status_code == 403
+
+
+def test_batch_invalidates_caches(client, secretaria, schools):
+    url = f"/api/schools/{schools[0]}"
+    assert client.get(url, headers=secretaria).status_code == 200
+    total = client.get("/api/schools?count=cached", headers=secretaria).get_json()[
+        "pagination"
+    ]["total"]
+    assert total == 2
+
+    _batch(client, secretaria, "delete", {"ids": [schools[0]]})
+
+    assert client.get(url, headers=secretaria).status_code == 404
+    response = client.get("/api/schools?count=cached", headers=secretaria)
+    assert response.get_json()["pagination"]["total"] == 1
+
+
+def test_filter_mode_survives_concurrent_writes(app, schools, more_schools):
+    # Another writer deletes the second candidate between the selection of
+    # the first chunk and its UPDATE, so that UPDATE changes one row of two
+    raced = []
+
+    def delete_meanwhile(conn, cursor, statement, *args):
+        if not raced and statement.lstrip().startswith("SELECT schools.id"):
+            raced.append(more_schools[0])
+            conn.exec_driver_sql(
+                f"UPDATE schools SET deleted_at = CURRENT_TIMESTAMP "
+                f"WHERE id = {more_schools[0]}"
+            )
+
+    event.listen(db.engine, "after_cursor_execute", delete_meanwhile)
+    try:
+        affected = SchoolRepository.bulk_set_deleted(
+            True, SchoolFilters(city="Canoas"), chunk_size=2
+        )
+    finally:
+        event.remove(db.engine, "after_cursor_execute", delete_meanwhile)
+
+    assert raced
+    assert affected == 3
+    assert SchoolRepository._filtered_query(SchoolFilters(city="Canoas")).count() == 0
@@ -0,0 +1,151 @@
+import pytest
+
+
+def _classes_url(school_id, class_id=None):
+    url = f"/api/schools/{school_id}/classes"
+    return url if class_id is None else f"{url}/{class_id}"
+
+
+def _create(client, headers, school_id, class_grade, capacity):
+    response = client.post(
+        _classes_url(school_id),
+        json={"class_grade": class_grade, "capacity": capacity},
+        headers=headers,
+    )
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["school_class"]["id"]
+
+
+def _enroll(client, headers, school_id, class_id, student_name):
+    response = client.post(
+        _classes_url(school_id, class_id) + "/enrollments",
+        json={"student_name": student_name},
+        headers=headers,
+    )
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["id"]
+
+
+def _assert_consistent(client, headers, school_id):
+    """Check every counter against the enrollments it summarizes.
+
+    Returns:
+        {class_grade: (capacity, enrolled, free)} from the school summary.
+    """
+    seats = client.get(f"/api/schools/{school_id}/vagas", headers=headers).get_json()
+
+    expected = {}
+    for school_class in seats["classes"]:
+        enrollments = client.get(
+            _classes_url(school_id, school_class["id"]) + "/enrollments",
+            headers=headers,
+        ).get_json()["enrollments"]
+        assert school_class["enrolled"] == len(enrollments)
+
+        capacity, enrolled = expected.get(school_class["class_grade"], (0, 0))
+        expected[school_class["class_grade"]] = (
+            capacity + school_class["capacity"],
+            enrolled + school_class["enrolled"],
+        )
+
+    grades = {
+        grade["class_grade"]: (grade["capacity"], grade["enrolled"], grade["free"])
+        for grade in seats["grades"]
+        if grade["capacity"] or grade["enrolled"] or grade["held"]
+    }
+    assert grades == {
+        grade: (capacity, enrolled, capacity - enrolled)
+        for grade, (capacity, enrolled) in expected.items()
+    }
+
+    vagas = client.get("/api/vagas", headers=headers).get_json()["vagas"]
+    assert {
+        item["class_grade"]: item["free"] for item in vagas if item["school_id"] == school_id
+    } == {grade: free for grade, (_, _, free) in grades.items() if free > 0}
+
+    return grades
+
+
+def test_counters_follow_class_changes(client, secretaria, schools):
+    school_id = schools[0]
+    first = _create(client, secretaria, school_id, 1, 2)
+    second = _create(client, secretaria, school_id, 1, 3)
+    assert _assert_consistent(client, secretaria, school_id) == {"FISRT_YEAR": (5, 0, 5)}
+
+    enrollment = _enroll(client, secretaria, school_id, first, "Ana")
+    _enroll(client, secretaria, school_id, first, "Bia")
+    _enroll(client, secretaria, school_id, second, "Caio")
+    assert _assert_consistent(client, secretaria, school_id) == {"FISRT_YEAR": (5, 3, 2)}
+
+    response = client.delete(
+        _classes_url(school_id, first) + f"/enrollments/{enrollment}", headers=secretaria
+    )
+    assert response.status_code == 200, response.get_json()
+    assert _assert_consistent(client, secretaria, school_id) == {"FISRT_YEAR": (5, 2, 3)}
+
+    # Regrading moves the class's seats and students to the new grade
+    response = client.put(
+        _classes_url(school_id, second), json={"class_grade": 2}, headers=secretaria
+    )
+    assert response.status_code == 200, response.get_json()
+    assert _assert_consistent(client, secretaria, school_id) == {
+        "FISRT_YEAR": (2, 1, 1),
+        "SECOND_YEAR": (3, 1, 2),
+    }
+
+    response = client.put(
+        _classes_url(school_id, second), json={"capacity": 1}, headers=secretaria
+    )
+    assert response.status_code == 200, response.get_json()
+    assert _assert_consistent(client, secretaria, school_id) == {
+        "FISRT_YEAR": (2, 1, 1),
+        "SECOND_YEAR": (1, 1, 0),
+    }
+
+    # Shrinking below the enrolled students changes nothing
+    _enroll(client, secretaria, school_id, first, "Duda")
+    response = client.put(
+        _classes_url(school_id, first), json={"capacity": 1}, headers=secretaria
+    )
+    assert response.status_code == 409
+    response = client.delete(_classes_url(school_id, first), headers=secretaria)
+    assert response.status_code == 409
+    assert _assert_consistent(client, secretaria, school_id) == {
+        "FISRT_YEAR": (2, 2, 0),
+        "SECOND_YEAR": (1, 1, 0),
+    }
+
+    empty = _create(client, secretaria, school_id, 2, 4)
+    response = client.delete(_classes_url(school_id, empty), headers=secretaria)
+    assert response.status_code == 200, response.get_json()
+    assert _assert_consistent(client, secretaria, school_id) == {
+        "FISRT_YEAR": (2, 2, 0),
+        "SECOND_YEAR": (1, 1, 0),
+    }
+
+
+@pytest.mark.parametrize(
+    "method, suffix",
+    [
+        ("delete", ""),
+        ("get", "/enrollments"),
+        ("delete", "/enrollments/1"),
+        ("put", "/reservations/hold-0001"),
+        ("get", "/reservations/hold-0001"),
+        ("post", "/reservations/hold-0001/confirm"),
+        ("delete", "/reservations/hold-0001"),
+    ],
+)
+def test_class_routes_hide_deleted_school(client, secretaria, schools, method, suffix):
+    school_id = schools[0]
+    class_id = _create(client, secretaria, school_id, 1, 2)
+    response = client.delete(f"/api/schools/{school_id}", headers=secretaria)
+    assert response.status_code == 200, response.get_json()
+
+    response = getattr(client, method)(
+        _classes_url(school_id, class_id) + suffix,
+        json={"student_name": "Aluno"} if method == "put" else None,
+        headers=secretaria,
+    )
+    assert response.status_code == 404
+    assert response.get_json()["msg"] == "Escola não encontrada"
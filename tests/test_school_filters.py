@@ -0,0 +1,112 @@
+import random
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert, text
+
+from src.config.db_config import db
+from src.domain.enums.school_type import SchoolType
+from src.domain.school_filters import SchoolFilters
+from src.models.school import School
+from src.models.soft_delete import live_only
+from src.repositories.school_repository import SchoolRepository
+from src.utils.pagination import Explain
+
+
+def test_patch_address_refreshes_cached_totals(client, secretaria, schools):
+    listing = "/api/schools?state=PE&count=cached"
+
+    def patch_state(state):
+        response = client.patch(
+            f"/api/schools/{schools[0]}",
+            json={"address": {"state": state}},
+            headers=secretaria,
+        )
+        assert response.status_code == 200, response.get_json()
+
+    patch_state("PE")
+    data = client.get(listing, headers=secretaria).get_json()
+    assert data["pagination"]["total"] == 1
+
+    patch_state("SP")
+    data = client.get(listing, headers=secretaria).get_json()
+    assert data["pagination"]["total"] == 0
+    assert data["schools"] == []
+
+
+def test_offset_pages_are_disjoint(client, secretaria, schools):
+    for index in range(25):
+        SchoolRepository.create_school(
+            f"Escola {index % 3}", "Rua", "1", "Centro", "Canoas", "RS", "92000-000",
+            SchoolType.MUNICIPAL,
+        )
+
+    seen = []
+    for page in (1, 2, 3):
+        data = client.get(
+            f"/api/schools?page={page}&per_page=10", headers=secretaria
+        ).get_json()
+        seen += [(school["name"], school["id"]) for school in data["schools"]]
+
+    assert len(seen) == 27
+    assert seen == sorted(seen)
+
+
+def _plan_indexes(plan):
+    """Names of the indexes used anywhere in an EXPLAIN (FORMAT JSON) plan."""
+    found = set()
+    if "Index Name" in plan:
+        found.add(plan["Index Name"])
+    for child in plan.get("Plans", ()):
+        found |= _plan_indexes(child)
+    return found
+
+
+@pytest.fixture
+def seeded(app, dialect):
+    """20 000 schools spread over types, states, cities and ZIP codes."""
+    if dialect != "postgresql":
+        pytest.skip("query plans are checked on PostgreSQL (set TEST_DATABASE_URL)")
+
+    rng = random.Random(13)
+    types = list(SchoolType)
+    states = ["RS", "SC", "PR", "SP", "RJ", "MG", "BA", "PE"]
+    rows = [
+        {
+            "name": f"Escola {rng.randrange(10**6):06d}",
+            "address_street": "Rua",
+            "address_number": "1",
+            "address_neighborhood": "Centro",
+            "address_city": f"Cidade {rng.randrange(200)}",
+            "address_state": rng.choice(states),
+            "address_zip_code": f"{rng.randrange(10**8):08d}",
+            "school_type": rng.choice(types),
+            "deleted_at": datetime(2026, 1, 1) if rng.random() < 0.01 else None,
+        }
+        for _ in range(20_000)
+    ]
+    db.session.execute(insert(School), rows)
+    db.session.commit()
+    db.session.execute(text("ANALYZE schools"))
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        (SchoolFilters(), "ix_schools_live_name_id"),
+        (SchoolFilters(school_type=SchoolType.MUNICIPAL), "ix_schools_live_type_name_id"),
+        (SchoolFilters(state="RS", city="Cidade 7"), "ix_schools_live_state_city_name_id"),
+        (SchoolFilters(zip_prefix="9001"), "ix_schools_zip_code"),
+        (SchoolFilters(only_deleted=True), "ix_schools_deleted_at"),
+    ],
+)
+def test_listing_query_uses_filter_index(seeded, filters, index):
+    query = (
+        SchoolRepository._filtered_query(filters)
+        .order_by(School.name, School.id)
+        .limit(21)
+    )
+    # EXPLAIN wraps the statement, so the soft-delete hook does not see it
+    plan = db.session.execute(Explain(live_only(query.statement))).scalar()
+
+    assert index in _plan_indexes(plan[0]["Plan"])
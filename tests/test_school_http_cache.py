@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, update
+
+from src.config.db_config import db
+from src.models.school import School
+
+
+@pytest.fixture
+def statements(app):
+    """SQL statements run while the test body executes."""
+    seen = []
+
+    def record(conn, cursor, statement, *args):
+        seen.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(db.engine, "before_cursor_execute", record)
+
+
+def _counts(statements):
+    return [sql for sql in statements if "count(" in sql.lower()]
+
+
+def _school_reads(statements):
+    return [
+        sql
+        for sql in statements
+        if sql.lstrip().upper().startswith("SELECT") and "FROM schools" in sql
+    ]
+
+
+def test_listing_revalidates_with_etag(client, secretaria, schools):
+    response = client.get("/api/schools", headers=secretaria)
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/schools", headers={**secretaria, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    client.patch(f"/api/schools/{schools[0]}", json={"name": "Outra"}, headers=secretaria)
+    response = client.get("/api/schools", headers={**secretaria, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_listing_revalidates_with_last_modified(client, secretaria, schools):
+    # HTTP dates have one-second precision: keep the next write in a later second
+    db.session.execute(
+        update(School).values(updated_at=datetime.utcnow() - timedelta(minutes=1))
+    )
+    db.session.commit()
+
+    last_modified = client.get("/api/schools", headers=secretaria).headers["Last-Modified"]
+
+    response = client.get(
+        "/api/schools", headers={**secretaria, "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    # A school leaving the listing lowers the count
+    client.delete(f"/api/schools/{schools[0]}", headers=secretaria)
+    response = client.get(
+        "/api/schools", headers={**secretaria, "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 200
+    assert [school["name"] for school in response.get_json()["schools"]] == ["Escola B"]
+
+
+@pytest.mark.parametrize(
+    "query", ["", "pagination=cursor", "count=cached", "count=estimated"]
+)
+def test_not_modified_skips_the_page(client, secretaria, schools, statements, query):
+    url = f"/api/schools?{query}"
+    etag = client.get(url, headers={**secretaria, "If-None-Match": '"stale"'}).headers[
+        "ETag"
+    ]
+
+    statements.clear()
+    response = client.get(url, headers={**secretaria, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    # Only the (count, max(updated_at)) aggregate reads the schools
+    reads = _school_reads(statements)
+    assert len(reads) == 1
+    assert "max(" in reads[0].lower()
+
+
+@pytest.mark.parametrize(
+    "query, expected, validated",
+    [
+        # The aggregate's count is the exact total
+        ("", 1, True),
+        ("pagination=cursor", 0, False),
+        # The first request filled the count cache
+        ("count=cached", 0, False),
+    ],
+)
+def test_listing_runs_no_extra_count(
+    client, secretaria, schools, statements, query, expected, validated
+):
+    url = f"/api/schools?{query}"
+    client.get(url, headers=secretaria)
+
+    statements.clear()
+    response = client.get(url, headers=secretaria)
+
+    assert response.status_code == 200
+    assert len(_counts(statements)) == expected
+    assert ("ETag" in response.headers) is validated
+    assert response.get_json()["pagination"].get("total", 2) == 2
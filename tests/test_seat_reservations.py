@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from benchmarks import seat_contention
+from src.config.db_config import db
+from src.models.seat_reservation import SeatReservation
+from src.repositories.seat_reservation_repository import SeatReservationRepository
+
+
+@pytest.fixture
+def school_class(client, secretaria, schools):
+    """A first-year class with two seats in the first school."""
+    response = client.post(
+        f"/api/schools/{schools[0]}/classes",
+        json={"class_grade": 1, "capacity": 2},
+        headers=secretaria,
+    )
+    assert response.status_code == 201, response.get_json()
+    return schools[0], response.get_json()["school_class"]["id"]
+
+
+def _reservation_url(school_class, reservation_id):
+    school_id, class_id = school_class
+    return f"/api/schools/{school_id}/classes/{class_id}/reservations/{reservation_id}"
+
+
+def _hold(client, headers, school_class, reservation_id):
+    return client.put(
+        _reservation_url(school_class, reservation_id),
+        json={"student_name": "Aluno"},
+        headers=headers,
+    )
+
+
+def _seats(client, headers, school_id):
+    """(school grade summary, statewide free seats of the school)."""
+    grades = client.get(f"/api/schools/{school_id}/vagas", headers=headers).get_json()[
+        "grades"
+    ]
+    vagas = client.get("/api/vagas", headers=headers).get_json()["vagas"]
+    free = [item["free"] for item in vagas if item["school_id"] == school_id]
+    return (
+        {key: grades[0][key] for key in ("enrolled", "held", "free")},
+        free[0] if free else None,
+    )
+
+
+def test_summaries_count_held_seats(client, secretaria, school_class):
+    school_id = school_class[0]
+
+    assert _hold(client, secretaria, school_class, "hold-0001").status_code == 201
+    assert _seats(client, secretaria, school_id) == (
+        {"enrolled": 0, "held": 1, "free": 1},
+        1,
+    )
+
+    # Retrying the same hold takes no second seat
+    assert _hold(client, secretaria, school_class, "hold-0001").status_code == 200
+    assert _hold(client, secretaria, school_class, "hold-0002").status_code == 201
+    assert _seats(client, secretaria, school_id) == (
+        {"enrolled": 0, "held": 2, "free": 0},
+        None,
+    )
+    assert _hold(client, secretaria, school_class, "hold-0003").status_code == 409
+
+    response = client.post(
+        _reservation_url(school_class, "hold-0001") + "/confirm", headers=secretaria
+    )
+    assert response.status_code == 200, response.get_json()
+    assert _seats(client, secretaria, school_id) == (
+        {"enrolled": 1, "held": 1, "free": 0},
+        None,
+    )
+
+    response = client.delete(_reservation_url(school_class, "hold-0002"), headers=secretaria)
+    assert response.status_code == 200, response.get_json()
+    assert _seats(client, secretaria, school_id) == (
+        {"enrolled": 1, "held": 0, "free": 1},
+        1,
+    )
+
+
+def test_expired_holds_give_seats_back(client, secretaria, school_class):
+    school_id = school_class[0]
+    assert _hold(client, secretaria, school_class, "hold-0001").status_code == 201
+    assert _hold(client, secretaria, school_class, "hold-0002").status_code == 201
+
+    db.session.query(SeatReservation).update(
+        {SeatReservation.expires_at: datetime.utcnow() - timedelta(minutes=1)}
+    )
+    db.session.commit()
+
+    assert SeatReservationRepository.release_expired() == 2
+    assert _seats(client, secretaria, school_id) == (
+        {"enrolled": 0, "held": 0, "free": 2},
+        2,
+    )
+
+
+def test_concurrent_holds_do_not_oversell(benchmark_database_url):
+    result = seat_contention.run(
+        benchmark_database_url, workers=8, holds_per_worker=5, capacity=10
+    )
+
+    assert result["errors"] == 0
+    assert result["held"] == 10
+    assert result["full"] == 30
+    assert not result["oversold"]
+    assert result["consistent"]
@@ -0,0 +1,83 @@
+import pytest
+
+from src.config.db_config import db
+from src.domain.enums.class_grade import ClassGrade
+from src.models.school import School
+from src.models.school_class import SchoolClass
+from src.models.user import User
+from src.repositories.allocation_repository import AllocationRepository
+from src.repositories.school_class_repository import SchoolClassRepository
+from src.repositories.school_repository import SchoolRepository
+
+
+@pytest.fixture
+def deleted(client, secretaria, schools):
+    """Classes in both schools, then the first school soft-deleted."""
+    class_ids = [
+        SchoolClassRepository.create_class(school_id, ClassGrade.FISRT_YEAR, 10)
+        for school_id in schools
+    ]
+    response = client.delete(f"/api/schools/{schools[0]}", headers=secretaria)
+    assert response.status_code == 200, response.get_json()
+    db.session.expire_all()
+    return class_ids
+
+
+def _names(response):
+    return [school["name"] for school in response.get_json()["schools"]]
+
+
+def test_default_reads_hide_deleted_schools(client, secretaria, schools, deleted):
+    assert SchoolRepository.find_by_id(schools[0]) is None
+    assert db.session.query(School).count() == 1
+
+    response = client.get(f"/api/schools/{schools[0]}", headers=secretaria)
+    assert response.status_code == 404
+    assert _names(client.get("/api/schools", headers=secretaria)) == ["Escola B"]
+
+
+def test_include_deleted_sees_deleted_schools(client, secretaria, schools, deleted):
+    query = db.session.query(School).execution_options(include_deleted=True)
+    assert query.count() == 2
+    assert SchoolRepository.find_by_id(schools[0], include_deleted=True) is not None
+
+    response = client.get("/api/schools?deleted=true", headers=secretaria)
+    assert _names(response) == ["Escola A"]
+    assert response.get_json()["schools"][0]["deleted_at"]
+
+    response = client.get("/api/schools?deleted=all", headers=secretaria)
+    assert _names(response) == ["Escola A", "Escola B"]
+    response = client.get("/api/schools?include_deleted=true", headers=secretaria)
+    assert _names(response) == ["Escola A", "Escola B"]
+
+
+def test_joined_queries_drop_deleted_schools(client, secretaria, schools, deleted):
+    vagas = client.get("/api/vagas", headers=secretaria).get_json()["vagas"]
+    assert [item["school_id"] for item in vagas] == [schools[1]]
+
+    free_classes = AllocationRepository.load_free_classes(ClassGrade.FISRT_YEAR)
+    assert free_classes[:, 0].tolist() == [deleted[1]]
+
+    users = client.get("/api/users?include=school", headers=secretaria).get_json()
+    assert [user["school"] for user in users["users"]] == [None]
+
+
+def test_relationship_loads_reach_deleted_parent(secretaria, schools, deleted):
+    school_class = db.session.get(SchoolClass, deleted[0])
+    assert school_class.school.id == schools[0]
+    assert school_class.school.deleted_at is not None
+
+    user = db.session.query(User).filter(User.email == "secretaria@example.com").one()
+    assert user.school.id == schools[0]
+
+
+def test_restore_finds_deleted_schools(client, secretaria, schools, deleted):
+    response = client.post(f"/api/schools/{schools[0]}/restore", headers=secretaria)
+    assert response.status_code == 200, response.get_json()
+    assert _names(client.get("/api/schools", headers=secretaria)) == [
+        "Escola A",
+        "Escola B",
+    ]
+
+    response = client.post(f"/api/schools/{schools[0]}/restore", headers=secretaria)
+    assert response.status_code == 404
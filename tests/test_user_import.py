@@ -0,0 +1,53 @@
+import threading
+import time
+
+from src.utils.hash_pool import hash_pool
+
+
+def _import(client, headers, body):
+    response = client.post(
+        "/api/users/import",
+        data=body.encode("utf-8"),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def test_invalid_rows_are_reported_not_raised(client, secretaria, schools):
+    school_id = schools[0]
+    body = "\n".join(
+        [
+            "name,email,password,school_id",
+            f"Ana,ana@example.com,secret,{school_id}",
+            f"{'x' * 81},longname@example.com,secret,{school_id}",
+            f"Bia,{'b' * 70}@example.com,secret,{school_id}",
+            f"Caio,not-an-email,secret,{school_id}",
+            f"Duda,duda@example.com,{'p' * 73},{school_id}",
+            f"Eva,eva@example.com,{'é' * 37},{school_id}",
+            "Fabi,fabi@example.com,secret,999",
+            f"Gil,gil@example.com,secret,{school_id}",
+        ]
+    )
+
+    report = _import(client, secretaria, body)
+
+    assert report["created"] == 2
+    assert report["failed"] == 6
+    assert [error["line"] for error in report["errors"]] == [3, 4, 5, 6, 7, 8]
+
+
+def test_hash_pool_map_leaves_queue_free(app):
+    peak = 0
+    lock = threading.Lock()
+
+    def slow(item):
+        nonlocal peak
+        with lock:
+            metrics = hash_pool.metrics()
+            peak = max(peak, metrics["queue_depth"] + metrics["running"])
+        time.sleep(0.01)
+        return item * 2
+
+    assert hash_pool.map(slow, range(40)) == [item * 2 for item in range(40)]
+    assert peak <= hash_pool.workers